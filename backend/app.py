@@ -1,21 +1,43 @@
 # app.py
 
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, Response, g
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-import mysql.connector
 import os
 from werkzeug.utils import secure_filename
 from config import Config
-from data_processor.parser import parse_and_validate_data 
+from data_processor.parser import parse_and_validate_chunks, ParseError, COLUMN_MAPPING
 from data_processor.analyzer import calculate_dashboard_stats 
 import pandas as pd
 import math 
 import csv 
+import uuid
+import base64
+import json
+import time
+import tracemalloc
+from storage import create_store, StorageError, COUNT_MODES, GAME_SELECT_FIELDS, ANALYSIS_FIELDS
+from bulk_loader import records_to_frame
+from game_upsert import DEDUP_MODES
+from tag_cache import TagCache
+from query_cache import TTLCache
+from search_index import SEARCH_FIELDS
+from derived_columns import parse_year_range
+from dashboard_cache import DashboardCache
+from data_processor.model_registry import ModelRegistry, compare_with_baseline
+from data_processor.predictor import PREDICT_COLUMNS, normalize_input, predict_frame, format_predictions
+from data_processor.csv_reader import read_csv_adaptive
+from model_training import TrainingManager
+from training_sample import sample_frame
+from columnar_snapshot import ColumnarSnapshot, snapshot_supported
+from exporter import EXPORT_FORMATS, export_stream
+from metrics import registry as metrics_registry, stage, timed, start_profile, finish_profile
+from upload_jobs import (UploadJobManager, JobCancelled, STATUS_COMPLETED, STATUS_FAILED,
+                         STATUS_CANCELLED, FINAL_STATUSES)
 
 # --- Konfigurasi UPLOAD ---
 UPLOAD_FOLDER = 'uploads' 
 ALLOWED_EXTENSIONS = {'csv', 'xlsx'}
-BATCH_SIZE = 100 
 
 # --- Inisialisasi Aplikasi ---
 app = Flask(__name__)
@@ -23,214 +45,177 @@ app.config.from_object(Config)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 CORS(app) 
 
-# --- FUNGSI KONEKSI DATABASE ---
-def get_db_connection():
-    """
-    Mencoba membuat koneksi ke database MySQL.
-    """
-    try:
-        conn = mysql.connector.connect(
-            host=app.config['MYSQL_HOST'],
-            user=app.config['MYSQL_USER'],
-            password=app.config['MYSQL_PASSWORD'],
-            database=app.config['MYSQL_DB']
-        )
-        return conn
-    except mysql.connector.Error as err:
-        print(f"Error connecting to MySQL: {err}") 
-        return None
+class TimedJSONProvider(DefaultJSONProvider):
+    """Serialisasi JSON response dicatat sebagai tahap 'json_serialization' di /metrics."""
+
+    def dumps(self, obj, **kwargs):
+        with stage('json_serialization'):
+            return super().dumps(obj, **kwargs)
+
+app.json = TimedJSONProvider(app)
+
+# Puncak memori per tahap di /metrics (tracemalloc memperlambat alokasi, default nonaktif)
+if app.config['METRICS_TRACE_MEMORY'] and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+# Cache daftar tag untuk filter, diperbarui inkremental setiap ada perubahan data
+tag_cache = TagCache(ttl=app.config['TAG_CACHE_TTL'])
+
+# Cache total record per kombinasi filter (mode count=cached/approx di /api/games/data)
+count_cache = TTLCache(ttl=app.config['COUNT_CACHE_TTL'], max_entries=app.config['COUNT_CACHE_MAX_ENTRIES'])
+
+# Cache payload dashboard, dikunci dengan versi dataset (opsional disimpan di disk)
+dashboard_cache = DashboardCache(
+    cache_dir=app.config['DASHBOARD_CACHE_DIR'] if app.config['DASHBOARD_CACHE_PERSIST'] else None
+)
+
+# Snapshot kolumnar (Arrow, memory-mapped) tabel games untuk analisis pandas dan training
+analytics_snapshot = None
+if app.config['ANALYTICS_SNAPSHOT']:
+    if snapshot_supported():
+        analytics_snapshot = ColumnarSnapshot(app.config['ANALYTICS_SNAPSHOT_DIR'])
+    else:
+        print("pyarrow tidak terpasang; snapshot kolumnar dinonaktifkan, analisis membaca dari database.")
+
+# Registry model klasifikasi di disk dan training RandomForest di background
+model_registry = ModelRegistry(app.config['MODEL_DIR'], keep=app.config['MODEL_KEEP'])
+training_manager = TrainingManager(
+    model_registry,
+    load_training_data=lambda full_data: load_training_data(full_data),
+    min_change_ratio=app.config['MODEL_RETRAIN_MIN_CHANGE_RATIO'],
+    train_options={
+        "n_jobs": app.config['CLASSIFIER_N_JOBS'],
+        "cv_folds": app.config['CLASSIFIER_CV_FOLDS'],
+    }
+)
+
+# Job upload dataset berjalan di background thread pool
+upload_jobs = UploadJobManager(
+    max_workers=app.config['UPLOAD_JOB_WORKERS'],
+    max_history=app.config['UPLOAD_JOB_HISTORY']
+)
+
+# --- PENYIMPANAN DATA ---
+# Backend penyimpanan tabel games sesuai Config.STORAGE_BACKEND (mysql, sqlite, atau duckdb);
+# seluruh SQL berada di implementasi GameStore (mysql_store.py / embedded_store.py)
+store = create_store(app.config, count_cache=count_cache)
 
 # --- Fungsi Utility Umum ---
 
+def notify_games_changed(tag_deltas=None, cleared=False):
+    """
+    Dipanggil setelah commit setiap operasi tulis pada tabel games (upload, add, edit,
+    delete, clear) untuk memperbarui/menginvalidasi cache baca. Versi dataset sendiri
+    dinaikkan di dalam transaksi lewat bump_dataset_version.
+    """
+    if cleared:
+        tag_cache.reset(empty=True)
+    elif tag_deltas:
+        tag_cache.apply_deltas(tag_deltas)
+    count_cache.clear()
+    dashboard_cache.invalidate()
+
 def allowed_file(filename):
     """Validasi format file"""
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def clean_nan_to_none(value):
-    """Mengubah nilai NaN dari Pandas menjadi None yang diterima MySQL (NULL) untuk menghindari Error 1054."""
-    if isinstance(value, float) and math.isnan(value):
-        return None
-    return value
-
+@timed('save_data_to_db', rows=lambda result: result[0])
 def save_data_to_db(data):
     """
-    Menyimpan list of game records ke database MySQL menggunakan Batch Insert.
+    Menyimpan list of game records ke database menggunakan bulk insert
+    (untuk MySQL: multi-row INSERT atau LOAD DATA sesuai Config.BULK_LOAD_METHOD).
     Ini adalah implementasi fitur #1 (Upload Dataset) sisi backend.
     """
-    conn = get_db_connection()
-    if not conn:
-        return 0, "Gagal terhubung ke database."
-
-    query = """
-    INSERT INTO games (name, price, release_date, review_no, review_type, tags, description)
-    VALUES (%s, %s, %s, %s, %s, %s, %s)
-    """
-    
-    total_inserted_count = 0
     try:
-        cursor = conn.cursor()
-        
-        # 1. Konversi data menjadi list of tuples DENGAN CLEANING (NaN -> None)
-        values = [(
-            clean_nan_to_none(d.get('name')), 
-            clean_nan_to_none(d.get('price')), 
-            clean_nan_to_none(d.get('release_date')), 
-            clean_nan_to_none(d.get('review_no')), 
-            clean_nan_to_none(d.get('review_type')), 
-            clean_nan_to_none(d.get('tags')), 
-            clean_nan_to_none(d.get('description'))
-        ) for d in data]
-
-        # 2. Implementasi Batch Insert (untuk menghindari batasan max_allowed_packet)
-        num_batches = math.ceil(len(values) / BATCH_SIZE)
-        
-        for i in range(num_batches):
-            start_index = i * BATCH_SIZE
-            end_index = (i + 1) * BATCH_SIZE
-            batch_values = values[start_index:end_index]
-            
-            cursor.executemany(query, batch_values)
-            total_inserted_count += len(batch_values)
-            
-        conn.commit() # Commit semua batch
-        
-    except mysql.connector.Error as err:
-        conn.rollback()
+        total_inserted_count, _, tag_deltas = store.save_chunks([records_to_frame(data)])
+    except StorageError as err:
         return 0, f"Gagal menyimpan data ke database: {err}"
-    finally:
-        if 'cursor' in locals():
-            cursor.close()
-        conn.close()
-        
+    notify_games_changed(tag_deltas)
     return total_inserted_count, "Data berhasil disimpan."
 
-
-def fetch_all_game_data(limit=None, offset=None, search=None, genre=None, review_type=None):
-    """Mengambil data game dengan filter dan pagination."""
-    conn = get_db_connection()
-    if not conn:
-        return None, "Gagal terhubung ke database."
-    
-    # Kueri dasar untuk mengambil semua kolom yang diperlukan untuk analisis/tabel
-    select_fields = "id, name, price, release_date, review_no, review_type, tags, description"
-    base_query = f"FROM games WHERE 1=1"
-    params = []
-    
-    # Fitur Pencarian Game (Fitur #7)
-    if search:
-        base_query += " AND name LIKE %s"
-        params.append(f"%{search}%")
-
-    # Fitur Filter Genre (Fitur #8) - PERBAIKAN LOGIKA WHOLE WORD MATCHING
-    if genre:
-        genres = [g.strip() for g in genre.split(',') if g.strip()]
-        for g in genres:
-            # Memastikan tag yang dicari sesuai dengan batas kata (delimitasi koma/spasi)
-            # Kondisi: Tags = 'tes' OR Tags LIKE 'tes,%' OR Tags LIKE '%, tes' OR Tags LIKE '%, tes,%'
-            base_query += " AND (tags = %s OR tags LIKE %s OR tags LIKE %s OR tags LIKE %s)"
-            
-            # 1. Match Exact (e.g., 'tes')
-            params.append(g)             
-            # 2. Match di awal string (e.g., 'tes,%')
-            params.append(f"{g},%")     
-            # 3. Match di akhir string (e.g., '%, tes') 
-            params.append(f"%, {g}")  
-            # 4. Match di tengah string (e.g., '%, tes,%')
-            params.append(f"%, {g},%")  
-            
-    # Fitur Filter Review Type (Fitur #8)
-    if review_type:
-        reviews = [r.strip() for r in review_type.split(',') if r.strip()]
-        if reviews:
-            placeholders = ', '.join(['%s'] * len(reviews))
-            base_query += f" AND review_type IN ({placeholders})"
-            params.extend(reviews)
-            
-    # Menghitung total data
-    count_query = "SELECT COUNT(id) AS total " + base_query
-    
+@timed('save_chunks_to_db', rows=lambda result: result[0])
+def save_chunks_to_db(chunks, on_chunk_saved=None, dedup='append'):
+    """
+    Mode streaming dari save_data_to_db: setiap DataFrame bersih dari parser langsung
+    di-insert lalu dilepas, sehingga memori puncak dibatasi ukuran chunk.
+    Semua chunk disimpan dalam satu transaksi (commit di akhir, rollback jika ada yang gagal).
+    ParseError dan JobCancelled dari iterator chunk maupun dari callback
+    `on_chunk_saved(jumlah_baris)` diteruskan ke pemanggil setelah rollback.
+    Dengan dedup='upsert' chunk digabung ke games berdasarkan kunci natural (lihat
+    game_upsert.py). Mengembalikan (jumlah baris, pesan, ringkasan upload).
+    """
     try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(count_query, params)
-        total_records = cursor.fetchone()['total']
-        
-        data_query = f"SELECT {select_fields} " + base_query
-        
-        if limit is not None and offset is not None:
-            # Fitur Pagination (Fitur #6)
-            data_query += " ORDER BY id DESC LIMIT %s OFFSET %s"
-            params.extend([limit, offset])
-        else:
-            # Jika tidak ada limit/offset (misalnya untuk Export), ambil semua
-            data_query += " ORDER BY id DESC"
-        
-        cursor.execute(data_query, params)
-        data = cursor.fetchall()
-        
-        df = pd.DataFrame(data)
-        
+        total_inserted_count, summary, tag_deltas = store.save_chunks(
+            chunks, on_chunk_saved=on_chunk_saved, dedup=dedup
+        )
+    except StorageError as err:
+        return 0, f"Gagal menyimpan data ke database: {err}", None
+    notify_games_changed(tag_deltas)
+    return total_inserted_count, "Data berhasil disimpan.", summary
+
+@timed('fetch_all_game_data', rows=lambda result: len(result[0]) if result[0] is not None else 0)
+def fetch_all_game_data(limit=None, offset=None, search=None, genre=None, review_type=None,
+                        after_id=None, before_id=None, count_mode='exact',
+                        search_fields='name', sort='id', fields=None, typed=False,
+                        release_year=None, min_score=None):
+    """
+    Mengambil data game dengan filter dan pagination (urutan id DESC).
+    Pagination offset memakai limit/offset; pagination keyset memakai after_id (halaman
+    berikutnya: id < after_id) atau before_id (halaman sebelumnya: id > before_id).
+    sort='relevance' mengurutkan hasil pencarian full-text berdasarkan skor (mode offset saja).
+    `fields` membatasi kolom yang diambil (default: semua kolom tampilan).
+    release_year ((awal, akhir) dari parse_year_range) dan min_score memfilter kolom turunan
+    release_year/review_score yang tersimpan dan ber-index.
+    typed=True membangun DataFrame bertipe ringkas dari tuple (float32/Int32, categorical,
+    datetime) untuk analisis; tampilan tabel tetap memakai nilai asli dari database.
+    Mengembalikan (df, total_records, error); total_records None jika count_mode='none'.
+    """
+    try:
+        df, total_records = store.fetch_games(
+            limit=limit, offset=offset, search=search, genre=genre, review_type=review_type,
+            after_id=after_id, before_id=before_id, count_mode=count_mode,
+            search_fields=search_fields, sort=sort, fields=fields, typed=typed,
+            release_year=release_year, min_score=min_score
+        )
         return df, total_records, None
-    except Exception as e:
+    except StorageError as e:
         return None, 0, f"Gagal mengambil data dari database: {e}"
-    finally:
-        conn.close()
+
+def encode_page_cursor(game_id):
+    """Token cursor opaque (base64 JSON) untuk pagination keyset."""
+    payload = json.dumps({"id": int(game_id)}, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+def decode_page_cursor(token):
+    """Mengembalikan id dari token cursor, atau ValueError jika token tidak valid."""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(padded.encode()))["id"])
+    except Exception:
+        raise ValueError("Token cursor tidak valid.")
 
 def clear_games_table():
     """
-    Menghapus semua data dari tabel 'games' (TRUNCATE).
+    Menghapus semua data dari tabel 'games'.
     """
-    conn = get_db_connection()
-    if not conn:
-        return "Gagal terhubung ke database.", False
-
-    query = "TRUNCATE TABLE games"
-    
     try:
-        cursor = conn.cursor()
-        cursor.execute(query)
-        conn.commit()
-        return "Tabel games berhasil dikosongkan.", True
-    except mysql.connector.Error as err:
-        conn.rollback()
+        store.clear_games()
+    except StorageError as err:
         return f"Gagal mengosongkan tabel games: {err}", False
-    finally:
-        if 'cursor' in locals():
-            cursor.close()
-        conn.close()
+    notify_games_changed(cleared=True)
+    return "Tabel games berhasil dikosongkan.", True
 
 
 def fetch_all_unique_tags():
-    """Mengambil semua tags unik dari database untuk filter."""
-    conn = get_db_connection()
-    if not conn:
-        return None, "Gagal terhubung ke database."
-
-    # Mengambil semua tags (string yang dipisahkan koma)
-    query = "SELECT tags FROM games WHERE tags IS NOT NULL AND tags != ''"
-    
+    """Mengambil semua tags unik (beserta jumlah game per tag) dari cache untuk filter."""
     try:
-        cursor = conn.cursor()
-        cursor.execute(query)
-        raw_tags = cursor.fetchall()
-        
-        all_tags = set()
-        # Memproses string tags yang dipisahkan koma
-        for row in raw_tags:
-            # row[0] adalah string tags (e.g., "Action, RPG, Indie")
-            tags_list = row[0].split(',')
-            for tag in tags_list:
-                cleaned_tag = tag.strip()
-                if cleaned_tag:
-                    all_tags.add(cleaned_tag)
-        
-        # Mengurutkan dan mengonversi ke list
-        return sorted(list(all_tags)), None
-
+        tag_counts = tag_cache.get_counts(store.tag_counts)
     except Exception as e:
-        return None, f"Gagal mengambil tags unik: {e}"
-    finally:
-        conn.close()
+        return None, None, f"Gagal mengambil tags unik: {e}"
+
+    # Mengurutkan dan mengonversi ke list
+    return sorted(tag_counts), tag_counts, None
 
 # --- Rute Sederhana ---
 @app.route('/', methods=['GET'])
@@ -240,17 +225,115 @@ def home():
 # Rute untuk menguji koneksi DB
 @app.route('/test-db', methods=['GET'])
 def test_db():
-    conn = get_db_connection()
-    if conn:
-        conn.close()
-        return jsonify({"message": "Koneksi database berhasil!"}), 200
+    if store.ping():
+        return jsonify({"message": "Koneksi database berhasil!", "backend": store.backend}), 200
     else:
-        return jsonify({"message": "Koneksi database gagal! Cek konsol Flask untuk detail error MySQL."}), 500
+        return jsonify({"message": "Koneksi database gagal! Cek konsol Flask untuk detail error database."}), 500
+
+# Rute untuk memantau connection pool (untuk sizing pool) dan backend penyimpanan
+@app.route('/api/db-pool-stats', methods=['GET'])
+def db_pool_stats():
+    return jsonify({"backend": store.backend, **(store.stats() or {})}), 200
+
+@app.route('/api/snapshot-stats', methods=['GET'])
+def snapshot_stats():
+    if analytics_snapshot is None:
+        return jsonify({"snapshot": None, "message": "Snapshot kolumnar tidak aktif."}), 200
+    return jsonify({"snapshot": analytics_snapshot.stats()}), 200
+
+# --- Instrumentasi Request dan Endpoint Metrics ---
+PROFILE_VALUES = ('1', 'true', 'yes', 'memory')
+
+@app.before_request
+def start_request_metrics():
+    """
+    Mencatat waktu mulai request. ?profile=1 (atau header X-Profile) mengaktifkan profil tahap
+    untuk request ini; ?profile=memory juga mengukur puncak memori per tahap.
+    """
+    g.request_started = time.perf_counter()
+    mode = (request.args.get('profile') or request.headers.get('X-Profile') or '').lower()
+    if app.config['METRICS_PROFILE_ENABLED'] and mode in PROFILE_VALUES:
+        start_profile(trace_memory=mode == 'memory')
+
+@app.after_request
+def record_request_metrics(response):
+    """
+    Histogram durasi per endpoint. Untuk request profil, rincian tahap ditambahkan sebagai
+    header Server-Timing dan field "_profile" pada body JSON berbentuk objek.
+    """
+    elapsed = time.perf_counter() - g.get('request_started', time.perf_counter())
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    metrics_registry.observe_request(request.method, endpoint, response.status_code, elapsed)
+
+    profile = finish_profile()
+    if profile is None:
+        return response
+    response.headers['Server-Timing'] = ', '.join(
+        f"{entry['stage']};dur={entry['seconds'] * 1000:.1f}" for entry in profile["stages"] if entry["depth"] == 0
+    )
+    if response.is_json and not response.is_streamed:
+        body = response.get_json(silent=True)
+        if isinstance(body, dict):
+            body["_profile"] = profile
+            # Tanpa TimedJSONProvider agar serialisasi ulang ini tidak ikut tercatat di /metrics
+            response.set_data(DefaultJSONProvider.dumps(app.json, body))
+    return response
+
+@app.teardown_request
+def discard_request_profile(exc):
+    # Profil request yang gagal sebelum after_request tidak boleh terbawa ke request berikutnya
+    finish_profile()
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Metrik format teks Prometheus: durasi/baris/memori per tahap, durasi request, dan pool DB."""
+    gauges = {}
+    pool = (store.stats() or {}).get("pool")
+    if pool is not None:
+        gauges["db_pool_connections"] = ("Koneksi connection pool MySQL per status.", {
+            (("state", "open"),): pool["open_connections"],
+            (("state", "idle"),): pool["idle"],
+            (("state", "checked_out"),): pool["checked_out"],
+        })
+        gauges["db_pool_checkouts"] = ("Jumlah kumulatif peminjaman koneksi.", {(): pool["checkouts"]})
+        gauges["db_pool_wait_seconds_max"] = ("Waktu tunggu terlama peminjaman koneksi.", {(): pool["wait_time_max"]})
+    return Response(metrics_registry.render(gauges), content_type='text/plain; version=0.0.4; charset=utf-8')
 
 # --- Rute Upload Dataset (Fitur #1 & #2) ---
+def process_upload_job(job, chunks, dedup='append'):
+    """
+    Dijalankan di background oleh UploadJobManager: menyimpan setiap chunk bersih ke Database
+    sambil melaporkan progres ke job. Mengembalikan (status, message, result).
+    """
+    try:
+        inserted_count, db_message, summary = save_chunks_to_db(
+            job.iter_chunks(chunks), on_chunk_saved=job.add_inserted, dedup=dedup
+        )
+    except ParseError as e:
+        return STATUS_FAILED, f"Parsing Gagal: {e}", None
+
+    if inserted_count > 0:
+        if dedup == 'upsert':
+            message = (f"Dataset berhasil diunggah: {summary['inserted']} record baru, "
+                       f"{summary['updated']} diperbarui, {summary['unchanged']} tidak berubah.")
+        else:
+            message = f"Dataset berhasil diunggah dan {inserted_count} record disimpan."
+        return STATUS_COMPLETED, message, {
+            "total_records": inserted_count,
+            "rows_dropped": job.parse_stats.get("rows_dropped", 0),
+            "dedup": dedup,
+            "summary": summary
+        }
+    return STATUS_FAILED, f"Penyimpanan ke DB Gagal. {db_message}", None
+
 @app.route('/upload-dataset', methods=['POST'])
 def upload_dataset():
-    """Endpoint untuk mengunggah dan memproses dataset."""
+    """
+    Endpoint untuk mengunggah dataset. Validasi header dilakukan langsung, sedangkan parsing
+    dan penyimpanan berjalan sebagai job background (202 + job_id untuk polling).
+    Gunakan ?mode=sync untuk menunggu job selesai dalam request yang sama, dan
+    ?dedup=upsert|append untuk mengganti Config.UPLOAD_DEDUP_MODE.
+    """
     
     if 'file' not in request.files:
         return jsonify({"message": "Tidak ada file yang diunggah."}), 400
@@ -259,9 +342,14 @@ def upload_dataset():
     if file.filename == '':
         return jsonify({"message": "Nama file kosong."}), 400
 
+    dedup = request.args.get('dedup', app.config['UPLOAD_DEDUP_MODE'])
+    if dedup not in DEDUP_MODES:
+        return jsonify({"message": f"Mode dedup tidak valid. Gunakan: {', '.join(DEDUP_MODES)}."}), 400
+
     if file and allowed_file(file.filename):
         filename = secure_filename(file.filename)
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+        # Prefix unik agar upload paralel dengan nama file sama tidak saling menimpa
+        file_path = os.path.join(app.config['UPLOAD_FOLDER'], f"{uuid.uuid4().hex}_{filename}")
         
         # Simpan file sementara
         try:
@@ -271,30 +359,72 @@ def upload_dataset():
         except Exception as e:
             return jsonify({"message": f"Gagal menyimpan file di server: {e}"}), 500
 
-        # Parsing dan Validasi Data (memanggil parser.py)
+        # Validasi header dan siapkan parsing streaming (memanggil parser.py)
         file_extension = os.path.splitext(filename)[1].lower()
-        data_to_insert, message = parse_and_validate_data(file_path, file_extension)
-        
-        # Hapus file sementara setelah diproses
-        os.remove(file_path) 
+        parse_stats = {}
+        chunks, message = parse_and_validate_chunks(
+            file_path, file_extension,
+            chunksize=app.config['UPLOAD_CHUNK_SIZE'],
+            stats=parse_stats,
+            engine=app.config['CSV_PARSER_ENGINE']
+        )
 
-        if data_to_insert is None:
+        if chunks is None:
+            os.remove(file_path)
             return jsonify({"message": f"Parsing Gagal: {message}"}), 422
 
-        # Simpan data yang sudah bersih ke Database
-        inserted_count, db_message = save_data_to_db(data_to_insert)
+        job = upload_jobs.submit(
+            filename,
+            lambda job: process_upload_job(job, chunks, dedup=dedup),
+            parse_stats=parse_stats,
+            # Hapus file sementara setelah diproses
+            cleanup=lambda: os.remove(file_path)
+        )
 
-        if inserted_count > 0:
-            return jsonify({
-                "message": f"Dataset berhasil diunggah dan {inserted_count} record disimpan.",
-                "total_records": inserted_count
-            }), 200
-        else:
-            return jsonify({"message": f"Penyimpanan ke DB Gagal. {db_message}"}), 500
+        if request.args.get('mode') == 'sync':
+            job.wait()
+            status = job.to_dict()
+            if status["status"] == STATUS_COMPLETED:
+                return jsonify({"message": status["message"], "job_id": job.id, **status["result"]}), 200
+            if status["status"] == STATUS_CANCELLED:
+                return jsonify(status), 409
+            code = 422 if status["message"].startswith("Parsing Gagal") else 500
+            return jsonify({"message": status["message"], "job_id": job.id}), code
+
+        return jsonify({
+            "message": "Dataset diterima dan sedang diproses di background.",
+            "job_id": job.id,
+            "status_url": f"/api/upload-jobs/{job.id}"
+        }), 202
 
     else:
         return jsonify({"message": "Format file tidak valid. Gunakan CSV atau XLSX."}), 400
 
+# --- Rute Status Job Upload ---
+@app.route('/api/upload-jobs', methods=['GET'])
+def list_upload_jobs():
+    """Endpoint untuk melihat job upload terbaru."""
+    return jsonify({"jobs": upload_jobs.list()}), 200
+
+@app.route('/api/upload-jobs/<job_id>', methods=['GET'])
+def get_upload_job(job_id):
+    """Endpoint polling progres job upload (rows parsed/inserted/dropped dan throughput)."""
+    job = upload_jobs.get(job_id)
+    if job is None:
+        return jsonify({"message": "Job upload tidak ditemukan."}), 404
+    return jsonify(job.to_dict()), 200
+
+@app.route('/api/upload-jobs/<job_id>/cancel', methods=['POST'])
+def cancel_upload_job(job_id):
+    """Endpoint untuk membatalkan job upload; data yang sudah di-insert di-rollback."""
+    job = upload_jobs.get(job_id)
+    if job is None:
+        return jsonify({"message": "Job upload tidak ditemukan."}), 404
+    if job.status in FINAL_STATUSES:
+        return jsonify({"message": f"Job sudah selesai dengan status '{job.status}'.", **job.to_dict()}), 409
+    job.cancel()
+    return jsonify({"message": "Pembatalan job upload diminta.", **job.to_dict()}), 202
+
 # --- Rute Clear Database ---
 @app.route('/api/clear-database', methods=['POST'])
 def clear_database():
@@ -309,42 +439,158 @@ def clear_database():
 @app.route('/api/tags-for-filter', methods=['GET'])
 def get_tags_for_filter():
     """Endpoint untuk mengambil semua tags unik untuk keperluan filter."""
-    tags, error = fetch_all_unique_tags()
+    tags, tag_counts, error = fetch_all_unique_tags()
     
     if error:
         return jsonify({"message": error}), 500
         
-    return jsonify({"tags": tags}), 200
+    return jsonify({"tags": tags, "tag_counts": tag_counts}), 200
 
 # --- Rute Dashboard Statistik (Fitur #5) ---
+def fetch_current_dataset_version():
+    """Membaca versi dataset terkini (dict token/version/rows_changed), atau (None, error)."""
+    try:
+        return store.dataset_version(), None
+    except StorageError as err:
+        return None, f"Gagal membaca versi dataset: {err}"
+
+def fetch_analysis_rows(after_id=0):
+    """Kolom analisis (DataFrame bertipe) untuk game dengan id > after_id; melempar error jika gagal."""
+    return store.analysis_rows(after_id)
+
+@timed('load_analysis_frame', rows=lambda result: len(result[0]) if result[0] is not None else 0)
+def load_analysis_frame():
+    """
+    DataFrame kolom analisis seluruh tabel games: dari snapshot kolumnar untuk versi dataset
+    saat ini jika aktif, selain itu langsung dari database. Mengembalikan (df, error).
+    """
+    if analytics_snapshot is not None:
+        version, error = fetch_current_dataset_version()
+        if error:
+            return None, error
+        try:
+            return analytics_snapshot.load_frame(version, fetch_analysis_rows), None
+        except Exception as e:
+            print(f"Snapshot kolumnar gagal, membaca dari database: {e}")
+
+    df, _, error = fetch_all_game_data(
+        limit=None, offset=None, count_mode='none', fields=ANALYSIS_FIELDS, typed=True
+    )
+    return df, error
+
+def fetch_dashboard_stats_sql():
+    """Statistik dashboard dari agregat SQL di backend penyimpanan; (stats, error)."""
+    try:
+        return store.dashboard_stats(), None
+    except StorageError as e:
+        return None, f"Gagal menghitung statistik dashboard: {e}"
+
+def compute_dashboard_payload():
+    """
+    Menghitung statistik deskriptif, korelasi, dan analisis genre.
+    Mode 'sql' (default) memakai agregat SQL tanpa memuat tabel games; mode 'pandas'
+    memuat kolom analisis saja ke DataFrame. Mengembalikan body JSON (dict) yang siap
+    di-cache per versi dataset.
+    """
+    if app.config['DASHBOARD_AGGREGATION'] == 'pandas':
+        df, error = load_analysis_frame()
+        if error:
+            raise RuntimeError(error)
+        if df.empty:
+            return {"message": "Database kosong, unggah dataset terlebih dahulu."}
+        # Klasifikasi tidak dilatih di sini; hasilnya dibaca dari model registry saat response dibentuk
+        stats = calculate_dashboard_stats(df, include_classification=False)
+    else:
+        stats, error = fetch_dashboard_stats_sql()
+        if error:
+            raise RuntimeError(error)
+        if stats['descriptive_stats']['total_games'] == 0:
+            return {"message": "Database kosong, unggah dataset terlebih dahulu."}
+    
+    # PERBAIKAN KRITIS: Mengakses key yang benar dari hasil calculate_dashboard_stats 
+    # (Memperbaiki KeyError: 'genre_distribution')
+    response = {
+        "stats": stats['descriptive_stats'],
+        "correlation": stats['correlation_results'],
+        "genre_data": stats['genre_data'], # Menggunakan seluruh dictionary genre_data
+    }
+    return response
+
+def load_training_data(full_data=False):
+    """
+    Sumber data untuk TrainingManager: (DataFrame, error, info sampling).
+    Jika jumlah baris analisis melebihi CLASSIFIER_MAX_TRAINING_ROWS, data diambil sebagai
+    sampel terstratifikasi per review_type sehingga memori training tetap terbatas.
+    """
+    budget = app.config['CLASSIFIER_MAX_TRAINING_ROWS']
+    # Dengan snapshot kolumnar, seluruh kolom analisis sudah ada di memori dan sampling
+    # dilakukan di sana; tanpa snapshot, backend yang mendukungnya (MySQL) men-sample di server
+    if budget and not full_data and analytics_snapshot is None:
+        try:
+            sampled = store.training_sample(budget)
+        except StorageError as e:
+            return None, f"Gagal mengambil sampel data training: {e}", None
+        if sampled is not None:
+            df, sampling = sampled
+            return df, None, sampling
+
+    df, error = load_analysis_frame()
+    if error or not budget or full_data:
+        return df, error, None
+    df, sampling = sample_frame(df, budget)
+    return df, None, sampling
+
+def attach_model_results(body, version):
+    """
+    Menambahkan hasil klasifikasi dari model terbaru di registry ke payload dashboard
+    dan menjadwalkan training ulang di background jika data sudah berubah cukup banyak.
+    """
+    training_manager.maybe_schedule(version)
+    metadata = model_registry.latest_metadata()
+    training = training_manager.status()
+
+    body = dict(body)
+    if metadata is None:
+        body["classification"] = None
+        body["ml_error"] = training["last_error"] or (
+            "Model klasifikasi sedang dilatih di background. Muat ulang dashboard beberapa saat lagi."
+        )
+        body["model"] = {"training": training["training"]}
+        return body
+
+    body["classification"] = metadata["classification"]
+    body["ml_error"] = None
+    body["model"] = {
+        "model_id": metadata["model_id"],
+        "trained_at": metadata["trained_at"],
+        "training_seconds": metadata["training_seconds"],
+        "n_rows": metadata["n_rows"],
+        "dataset_version": metadata["dataset_version"],
+        "is_current": metadata["dataset_version"] == version["token"],
+        "sampled": metadata.get("sampling") is not None,
+        # Dibandingkan ulang saat dibaca agar baseline full-data yang dilatih belakangan ikut terpakai
+        "comparison": compare_with_baseline(metadata, model_registry.full_data_baseline()),
+        "training": training["training"],
+        "training_error": training["last_error"],
+    }
+    return body
+
 @app.route('/api/dashboard-stats', methods=['GET'])
 def get_dashboard_stats():
     """
-    Mengambil data dari DB, melakukan analisis korelasi dan statistik, dan mengembalikan hasilnya.
+    Mengembalikan hasil analisis dashboard dari cache per versi dataset.
+    Perhitungan ulang hanya terjadi jika dataset berubah; request bersamaan menunggu
+    satu perhitungan yang sama.
     """
-    # Mengambil semua data untuk analisis (limit=None, offset=None)
-    df, total_records, error = fetch_all_game_data(limit=None, offset=None)
-    
+    version, error = fetch_current_dataset_version()
     if error:
         return jsonify({"message": error}), 500
-        
-    if df.empty:
-        return jsonify({"message": "Database kosong, unggah dataset terlebih dahulu."}), 200
 
     try:
-        stats = calculate_dashboard_stats(df)
-        
-        # PERBAIKAN KRITIS: Mengakses key yang benar dari hasil calculate_dashboard_stats 
-        # (Memperbaiki KeyError: 'genre_distribution')
-        response = {
-            "stats": stats['descriptive_stats'],
-            "correlation": stats['correlation_results'],
-            "genre_data": stats['genre_data'], # Menggunakan seluruh dictionary genre_data
-            "classification": stats['classification'], 
-            "ml_error": stats['ml_error'] 
-        }
-        
-        return jsonify(response), 200
+        body = dashboard_cache.get_or_compute(version["token"], compute_dashboard_payload)
+        if "stats" in body:
+            body = attach_model_results(body, version)
+        return jsonify(body), 200
         
     except Exception as e:
         # Menangani KeyErrors atau error lain yang terjadi saat pemrosesan akhir
@@ -352,11 +598,106 @@ def get_dashboard_stats():
         return jsonify({"message": f"Gagal melakukan analisis data: {e}"}), 500
 
 
+# --- Rute Model Klasifikasi ---
+@app.route('/api/model', methods=['GET'])
+def get_model_status():
+    """Endpoint untuk melihat metadata model terbaru dan status training background."""
+    metadata = model_registry.latest_metadata()
+    return jsonify({
+        "model": metadata,
+        "full_data_baseline": model_registry.full_data_baseline(),
+        "training": training_manager.status()
+    }), 200
+
+@app.route('/api/model/train', methods=['POST'])
+def train_model():
+    """
+    Endpoint untuk memaksa training ulang model di background.
+    ?full=1 melatih dengan seluruh data (baseline pembanding untuk model sampel).
+    """
+    full_data = request.args.get('full', '0').lower() in ('1', 'true', 'yes')
+    version, error = fetch_current_dataset_version()
+    if error:
+        return jsonify({"message": error}), 500
+    if not training_manager.maybe_schedule(version, force=True, full_data=full_data):
+        return jsonify({"message": "Training model sedang berjalan.", "training": training_manager.status()}), 409
+    return jsonify({"message": "Training model dijadwalkan di background.", "training": training_manager.status()}), 202
+
+
+def read_prediction_input():
+    """
+    Membaca input /api/predict menjadi DataFrame mentah: JSON satu objek game, list objek,
+    atau {"games": [...]}, maupun file CSV/XLSX (field 'file'). Mengembalikan (df, pesan error).
+    """
+    if 'file' in request.files:
+        file = request.files['file']
+        if not file or not allowed_file(file.filename):
+            return None, "Format file tidak valid. Gunakan CSV atau XLSX."
+        filename = secure_filename(file.filename)
+        file_path = os.path.join(app.config['UPLOAD_FOLDER'], f"predict_{uuid.uuid4().hex}_{filename}")
+        try:
+            os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+            file.save(file_path)
+            if filename.lower().endswith('.csv'):
+                header = pd.read_csv(file_path, encoding='latin-1', nrows=0).columns
+                usecols = [col for col in header if col in COLUMN_MAPPING or col in PREDICT_COLUMNS]
+                if not usecols:
+                    return None, (f"Kolom tidak ditemukan. Gunakan kolom {', '.join(COLUMN_MAPPING)} "
+                                  f"atau {', '.join(PREDICT_COLUMNS)}.")
+                return read_csv_adaptive(file_path, usecols, engine=app.config['CSV_PARSER_ENGINE']), None
+            return pd.read_excel(file_path), None
+        except Exception as e:
+            return None, f"Gagal membaca file: {e}"
+        finally:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    payload = request.get_json(silent=True)
+    if isinstance(payload, dict) and isinstance(payload.get('games'), list):
+        payload = payload['games']
+    if isinstance(payload, dict):
+        payload = [payload]
+    if not isinstance(payload, list) or not all(isinstance(item, dict) for item in payload):
+        return None, "Kirim satu objek game, list objek game, atau file CSV/XLSX."
+    return pd.DataFrame(payload), None
+
+@app.route('/api/predict', methods=['POST'])
+def predict_review_type():
+    """
+    Endpoint prediksi review_type (beserta probabilitas per kelas) untuk satu game atau batch
+    memakai model terbaru di registry. Field yang dipakai: price, review_no, tags (name opsional).
+    """
+    artifacts, metadata = model_registry.load_latest()
+    if artifacts is None:
+        return jsonify({"message": "Model belum tersedia. Latih model lewat POST /api/model/train."}), 503
+
+    raw, error = read_prediction_input()
+    if error:
+        return jsonify({"message": error}), 400
+    if len(raw) > app.config['PREDICT_MAX_ROWS']:
+        return jsonify({"message": f"Batch terlalu besar (maksimal {app.config['PREDICT_MAX_ROWS']} baris)."}), 413
+
+    df = normalize_input(raw)
+    with stage('predict', rows=len(df)):
+        labels, probabilities, classes = predict_frame(artifacts, df)
+    return jsonify({
+        "model_id": metadata["model_id"],
+        "dataset_version": metadata["dataset_version"],
+        "classes": classes,
+        "count": len(df),
+        "predictions": format_predictions(df, labels, probabilities, classes)
+    }), 200
+
+
 # --- Rute Data Tampilan, Pencarian, Filter, dan Pagination (Fitur #6, #7, #8) ---
 @app.route('/api/games/data', methods=['GET'])
 def get_games_data():
     """
     Endpoint serbaguna untuk mengambil data dengan filter, pencarian, dan pagination.
+    Mode default: page/per_page (offset). Mode cursor: pagination=cursor atau parameter
+    after/before berisi token dari next_cursor/prev_cursor respons sebelumnya.
+    Parameter count: exact (default), cached, approx, atau none.
+    Filter release_year: 2019, 2015-2020, 2015-, atau -2020; min_score: skor review minimum (1-5).
     """
     
     # Ambil parameter query dari frontend
@@ -365,6 +706,30 @@ def get_games_data():
     search_term = request.args.get('search', '', type=str)
     genre_filter = request.args.get('genre', '', type=str) 
     review_filter = request.args.get('review_type', '', type=str) 
+    min_score = request.args.get('min_score', None, type=int)
+    count_mode = request.args.get('count', 'exact', type=str)
+    after_token = request.args.get('after', '', type=str)
+    before_token = request.args.get('before', '', type=str)
+    cursor_mode = request.args.get('pagination', '', type=str) == 'cursor' or after_token or before_token
+    search_fields = request.args.get('search_fields', 'name', type=str)
+    # Hasil pencarian diurutkan berdasarkan relevansi secara default
+    sort = request.args.get('sort', 'relevance' if search_term else 'id', type=str)
+
+    if count_mode not in COUNT_MODES:
+        return jsonify({"message": f"Parameter count tidak valid. Gunakan salah satu: {', '.join(COUNT_MODES)}."}), 400
+
+    if search_fields not in SEARCH_FIELDS:
+        return jsonify({"message": f"Parameter search_fields tidak valid. Gunakan salah satu: {', '.join(SEARCH_FIELDS)}."}), 400
+
+    try:
+        release_year = parse_year_range(request.args.get('release_year', '', type=str))
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+
+    if cursor_mode:
+        return get_games_data_by_cursor(per_page, search_term, genre_filter, review_filter,
+                                        count_mode, after_token, before_token, search_fields,
+                                        release_year=release_year, min_score=min_score)
     
     offset = (page - 1) * per_page
     
@@ -374,7 +739,12 @@ def get_games_data():
         offset=offset, 
         search=search_term, 
         genre=genre_filter, 
-        review_type=review_filter
+        review_type=review_filter,
+        count_mode=count_mode,
+        search_fields=search_fields,
+        sort=sort,
+        release_year=release_year,
+        min_score=min_score
     )
     
     if error:
@@ -392,6 +762,118 @@ def get_games_data():
         }
     }), 200
 
+def get_games_data_by_cursor(per_page, search_term, genre_filter, review_filter,
+                             count_mode, after_token, before_token, search_fields='name',
+                             release_year=None, min_score=None):
+    """Pagination keyset untuk /api/games/data (dipanggil dari get_games_data), selalu urut id."""
+    try:
+        after_id = decode_page_cursor(after_token) if after_token else None
+        before_id = decode_page_cursor(before_token) if before_token and after_id is None else None
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+
+    # Ambil satu baris ekstra untuk mengetahui apakah masih ada halaman berikutnya
+    df, total_records, error = fetch_all_game_data(
+        limit=per_page + 1,
+        search=search_term,
+        genre=genre_filter,
+        review_type=review_filter,
+        offset=0,
+        after_id=after_id,
+        before_id=before_id,
+        count_mode=count_mode,
+        search_fields=search_fields,
+        release_year=release_year,
+        min_score=min_score
+    )
+
+    if error:
+        return jsonify({"message": error}), 500
+
+    has_more = len(df) > per_page
+    if has_more:
+        # Baris ekstra berada di ujung arah pembacaan
+        df = df.iloc[1:] if before_id is not None else df.iloc[:per_page]
+
+    ids = df['id'].tolist() if not df.empty else []
+    if before_id is not None:
+        has_next, has_prev = True, has_more
+    else:
+        has_next, has_prev = has_more, after_id is not None
+
+    return jsonify({
+        "data": df.to_dict('records'),
+        "pagination": {
+            "mode": "cursor",
+            "per_page": per_page,
+            "next_cursor": encode_page_cursor(ids[-1]) if ids and has_next else None,
+            "prev_cursor": encode_page_cursor(ids[0]) if ids and has_prev else None,
+            "total_records": total_records,
+            "total_pages": math.ceil(total_records / per_page) if total_records else 0,
+            "total_is_estimate": count_mode == 'approx' and not (
+                search_term or genre_filter or review_filter or release_year or min_score is not None
+            ),
+        }
+    }), 200
+
+
+# --- Rute Export Data (streaming) ---
+@app.route('/api/games/export', methods=['GET'])
+def export_games():
+    """
+    Export data game dengan filter yang sama seperti /api/games/data (search, genre,
+    review_type, release_year, min_score, search_fields). format: csv (default), ndjson, atau xlsx; gzip=1 mengompres
+    hasil. Baris dibaca per batch dari backend penyimpanan dan dikirim sebagai chunked response,
+    sehingga memori tetap konstan berapa pun jumlah barisnya.
+    """
+    export_format = request.args.get('format', 'csv', type=str).lower()
+    compress = request.args.get('gzip', '0', type=str).lower() in ('1', 'true', 'yes')
+    search_fields = request.args.get('search_fields', 'name', type=str)
+
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"message": f"Parameter format tidak valid. Gunakan salah satu: {', '.join(EXPORT_FORMATS)}."}), 400
+    if search_fields not in SEARCH_FIELDS:
+        return jsonify({"message": f"Parameter search_fields tidak valid. Gunakan salah satu: {', '.join(SEARCH_FIELDS)}."}), 400
+    try:
+        release_year = parse_year_range(request.args.get('release_year', '', type=str))
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+
+    try:
+        columns, batches, close_export = store.open_export(
+            search=request.args.get('search', '', type=str),
+            genre=request.args.get('genre', '', type=str),
+            review_type=request.args.get('review_type', '', type=str),
+            search_fields=search_fields,
+            release_year=release_year,
+            min_score=request.args.get('min_score', None, type=int)
+        )
+    except StorageError as err:
+        return jsonify({"message": f"Gagal mengambil data dari database: {err}"}), 500
+
+    state = {"finished": False}
+
+    def generate():
+        yield from export_stream(columns, batches, export_format, compress)
+        state["finished"] = True
+
+    def release_connection():
+        # Dipanggil saat response ditutup, termasuk jika klien berhenti di tengah stream
+        close_export(state["finished"])
+
+    mimetype, extension = EXPORT_FORMATS[export_format]
+    filename = f"games_export.{extension}" + (".gz" if compress else "")
+    response = Response(
+        generate(),
+        mimetype='application/gzip' if compress else mimetype,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Accel-Buffering": "no",  # Nonaktifkan buffering reverse proxy (nginx)
+        }
+    )
+    response.call_on_close(release_connection)
+    return response
+
 
 # --- Rute CRUD Game Tunggal (Fitur #3 & #4) ---
 
@@ -404,35 +886,13 @@ def add_game():
     if not all(k in data for k in ['name', 'price', 'release_date', 'review_no', 'review_type', 'tags', 'description']):
         return jsonify({"message": "Input data game tidak lengkap."}), 400
 
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({"message": "Gagal terhubung ke database."}), 500
-    
-    query = """
-    INSERT INTO games (name, price, release_date, review_no, review_type, tags, description)
-    VALUES (%s, %s, %s, %s, %s, %s, %s)
-    """
-    
     try:
-        cursor = conn.cursor()
-        values = (
-            data['name'], data['price'], data['release_date'], 
-            data['review_no'], data['review_type'], data['tags'], data['description']
-        )
-        
-        cursor.execute(query, values)
-        conn.commit()
-        game_id = cursor.lastrowid 
-        
-        return jsonify({"message": "Data game berhasil ditambahkan.", "id": game_id}), 201
-        
-    except mysql.connector.Error as err:
-        conn.rollback()
+        game_id, tag_deltas = store.add_game(data)
+    except StorageError as err:
         return jsonify({"message": f"Gagal menambahkan data ke database: {err}"}), 500
-    finally:
-        if 'cursor' in locals():
-            cursor.close()
-        conn.close()
+    notify_games_changed(tag_deltas)
+
+    return jsonify({"message": "Data game berhasil ditambahkan.", "id": game_id}), 201
 
 # Fitur #4: Mengedit Data Game
 @app.route('/api/games/<int:game_id>', methods=['PUT'])
@@ -443,69 +903,29 @@ def edit_game(game_id):
     if 'name' not in data or 'price' not in data: 
         return jsonify({"message": "Data yang diubah tidak valid."}), 400
 
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({"message": "Gagal terhubung ke database."}), 500
-    
-    query = """
-    UPDATE games 
-    SET name=%s, price=%s, release_date=%s, review_no=%s, 
-        review_type=%s, tags=%s, description=%s
-    WHERE id=%s
-    """
-    
     try:
-        cursor = conn.cursor()
-        values = (
-            data['name'], data['price'], data['release_date'], 
-            data['review_no'], data['review_type'], data['tags'], data['description'],
-            game_id
-        )
-        
-        cursor.execute(query, values)
-        conn.commit()
-        
-        if cursor.rowcount == 0:
-            return jsonify({"message": "Game tidak ditemukan atau tidak ada perubahan."}), 404
-        
-        return jsonify({"message": f"Data game ID {game_id} berhasil diubah."}), 200
-        
-    except mysql.connector.Error as err:
-        conn.rollback()
+        found, tag_deltas = store.update_game(game_id, data)
+    except StorageError as err:
         return jsonify({"message": f"Gagal mengubah data di database: {err}"}), 500
-    finally:
-        if 'cursor' in locals():
-            cursor.close()
-        conn.close()
+    if not found:
+        return jsonify({"message": "Game tidak ditemukan atau tidak ada perubahan."}), 404
+    notify_games_changed(tag_deltas)
+
+    return jsonify({"message": f"Data game ID {game_id} berhasil diubah."}), 200
 
 # Fitur #4: Menghapus Data Game
 @app.route('/api/games/<int:game_id>', methods=['DELETE'])
 def delete_game(game_id):
     """Endpoint untuk menghapus record data game tertentu (Fitur #4)."""
-    
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({"message": "Gagal terhubung ke database."}), 500
-    
-    query = "DELETE FROM games WHERE id = %s"
-    
     try:
-        cursor = conn.cursor()
-        cursor.execute(query, (game_id,))
-        conn.commit()
-        
-        if cursor.rowcount == 0:
-            return jsonify({"message": "Game tidak ditemukan."}), 404
-            
-        return jsonify({"message": f"Data game ID {game_id} berhasil dihapus."}), 200
-        
-    except mysql.connector.Error as err:
-        conn.rollback()
+        found, tag_deltas = store.delete_game(game_id)
+    except StorageError as err:
         return jsonify({"message": f"Gagal menghapus data dari database: {err}"}), 500
-    finally:
-        if 'cursor' in locals():
-            cursor.close()
-        conn.close()
+    if not found:
+        return jsonify({"message": "Game tidak ditemukan."}), 404
+    notify_games_changed(tag_deltas)
+
+    return jsonify({"message": f"Data game ID {game_id} berhasil dihapus."}), 200
 
 
 if __name__ == '__main__':
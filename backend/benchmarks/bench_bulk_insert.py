@@ -0,0 +1,98 @@
+# benchmarks/bench_bulk_insert.py
+"""
+Benchmark throughput (rows/sec) jalur penyimpanan upload:
+executemany lama (BATCH_SIZE=100) vs multi-row INSERT vs LOAD DATA LOCAL INFILE.
+
+Jalankan dari folder backend:
+    python benchmarks/bench_bulk_insert.py --rows 200000
+    python benchmarks/bench_bulk_insert.py --rows 200000 --dry-run   # tanpa MySQL, hanya konversi
+
+Data ditulis ke TEMPORARY TABLE (LIKE games), sehingga tabel games tidak tersentuh.
+"""
+
+import argparse
+import os
+import sys
+import time
+import mysql.connector
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+from steam_datagen import generate_clean_frame
+from bulk_loader import (BULK_LOAD_METHODS, bulk_insert_frame, frame_to_rows,
+                         clean_nan_to_none, GAME_COLUMNS, write_tsv)
+
+BENCH_TABLE = 'games_bulk_bench'
+
+
+def bench_conversion(df):
+    """Waktu konversi NaN -> None saja (tanpa database)."""
+    results = {}
+
+    start = time.perf_counter()
+    [tuple(clean_nan_to_none(d.get(col)) for col in GAME_COLUMNS) for d in df.to_dict('records')]
+    results['per_cell (executemany)'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frame_to_rows(df)
+    results['vectorized (multirow)'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with open(os.devnull, 'w', encoding='utf-8') as sink:
+        write_tsv(df, sink)
+    results['tsv (infile)'] = time.perf_counter() - start
+    return results
+
+
+def bench_database(df, methods):
+    conn = mysql.connector.connect(
+        host=Config.MYSQL_HOST, user=Config.MYSQL_USER,
+        password=Config.MYSQL_PASSWORD, database=Config.MYSQL_DB,
+        allow_local_infile=True,
+    )
+    results = {}
+    try:
+        cursor = conn.cursor()
+        for method in methods:
+            cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {BENCH_TABLE}")
+            cursor.execute(f"CREATE TEMPORARY TABLE {BENCH_TABLE} LIKE games")
+            start = time.perf_counter()
+            bulk_insert_frame(cursor, df, method=method, table=BENCH_TABLE)
+            conn.commit()
+            results[method] = time.perf_counter() - start
+        cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {BENCH_TABLE}")
+    finally:
+        conn.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--methods', default=','.join(BULK_LOAD_METHODS))
+    parser.add_argument('--dry-run', action='store_true', help='Hanya ukur konversi, tanpa MySQL')
+    args = parser.parse_args()
+
+    df = generate_clean_frame(args.rows)
+    print(f"Rows: {len(df)} (bersih dari {args.rows} baris mentah)")
+
+    print("\n[Konversi NaN -> NULL]")
+    for name, seconds in bench_conversion(df).items():
+        print(f"  {name:<26} {seconds:8.3f}s  {len(df) / seconds:12,.0f} rows/sec")
+
+    if args.dry_run:
+        return
+
+    print("\n[Insert ke MySQL]")
+    methods = [m.strip() for m in args.methods.split(',') if m.strip()]
+    results = bench_database(df, methods)
+    baseline = results.get('executemany')
+    for method, seconds in results.items():
+        speedup = f"  x{baseline / seconds:.1f} vs executemany" if baseline else ''
+        print(f"  {method:<26} {seconds:8.3f}s  {len(df) / seconds:12,.0f} rows/sec{speedup}")
+
+
+if __name__ == '__main__':
+    main()
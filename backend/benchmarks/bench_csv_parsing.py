@@ -0,0 +1,113 @@
+# benchmarks/bench_csv_parsing.py
+"""
+Benchmark parsing CSV upload: jalur lama (pd.read_csv engine='python', on_bad_lines='skip',
+semua kolom) vs pembaca adaptif csv_reader (engine pyarrow / C dengan fallback python per
+blok), pada file bersih dan file kotor (baris dengan kolom berlebih dan satu tanda kutip
+yang tidak ditutup).
+
+Jalankan dari folder backend:
+    python benchmarks/bench_csv_parsing.py --rows 300000
+    python benchmarks/bench_csv_parsing.py --rows 300000 --bad-ratio 0.01 --keep
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from steam_datagen import generate_raw_frame
+from data_processor.parser import COLUMN_MAPPING
+from data_processor.csv_reader import iter_csv_frames, resolve_engine, PYARROW_AVAILABLE
+
+CHUNK_SIZE = 50000
+
+BAD_LINE = '999,Broken row,$1.00,"Jan 1, 2020",10,Mixed,Action,extra,fields,here\n'
+
+
+def write_inputs(rows, bad_ratio, directory):
+    """Menulis file bersih dan kotor; mengembalikan (path bersih, path kotor, jumlah bad line)."""
+    clean_path = os.path.join(directory, 'clean.csv')
+    dirty_path = os.path.join(directory, 'dirty.csv')
+    frame = generate_raw_frame(rows)
+    frame.to_csv(clean_path, index=False, encoding='latin-1', errors='replace')
+
+    # Baris rusak disisipkan di antara record (bukan per baris teks: deskripsi berisi newline)
+    rng = np.random.default_rng(7)
+    bad_positions = sorted(rng.choice(rows, size=int(rows * bad_ratio), replace=False).tolist())
+    with open(dirty_path, 'w', encoding='latin-1', errors='replace', newline='') as target:
+        frame.iloc[:0].to_csv(target, index=False)
+        start = 0
+        for position in bad_positions:
+            frame.iloc[start:position + 1].to_csv(target, index=False, header=False)
+            target.write(BAD_LINE)
+            start = position + 1
+        frame.iloc[start:].to_csv(target, index=False, header=False)
+        # Tanda kutip yang tidak pernah ditutup di akhir file
+        target.write('1000000,"Unclosed quote,$1.00,"Jan 1, 2020",10,Mixed,Action,desc,link\n')
+    return clean_path, dirty_path, len(bad_positions)
+
+
+def legacy_read(path, counter):
+    return [pd.read_csv(path, encoding='latin-1', sep=',', engine='python', on_bad_lines='skip')]
+
+
+def adaptive_read(engine):
+    def read(path, counter):
+        return iter_csv_frames(path, COLUMN_MAPPING.keys(), chunksize=CHUNK_SIZE, engine=engine, counter=counter)
+    return read
+
+
+def measure(read, path):
+    counter = {}
+    start = time.perf_counter()
+    rows = sum(len(frame) for frame in read(path, counter))
+    return rows, time.perf_counter() - start, counter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=300000)
+    parser.add_argument('--bad-ratio', type=float, default=0.005, help='Proporsi baris rusak di file kotor')
+    parser.add_argument('--keep', action='store_true', help='Jangan hapus file CSV sementara')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='bench_csv_')
+    clean_path, dirty_path, bad_rows = write_inputs(args.rows, args.bad_ratio, directory)
+    print(f"{args.rows:,} baris, {os.path.getsize(clean_path) / 2**20:.1f} MiB; "
+          f"file kotor +{bad_rows:,} baris rusak + 1 kutip tidak ditutup")
+    print(f"pyarrow terpasang: {PYARROW_AVAILABLE} (auto -> {resolve_engine('auto')})")
+
+    readers = {'python (lama)': legacy_read}
+    for engine in ('pyarrow', 'c', 'python'):
+        if engine == 'pyarrow' and not PYARROW_AVAILABLE:
+            continue
+        readers[f'adaptif {engine}'] = adaptive_read(engine)
+
+    try:
+        for label, path in (('bersih', clean_path), ('kotor', dirty_path)):
+            print(f"\n[{label}]")
+            print(f"  {'jalur':<18} {'baris':>10} {'waktu':>8} {'baris/detik':>13} {'bad lines':>10} {'fallback':>9}")
+            baseline = None
+            for name, read in readers.items():
+                rows, elapsed, counter = measure(read, path)
+                baseline = baseline or elapsed
+                print(f"  {name:<18} {rows:>10,} {elapsed:7.2f}s {rows / elapsed:>13,.0f} "
+                      f"{counter.get('bad_lines', '-'):>10} {counter.get('fallback_blocks', '-'):>9}"
+                      f"  x{baseline / elapsed:.1f}")
+    finally:
+        if args.keep:
+            print(f"\nFile CSV disimpan di {directory}")
+        else:
+            for path in (clean_path, dirty_path):
+                os.remove(path)
+            os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
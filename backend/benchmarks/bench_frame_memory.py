@@ -0,0 +1,143 @@
+# benchmarks/bench_frame_memory.py
+"""
+Benchmark memori DataFrame games: pd.DataFrame(list of dict) dari cursor(dictionary=True)
+vs DataFrame bertipe ringkas dari tuple (typed_frame.fetch_typed_frame), dengan dan tanpa
+kolom description.
+
+Jalankan dari folder backend:
+    python benchmarks/bench_frame_memory.py --rows 1000000
+    python benchmarks/bench_frame_memory.py --from-db            # memakai tabel games di MySQL
+
+Tanpa --from-db, baris sintetis dibuat dengan tipe Python yang sama seperti keluaran
+mysql.connector (Decimal untuk price, date untuk release_date) dan dilayani oleh cursor tiruan.
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import time
+import tracemalloc
+from decimal import Decimal
+import pandas as pd
+import mysql.connector
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+from steam_datagen import generate_clean_frame
+from typed_frame import fetch_typed_frame
+
+ALL_FIELDS = ['id', 'name', 'price', 'release_date', 'review_no', 'review_type', 'tags', 'description']
+NO_DESCRIPTION_FIELDS = [col for col in ALL_FIELDS if col != 'description']
+
+
+class SyntheticCursor:
+    """Cursor tiruan: execute() memilih kolom, fetchall()/fetchmany() mengembalikan tuple/dict."""
+
+    def __init__(self, rows, dictionary=False):
+        self._rows = rows
+        self._dictionary = dictionary
+        self._position = 0
+        self._indices = []
+        self.description = []
+
+    def execute(self, query, params=()):
+        fields = [f.strip() for f in query.split('SELECT', 1)[1].split('FROM', 1)[0].split(',')]
+        self._indices = [ALL_FIELDS.index(f) for f in fields]
+        self.description = [(f,) for f in fields]
+        self._position = 0
+
+    def _project(self, row):
+        values = tuple(row[i] for i in self._indices)
+        if self._dictionary:
+            return dict(zip((d[0] for d in self.description), values))
+        return values
+
+    def fetchmany(self, size):
+        batch = self._rows[self._position:self._position + size]
+        self._position += len(batch)
+        return [self._project(row) for row in batch]
+
+    def fetchall(self):
+        return self.fetchmany(len(self._rows) - self._position)
+
+
+def synthetic_rows(rows):
+    """Tuple baris games dengan tipe Python seperti hasil mysql.connector."""
+    df = generate_clean_frame(rows)
+    epoch = datetime.date(1970, 1, 1)
+    dates = (pd.to_datetime(df['release_date']) - pd.Timestamp(epoch)).dt.days
+    return [
+        (i + 1, name, Decimal(str(price)), epoch + datetime.timedelta(days=int(days)),
+         int(review_no), review_type, None if not isinstance(tags, str) else tags, description)
+        for i, (name, price, days, review_no, review_type, tags, description) in enumerate(zip(
+            df['name'], df['price'], dates, df['review_no'], df['review_type'], df['tags'], df['description']
+        ))
+    ]
+
+
+def measure(build):
+    """(DataFrame, memori DataFrame deep, puncak alokasi Python selama build, waktu)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = build()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return df, int(df.memory_usage(deep=True).sum()), peak, elapsed
+
+
+def run(make_cursor):
+    def dict_frame(fields):
+        cursor = make_cursor(dictionary=True)
+        cursor.execute(f"SELECT {', '.join(fields)} FROM games")
+        return pd.DataFrame(cursor.fetchall())
+
+    def typed(fields):
+        return fetch_typed_frame(make_cursor(dictionary=False), f"SELECT {', '.join(fields)} FROM games")
+
+    return {
+        'dict rows (lama)': measure(lambda: dict_frame(ALL_FIELDS)),
+        'typed': measure(lambda: typed(ALL_FIELDS)),
+        'typed tanpa description': measure(lambda: typed(NO_DESCRIPTION_FIELDS)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--from-db', action='store_true', help='Baca tabel games dari MySQL (Config)')
+    args = parser.parse_args()
+
+    if args.from_db:
+        conn = mysql.connector.connect(
+            host=Config.MYSQL_HOST, user=Config.MYSQL_USER,
+            password=Config.MYSQL_PASSWORD, database=Config.MYSQL_DB,
+        )
+        make_cursor = lambda dictionary: conn.cursor(dictionary=dictionary)
+        print("Sumber: tabel games (MySQL)")
+    else:
+        rows = synthetic_rows(args.rows)
+        make_cursor = lambda dictionary: SyntheticCursor(rows, dictionary=dictionary)
+        print(f"Sumber: {args.rows:,} baris sintetis")
+
+    try:
+        results = run(make_cursor)
+    finally:
+        if args.from_db:
+            conn.close()
+
+    baseline = results['dict rows (lama)'][1]
+    print(f"\n  {'jalur':<26} {'DataFrame':>12} {'puncak Python':>14} {'waktu':>8}")
+    for name, (df, frame_bytes, peak, elapsed) in results.items():
+        print(f"  {name:<26} {frame_bytes / 2**20:9.1f} MiB {peak / 2**20:11.1f} MiB {elapsed:7.2f}s"
+              f"  x{baseline / frame_bytes:.1f} lebih kecil")
+    print("\nDtypes typed:")
+    for col, dtype in results['typed'][0].dtypes.items():
+        print(f"  {col:<14} {dtype}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,355 @@
+# benchmarks/bench_pipeline.py
+"""
+Suite benchmark pipeline data dengan dataset Steam sintetis (steam_datagen) pada beberapa
+ukuran: parse_and_validate_data (CSV dan XLSX), calculate_dashboard_stats (tanpa
+klasifikasi), run_classification, serta jalur upload-ke-kueri (simpan hasil parsing, satu
+halaman tabel dengan filter genre + review type, statistik dashboard SQL) ke SQLite
+in-memory atau database MySQL sementara. Hasil ditulis sebagai laporan JSON yang dapat
+dibandingkan dengan laporan baseline.
+
+Jalankan dari folder backend:
+    python benchmarks/bench_pipeline.py --sizes 10k,100k --report bench_report.json
+    python benchmarks/bench_pipeline.py --sizes 10k,100k --baseline bench_report.json --report new.json
+    python benchmarks/bench_pipeline.py --sizes 1m --only parse_csv,dashboard_stats --data-dir /tmp/steam_data
+    python benchmarks/bench_pipeline.py --store mysql --mysql-db steam_bench_db
+
+--store mysql memakai fungsi app.py (save_data_to_db, fetch_all_game_data,
+fetch_dashboard_stats_sql) pada database --mysql-db yang dibuat dari struktur tabel games di
+Config.MYSQL_DB lalu dihapus di akhir (kecuali --keep-db); tabel games asli tidak tersentuh.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+from steam_datagen import parse_size, write_dataset
+from bulk_loader import GAME_COLUMNS, frame_to_rows
+from derived_columns import DERIVED_COLUMNS
+from data_processor.parser import parse_and_validate_data
+from data_processor.analyzer import calculate_dashboard_stats, run_classification, prepare_analysis_frame
+
+BENCHMARKS = ('parse_csv', 'parse_xlsx', 'dashboard_stats', 'classification', 'upload_to_query')
+
+# Filter halaman tabel yang diukur pada jalur upload-ke-kueri
+QUERY_GENRE = 'Action'
+QUERY_REVIEW_TYPES = 'Very Positive,Positive'
+QUERY_PAGE_SIZE = 50
+QUERY_PAGE = 20
+
+
+def measure(func, repeat, prepare=None):
+    """Menjalankan func(*prepare()) `repeat` kali; mengembalikan (waktu terbaik, semua waktu, hasil terakhir)."""
+    runs = []
+    result = None
+    for _ in range(repeat):
+        args = prepare() if prepare else ()
+        start = time.perf_counter()
+        result = func(*args)
+        runs.append(time.perf_counter() - start)
+    return min(runs), runs, result
+
+
+class SQLiteStore:
+    """Pengganti MySQL in-memory dengan tabel games dan kueri setara app.py (tanpa index tag)."""
+
+    def __init__(self):
+        self.conn = sqlite3.connect(':memory:')
+        self.conn.execute(
+            "CREATE TABLE games (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, price REAL, "
+            "release_date TEXT, review_no INTEGER, review_type TEXT, tags TEXT, description TEXT)"
+        )
+        self.conn.execute("CREATE INDEX idx_games_review_type ON games (review_type)")
+
+    def reset(self):
+        self.conn.execute("DELETE FROM games")
+        self.conn.commit()
+
+    def save(self, records):
+        rows = frame_to_rows(pd.DataFrame.from_records(records, columns=GAME_COLUMNS))
+        placeholders = ', '.join(['?'] * len(GAME_COLUMNS))
+        self.conn.executemany(f"INSERT INTO games ({', '.join(GAME_COLUMNS)}) VALUES ({placeholders})", rows)
+        self.conn.commit()
+        return len(rows)
+
+    def query_page(self, genre, review_type, limit, offset):
+        reviews = review_type.split(',')
+        where = (f"WHERE review_type IN ({', '.join(['?'] * len(reviews))}) "
+                 "AND (',' || REPLACE(tags, ', ', ',') || ',') LIKE ?")
+        params = reviews + [f'%,{genre},%']
+        total = self.conn.execute(f"SELECT COUNT(id) FROM games {where}", params).fetchone()[0]
+        rows = self.conn.execute(
+            f"SELECT id, name, price, release_date, review_no, review_type, tags, description FROM games {where} "
+            "ORDER BY id DESC LIMIT ? OFFSET ?", params + [limit, offset]
+        ).fetchall()
+        return rows, total
+
+    def dashboard(self):
+        summary = self.conn.execute("SELECT COUNT(id), AVG(review_no), MIN(price), MAX(price) FROM games").fetchone()
+        distribution = self.conn.execute("SELECT review_type, COUNT(id) FROM games GROUP BY review_type").fetchall()
+        return summary, distribution
+
+    def close(self):
+        self.conn.close()
+
+
+class MySQLStore:
+    """Jalur app.py asli pada database MySQL sementara (struktur games disalin dari Config.MYSQL_DB)."""
+
+    def __init__(self, database, keep=False):
+        import mysql.connector
+
+        if database == Config.MYSQL_DB:
+            sys.exit("--mysql-db harus berbeda dari Config.MYSQL_DB (tabel games akan dikosongkan).")
+        self.database = database
+        self.keep = keep
+        self.server = mysql.connector.connect(
+            host=Config.MYSQL_HOST, user=Config.MYSQL_USER, password=Config.MYSQL_PASSWORD
+        )
+        cursor = self.server.cursor()
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{database}`")
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS `{database}`.games LIKE `{Config.MYSQL_DB}`.games")
+        cursor.close()
+
+        # Config dibaca saat app diimport, sehingga app diarahkan ke database benchmark
+        Config.MYSQL_DB = database
+        import app as backend_app
+        self.app = backend_app
+
+    def reset(self):
+        message, success = self.app.clear_games_table()
+        if not success:
+            raise RuntimeError(message)
+
+    def save(self, records):
+        count, message = self.app.save_data_to_db(records)
+        if not count and records:
+            raise RuntimeError(message)
+        return count
+
+    def query_page(self, genre, review_type, limit, offset):
+        df, total, error = self.app.fetch_all_game_data(
+            limit=limit, offset=offset, genre=genre, review_type=review_type
+        )
+        if error:
+            raise RuntimeError(error)
+        return df, total
+
+    def dashboard(self):
+        stats, error = self.app.fetch_dashboard_stats_sql()
+        if error:
+            raise RuntimeError(error)
+        return stats
+
+    def close(self):
+        if not self.keep:
+            cursor = self.server.cursor()
+            cursor.execute(f"DROP DATABASE IF EXISTS `{self.database}`")
+            cursor.close()
+        self.server.close()
+
+
+def bench_upload_to_query(store, records, repeat):
+    """Simpan -> halaman tabel terfilter -> statistik dashboard; waktu terbaik tiap langkah."""
+    steps = {'upload_store': [], 'query_page': [], 'query_dashboard': [], 'upload_to_query': []}
+    for _ in range(repeat):
+        store.reset()
+        start = time.perf_counter()
+        store.save(records)
+        saved = time.perf_counter()
+        store.query_page(QUERY_GENRE, QUERY_REVIEW_TYPES, QUERY_PAGE_SIZE, QUERY_PAGE * QUERY_PAGE_SIZE)
+        paged = time.perf_counter()
+        store.dashboard()
+        done = time.perf_counter()
+        steps['upload_store'].append(saved - start)
+        steps['query_page'].append(paged - saved)
+        steps['query_dashboard'].append(done - paged)
+        steps['upload_to_query'].append(done - start)
+    return steps
+
+
+def result_entry(size, rows, runs):
+    best = min(runs)
+    return {
+        "size": size,
+        "rows": int(rows),
+        "seconds": round(best, 6),
+        "runs": [round(run, 6) for run in runs],
+        "rows_per_second": round(rows / best, 1) if best > 0 else None,
+    }
+
+
+def run_size(args, size, store, results):
+    rows = parse_size(size)
+    selected = set(args.only.split(',')) if args.only else set(BENCHMARKS)
+
+    def record(name, count, runs):
+        entry = result_entry(size, count, runs)
+        results[f'{size}/{name}'] = entry
+        print(f"  {name:<18} {entry['seconds']:9.3f}s {entry['rows_per_second'] or 0:>14,.0f} baris/detik")
+
+    print(f"\n[{size}] {rows:,} baris mentah")
+    csv_path = write_dataset(args.data_dir, rows, args.seed, 'csv')
+
+    # Hasil parsing CSV selalu dibutuhkan sebagai input benchmark lain
+    _, runs, (records, message) = measure(
+        lambda: parse_and_validate_data(csv_path, '.csv', engine=args.engine),
+        args.repeat if 'parse_csv' in selected else 1
+    )
+    if records is None:
+        raise RuntimeError(message)
+    if 'parse_csv' in selected:
+        record('parse_csv', len(records), runs)
+
+    if 'parse_xlsx' in selected:
+        if rows <= args.xlsx_max_rows:
+            xlsx_path = write_dataset(args.data_dir, rows, args.seed, 'xlsx')
+            _, runs, (xlsx_records, message) = measure(
+                lambda: parse_and_validate_data(xlsx_path, '.xlsx'), args.repeat
+            )
+            if xlsx_records is None:
+                raise RuntimeError(message)
+            record('parse_xlsx', len(xlsx_records), runs)
+            del xlsx_records
+        else:
+            print(f"  {'parse_xlsx':<18} dilewati (> --xlsx-max-rows {args.xlsx_max_rows:,})")
+
+    # Kolom yang dimuat app.py untuk analisis (ANALYSIS_FIELDS)
+    frame = pd.DataFrame.from_records(records, columns=GAME_COLUMNS + DERIVED_COLUMNS)
+    frame.insert(0, 'id', np.arange(1, len(frame) + 1))
+    analysis_frame = frame[['id', 'price', 'review_no', 'review_type', 'review_score', 'tags']]
+
+    if 'dashboard_stats' in selected:
+        _, runs, stats = measure(
+            lambda df: calculate_dashboard_stats(df, include_classification=False), args.repeat,
+            prepare=lambda: (analysis_frame.copy(),)
+        )
+        record('dashboard_stats', stats['descriptive_stats']['total_games'], runs)
+
+    if 'classification' in selected:
+        _, runs, (_, error) = measure(
+            lambda df: run_classification(df, n_jobs=args.n_jobs), args.repeat,
+            prepare=lambda: (prepare_analysis_frame(analysis_frame.copy()),)
+        )
+        if error:
+            raise RuntimeError(error)
+        record('classification', len(prepare_analysis_frame(analysis_frame.copy())), runs)
+
+    if 'upload_to_query' in selected:
+        steps = bench_upload_to_query(store, records, args.repeat)
+        for name, runs in steps.items():
+            record(name, len(records), runs)
+        store.reset()
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BACKEND_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """Mencetak rasio waktu terhadap baseline; mengembalikan daftar benchmark yang melambat."""
+    regressions = []
+    print(f"\nPerbandingan dengan baseline {baseline.get('created_at')} (git {baseline.get('environment', {}).get('git_revision')}):")
+    print(f"  {'benchmark':<30} {'baseline':>10} {'sekarang':>10} {'rasio':>7}")
+    for key, entry in results.items():
+        previous = baseline.get('results', {}).get(key)
+        if previous is None or not previous.get('seconds'):
+            continue
+        ratio = entry['seconds'] / previous['seconds']
+        status = ''
+        if ratio > 1 + tolerance:
+            status = 'LEBIH LAMBAT'
+            regressions.append(key)
+        elif ratio < 1 - tolerance:
+            status = 'lebih cepat'
+        print(f"  {key:<30} {previous['seconds']:9.3f}s {entry['seconds']:9.3f}s {ratio:6.2f}x  {status}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10k,100k,1m', help='Daftar ukuran dataset, mis. 10k,100k,1m')
+    parser.add_argument('--only', default=None, help=f"Subset benchmark: {','.join(BENCHMARKS)}")
+    parser.add_argument('--repeat', type=int, default=3, help='Jumlah pengulangan; waktu terbaik yang dilaporkan')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--engine', default=Config.CSV_PARSER_ENGINE, help='Engine CSV parser')
+    parser.add_argument('--n-jobs', type=int, default=Config.CLASSIFIER_N_JOBS, help='Core RandomForest')
+    parser.add_argument('--xlsx-max-rows', type=int, default=100000, help='Ukuran maksimum yang diukur dalam format XLSX')
+    parser.add_argument('--store', choices=('sqlite', 'mysql'), default='sqlite')
+    parser.add_argument('--mysql-db', default='steam_bench_db', help='Database MySQL sementara (--store mysql)')
+    parser.add_argument('--keep-db', action='store_true', help='Jangan hapus database MySQL sementara')
+    parser.add_argument('--data-dir', default=None, help='Folder dataset sintetis (dipakai ulang antar run); default folder sementara')
+    parser.add_argument('--report', default=None, help='Path laporan JSON')
+    parser.add_argument('--baseline', default=None, help='Laporan JSON pembanding')
+    parser.add_argument('--tolerance', type=float, default=0.15, help='Batas perlambatan relatif sebelum dianggap regresi')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit code 1 jika ada regresi terhadap baseline')
+    args = parser.parse_args()
+
+    temporary_data = args.data_dir is None
+    if temporary_data:
+        args.data_dir = tempfile.mkdtemp(prefix='steam_bench_')
+    store = MySQLStore(args.mysql_db, keep=args.keep_db) if args.store == 'mysql' else SQLiteStore()
+
+    results = {}
+    try:
+        for size in args.sizes.split(','):
+            run_size(args, size.strip().lower(), store, results)
+    finally:
+        store.close()
+        if temporary_data:
+            shutil.rmtree(args.data_dir, ignore_errors=True)
+
+    report = {
+        "suite": "pipeline",
+        "created_at": datetime.datetime.now().isoformat(timespec='seconds'),
+        "environment": {
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": {
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "engine": args.engine,
+            "n_jobs": args.n_jobs,
+            "store": args.store,
+        },
+        "results": results,
+    }
+    if args.report:
+        with open(args.report, 'w') as report_file:
+            json.dump(report, report_file, indent=2)
+        print(f"\nLaporan ditulis ke {args.report}")
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare_with_baseline(results, json.load(baseline_file), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark melambat lebih dari {args.tolerance:.0%}: {', '.join(regressions)}")
+            if args.fail_on_regression:
+                sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
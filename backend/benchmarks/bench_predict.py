@@ -0,0 +1,100 @@
+# benchmarks/bench_predict.py
+"""
+Benchmark throughput prediksi /api/predict: batch vektor (satu predict_proba untuk seluruh
+batch) vs prediksi per game (satu baris per panggilan, diukur pada sebagian baris lalu
+diekstrapolasi), termasuk normalisasi input dan format JSON hasil.
+
+Jalankan dari folder backend:
+    python benchmarks/bench_predict.py --batch 100000
+    python benchmarks/bench_predict.py --batch 100000 --model-dir models   # model terbaru di registry
+
+Tanpa --model-dir, model dilatih dulu dari data sintetis (--train-rows baris).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from steam_datagen import generate_clean_frame
+from data_processor.analyzer import prepare_analysis_frame, train_classifier
+from data_processor.model_registry import ModelRegistry
+from data_processor.predictor import normalize_input, predict_frame, format_predictions
+
+
+def load_artifacts(args):
+    if args.model_dir:
+        artifacts, metadata = ModelRegistry(args.model_dir).load_latest()
+        if artifacts is None:
+            sys.exit(f"Tidak ada model di {args.model_dir}")
+        print(f"Model registry: {metadata['model_id']} ({metadata['n_rows']:,} baris training)")
+        return artifacts
+
+    df = prepare_analysis_frame(generate_clean_frame(args.train_rows, seed=1)).reset_index(drop=True)
+    start = time.perf_counter()
+    artifacts, _, error = train_classifier(df, n_jobs=args.n_jobs)
+    if error:
+        sys.exit(error)
+    print(f"Model sintetis dilatih dari {len(df):,} baris dalam {time.perf_counter() - start:.1f}s")
+    return artifacts
+
+
+def request_payload(rows):
+    """Batch seperti body JSON /api/predict (list of dict, harga/review_no sebagai teks mentah)."""
+    df = generate_clean_frame(rows, seed=2)
+    return pd.DataFrame({
+        'name': df['name'],
+        'price': '$' + df['price'].map('{:.2f}'.format),
+        'review_no': df['review_no'].map('{:,}'.format),
+        'tags': df['tags'],
+    }).to_dict('records')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--batch', type=int, default=100000)
+    parser.add_argument('--train-rows', type=int, default=50000)
+    parser.add_argument('--model-dir', default=None)
+    parser.add_argument('--n-jobs', type=int, default=-1, help='Core RandomForest (model sintetis)')
+    parser.add_argument('--per-row-sample', type=int, default=300, help='Jumlah baris untuk mengukur jalur per game')
+    args = parser.parse_args()
+
+    artifacts = load_artifacts(args)
+    payload = request_payload(args.batch)
+
+    timings = {}
+    start = time.perf_counter()
+    df = normalize_input(pd.DataFrame(payload))
+    timings['normalisasi input'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    labels, probabilities, classes = predict_frame(artifacts, df)
+    timings['fitur + predict_proba'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    body = json.dumps({"predictions": format_predictions(df, labels, probabilities, classes)})
+    timings['format + JSON'] = time.perf_counter() - start
+    total = sum(timings.values())
+
+    sample = payload[:args.per_row_sample]
+    start = time.perf_counter()
+    for game in sample:
+        row = normalize_input(pd.DataFrame([game]))
+        predict_frame(artifacts, row)
+    per_row = (time.perf_counter() - start) / len(sample)
+
+    print(f"\nBatch {args.batch:,} game, respons {len(body) / 2**20:.1f} MiB")
+    for name, elapsed in timings.items():
+        print(f"  {name:<24} {elapsed:7.3f}s")
+    print(f"  {'total batch':<24} {total:7.3f}s  -> {args.batch / total:,.0f} game/detik")
+    print(f"  {'per game (ekstrapolasi)':<24} {per_row * args.batch:7.1f}s  -> {1 / per_row:,.0f} game/detik"
+          f"  (batch x{per_row * args.batch / total:.0f} lebih cepat)")
+
+
+if __name__ == '__main__':
+    main()
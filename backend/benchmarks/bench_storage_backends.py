@@ -0,0 +1,179 @@
+# benchmarks/bench_storage_backends.py
+"""
+Perbandingan backend penyimpanan (Config.STORAGE_BACKEND) dengan dataset Steam sintetis:
+bulk load hasil parsing, satu halaman tabel dengan filter genre + review type (beserta
+COUNT), pencarian teks, statistik dashboard SQL, dan pemuatan kolom analisis. Semua kueri
+melalui GameStore yang sama dengan yang dipakai app.py.
+
+Jalankan dari folder backend:
+    python benchmarks/bench_storage_backends.py --sizes 10k,100k --report storage_report.json
+    python benchmarks/bench_storage_backends.py --backends sqlite --sizes 1m --data-dir /tmp/steam_data
+    python benchmarks/bench_storage_backends.py --backends sqlite,duckdb,mysql --mysql-db steam_bench_db
+
+Backend sqlite/duckdb memakai file di folder sementara; duckdb dilewati jika paketnya tidak
+terpasang. mysql memakai database --mysql-db yang dibuat dari struktur tabel games di
+Config.MYSQL_DB lalu dihapus di akhir (kecuali --keep-db).
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import numpy as np
+import pandas as pd
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+from steam_datagen import parse_size, write_dataset
+from bench_pipeline import (measure, result_entry, git_revision, compare_with_baseline,
+                            QUERY_GENRE, QUERY_REVIEW_TYPES, QUERY_PAGE_SIZE, QUERY_PAGE)
+from bulk_loader import records_to_frame
+from data_processor.parser import parse_and_validate_data
+from storage import STORAGE_BACKENDS
+from embedded_store import DUCKDB_AVAILABLE, create_embedded_store
+
+QUERY_SEARCH = 'game 12'
+
+
+def open_store(backend, args, workdir):
+    """GameStore kosong untuk backend; mengembalikan (store, fungsi cleanup)."""
+    if backend != 'mysql':
+        path = os.path.join(workdir, f'bench.{backend}')
+        store = create_embedded_store(backend, path)
+
+        def cleanup():
+            store.close()
+            for suffix in ('', '-wal', '-shm', '.wal'):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+        return store, cleanup
+
+    import mysql.connector
+    from mysql_store import MySQLGameStore
+
+    if args.mysql_db == Config.MYSQL_DB:
+        sys.exit("--mysql-db harus berbeda dari Config.MYSQL_DB (tabel games akan dikosongkan).")
+    server = mysql.connector.connect(host=Config.MYSQL_HOST, user=Config.MYSQL_USER, password=Config.MYSQL_PASSWORD)
+    cursor = server.cursor()
+    cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{args.mysql_db}`")
+    cursor.execute(f"CREATE TABLE IF NOT EXISTS `{args.mysql_db}`.games LIKE `{Config.MYSQL_DB}`.games")
+    cursor.close()
+    config = {key: getattr(Config, key) for key in dir(Config) if key.isupper()}
+    config['MYSQL_DB'] = args.mysql_db
+    store = MySQLGameStore(config)
+    store.clear_games()
+
+    def cleanup():
+        if not args.keep_db:
+            cursor = server.cursor()
+            cursor.execute(f"DROP DATABASE IF EXISTS `{args.mysql_db}`")
+            cursor.close()
+        server.close()
+    return store, cleanup
+
+
+def run_backend(args, backend, size, frame, results, workdir):
+    store, cleanup = open_store(backend, args, workdir)
+    chunk_size = Config.UPLOAD_CHUNK_SIZE
+    print(f"  {backend}")
+
+    def record(name, runs):
+        entry = result_entry(size, len(frame), runs)
+        results[f'{size}/{backend}/{name}'] = entry
+        print(f"    {name:<16} {entry['seconds'] * 1000:10.1f} ms")
+
+    def query(**filters):
+        return lambda: store.fetch_games(
+            limit=QUERY_PAGE_SIZE, offset=QUERY_PAGE * QUERY_PAGE_SIZE, **filters
+        )
+
+    try:
+        _, runs, _ = measure(
+            lambda: store.save_chunks(frame.iloc[start:start + chunk_size] for start in range(0, len(frame), chunk_size)),
+            args.repeat, prepare=lambda: store.clear_games() or ()
+        )
+        record('bulk_load', runs)
+        record('page_filtered', measure(query(genre=QUERY_GENRE, review_type=QUERY_REVIEW_TYPES), args.repeat)[1])
+        record('page_unfiltered', measure(query(count_mode='none'), args.repeat)[1])
+        record('search', measure(query(search=QUERY_SEARCH), args.repeat)[1])
+        record('dashboard_stats', measure(store.dashboard_stats, args.repeat)[1])
+        record('analysis_rows', measure(store.analysis_rows, args.repeat)[1])
+    finally:
+        cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10k,100k', help='Daftar ukuran dataset, mis. 10k,100k,1m')
+    parser.add_argument('--backends', default='sqlite,duckdb', help=f"Subset backend: {','.join(STORAGE_BACKENDS)}")
+    parser.add_argument('--repeat', type=int, default=3, help='Jumlah pengulangan; waktu terbaik yang dilaporkan')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--mysql-db', default='steam_bench_db', help='Database MySQL sementara (backend mysql)')
+    parser.add_argument('--keep-db', action='store_true', help='Jangan hapus database MySQL sementara')
+    parser.add_argument('--data-dir', default=None, help='Folder dataset sintetis (dipakai ulang antar run); default folder sementara')
+    parser.add_argument('--report', default=None, help='Path laporan JSON')
+    parser.add_argument('--baseline', default=None, help='Laporan JSON pembanding')
+    parser.add_argument('--tolerance', type=float, default=0.15, help='Batas perlambatan relatif sebelum dianggap regresi')
+    args = parser.parse_args()
+
+    backends = [backend.strip() for backend in args.backends.split(',') if backend.strip()]
+    for backend in backends:
+        if backend not in STORAGE_BACKENDS:
+            sys.exit(f"Backend tidak dikenal: {backend}")
+    if 'duckdb' in backends and not DUCKDB_AVAILABLE:
+        print("Paket duckdb tidak terpasang; backend duckdb dilewati.")
+        backends.remove('duckdb')
+
+    workdir = tempfile.mkdtemp(prefix='steam_storage_bench_')
+    data_dir = args.data_dir or workdir
+    results = {}
+    try:
+        for size in args.sizes.split(','):
+            size = size.strip().lower()
+            rows = parse_size(size)
+            records, message = parse_and_validate_data(write_dataset(data_dir, rows, args.seed, 'csv'), '.csv')
+            if records is None:
+                raise RuntimeError(message)
+            frame = records_to_frame(records)
+            del records
+            print(f"\n[{size}] {len(frame):,} baris bersih")
+            for backend in backends:
+                run_backend(args, backend, size, frame, results, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "suite": "storage_backends",
+        "created_at": datetime.datetime.now().isoformat(timespec='seconds'),
+        "environment": {
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": {"seed": args.seed, "repeat": args.repeat, "backends": backends},
+        "results": results,
+    }
+    if args.report:
+        with open(args.report, 'w') as report_file:
+            json.dump(report, report_file, indent=2)
+        print(f"\nLaporan ditulis ke {args.report}")
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare_with_baseline(results, json.load(baseline_file), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark melambat lebih dari {args.tolerance:.0%}: {', '.join(regressions)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/bench_training_scaling.py
+"""
+Benchmark skala waktu training RandomForest (train_classifier) terhadap jumlah core,
+pada dataset sintetis seukuran katalog Steam.
+
+Jalankan dari folder backend:
+    python benchmarks/bench_training_scaling.py --rows 80000
+    python benchmarks/bench_training_scaling.py --rows 80000 --cores 1,2,4,8,16,32 --cv-folds 5
+
+Tanpa MySQL: data dibuat di memori dengan steam_datagen.generate_clean_frame.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from steam_datagen import generate_clean_frame
+from data_processor.analyzer import prepare_analysis_frame, train_classifier
+from data_processor.tag_encoding import encode_tags
+
+
+def default_core_counts():
+    """1, 2, 4, ... sampai jumlah core mesin (jumlah core mesin selalu ikut diukur)."""
+    available = os.cpu_count() or 1
+    counts = []
+    cores = 1
+    while cores < available:
+        counts.append(cores)
+        cores *= 2
+    counts.append(available)
+    return counts
+
+
+def bench_training(df, tag_matrix, core_counts, cv_folds, repeat):
+    """Waktu terbaik dari `repeat` kali training untuk tiap jumlah core."""
+    results = {}
+    for cores in core_counts:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            _, _, error = train_classifier(df, tag_matrix=tag_matrix, n_jobs=cores, cv_folds=cv_folds)
+            elapsed = time.perf_counter() - start
+            if error:
+                raise RuntimeError(error)
+            best = elapsed if best is None else min(best, elapsed)
+        results[cores] = best
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=80000, help='Jumlah game sintetis (katalog Steam ~80 ribu)')
+    parser.add_argument('--cores', default=None, help='Daftar jumlah core, mis. 1,2,4,8 (default: 1,2,4,.. s/d semua core)')
+    parser.add_argument('--cv-folds', type=int, default=0, help='>= 2 untuk mengukur mode k-fold cross-validation')
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+
+    core_counts = [int(c) for c in args.cores.split(',')] if args.cores else default_core_counts()
+
+    df = prepare_analysis_frame(generate_clean_frame(args.rows))
+    tag_matrix = encode_tags(df['tags'])
+    mode = f"{args.cv_folds}-fold CV + final fit" if args.cv_folds >= 2 else "train/test split"
+    print(f"Rows: {len(df)}  CPU: {os.cpu_count()}  Mode: {mode}")
+
+    results = bench_training(df, tag_matrix, core_counts, args.cv_folds, args.repeat)
+    baseline = results[core_counts[0]]
+    print(f"\n  {'cores':>5}  {'waktu':>9}  {'speedup':>8}  {'efisiensi':>9}")
+    for cores, seconds in results.items():
+        speedup = baseline / seconds
+        print(f"  {cores:>5}  {seconds:8.2f}s  {speedup:7.2f}x  {speedup / cores * core_counts[0]:8.0%}")
+
+
+if __name__ == '__main__':
+    main()
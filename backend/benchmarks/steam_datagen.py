@@ -0,0 +1,215 @@
+# benchmarks/steam_datagen.py
+"""
+Generator dataset Steam sintetis (CSV/XLSX) dengan kolom dan kekotoran seperti file mentah:
+harga '$1,299.99' / 'Free to Play' / ' $4.99 ' / kosong, review_no '574,097 User Reviews' /
+'1 User Review' / 'No user reviews', tanggal 'Coming soon', tag dengan jumlah acak (0-20),
+spasi/koma berlebih dan tag ganda, serta deskripsi berisi koma, tanda kutip, dan baris baru.
+Hasilnya deterministik untuk kombinasi (rows, seed) yang sama. Satu-satunya generator data
+sintetis suite benchmark: generate_raw_frame untuk file mentah, generate_clean_frame untuk
+DataFrame bersih seperti keluaran parser (tanpa file/MySQL).
+
+Jalankan dari folder backend:
+    python benchmarks/steam_datagen.py --sizes 10k,100k,1m --out /tmp/steam_data
+    python benchmarks/steam_datagen.py --sizes 10k --formats csv,xlsx --out /tmp/steam_data
+"""
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bulk_loader import GAME_COLUMNS
+from data_processor.parser import clean_dataframe
+
+# Ukuran dataset standar suite benchmark
+SIZE_PRESETS = {'10k': 10000, '100k': 100000, '1m': 1000000}
+
+STEAM_TAGS = [
+    'Indie', 'Action', 'Casual', 'Adventure', 'Simulation', 'Strategy', 'RPG', 'Singleplayer',
+    'Early Access', 'Free to Play', '2D', 'Atmospheric', 'Puzzle', 'Multiplayer', 'Story Rich',
+    'Pixel Graphics', 'Sports', 'Racing', 'Fantasy', 'Open World', 'Sci-fi', 'Shooter',
+    'First-Person', 'Horror', 'Colorful', 'Great Soundtrack', 'Anime', 'Funny', 'Exploration',
+    'Platformer', 'Retro', 'Survival', 'Co-op', 'Difficult', 'Cute', 'Arcade', 'Massively Multiplayer',
+    'Turn-Based', 'Point & Click', 'Violent', 'Gore', 'Sandbox', 'Visual Novel', 'Rogue-like',
+    'Family Friendly', 'VR', 'Third Person', 'Physics', 'Relaxing', 'Psychological Horror',
+    'Tower Defense', 'Card Game', 'Management', 'Building', 'Stealth', 'Hack and Slash',
+    'Local Multiplayer', 'Military', 'Zombies', 'Sexual Content',
+]
+
+REVIEW_TYPES = ['Overwhelmingly Positive', 'Very Positive', 'Positive', 'Mostly Positive', 'Mixed',
+                'Mostly Negative', 'Negative', 'Very Negative', 'Overwhelmingly Negative']
+REVIEW_TYPE_WEIGHTS = [0.04, 0.22, 0.14, 0.18, 0.26, 0.09, 0.04, 0.02, 0.01]
+
+DESCRIPTION_SENTENCES = [
+    'Explore a vast world full of secrets',
+    'Fight, build, and survive with friends',
+    'A "cozy" farming sim, with a dark twist',
+    'Classic pixel-art platforming',
+    'Unlock 50+ weapons, skills and upgrades',
+    'Contains violence, blood and strong language',
+    'Café owners, pirates, and robots collide',
+    'Early Access: expect bugs\nand frequent updates',
+]
+
+RAW_COLUMNS = ['Unnamed: 0', 'Name', 'Price', 'Release_date', 'Review_no', 'Review_type',
+               'Tags', 'Description', 'Link']
+
+
+def parse_size(text):
+    """'10k' / '1m' / '25000' -> jumlah baris."""
+    text = text.strip().lower()
+    if text in SIZE_PRESETS:
+        return SIZE_PRESETS[text]
+    multiplier = {'k': 1000, 'm': 1000000}.get(text[-1:], 1)
+    return int(float(text.rstrip('km')) * multiplier)
+
+
+def _pick(rng, rows, values, weights):
+    return np.asarray(values, dtype=object)[rng.choice(len(values), size=rows, p=weights)]
+
+
+def _prices(rng, rows):
+    cents = np.round(rng.lognormal(mean=2.2, sigma=0.9, size=rows), 0) - 0.01
+    cents = np.clip(cents, 0.49, 1999.99)
+    prices = pd.Series(cents).map('${:,.2f}'.format).to_numpy(dtype=object)
+    kind = rng.random(rows)
+    prices[kind < 0.10] = 'Free to Play'
+    prices[(kind >= 0.10) & (kind < 0.12)] = 'Free'
+    padded = (kind >= 0.12) & (kind < 0.13)
+    prices[padded] = [f' {price} ' for price in prices[padded]]
+    prices[(kind >= 0.13) & (kind < 0.135)] = 'Prepurchase'
+    prices[(kind >= 0.135) & (kind < 0.14)] = None
+    return prices
+
+
+def _review_numbers(rng, rows):
+    counts = np.floor(rng.pareto(1.1, size=rows) * 20).astype(np.int64)
+    texts = pd.Series(counts).map('{:,} User Reviews'.format).to_numpy(dtype=object)
+    texts[counts == 1] = '1 User Review'
+    kind = rng.random(rows)
+    texts[kind < 0.05] = 'No user reviews'
+    plain = (kind >= 0.05) & (kind < 0.07)
+    texts[plain] = [f' {count} ' for count in counts[plain]]
+    texts[(kind >= 0.07) & (kind < 0.075)] = None
+    return texts
+
+
+def _release_dates(rng, rows):
+    # Format per hari unik (strftime per baris lambat untuk jutaan baris)
+    calendar = pd.date_range('2001-09-09', '2023-11-14', freq='D').strftime('%b %d, %Y').to_numpy(dtype=object)
+    dates = calendar[rng.integers(0, len(calendar), size=rows)]
+    kind = rng.random(rows)
+    dates[kind < 0.02] = 'Coming soon'
+    dates[(kind >= 0.02) & (kind < 0.03)] = None
+    return dates
+
+
+def _tags(rng, rows):
+    """Daftar tag dengan panjang acak, popularitas mirip Zipf, dan format yang tidak rapi."""
+    weights = 1.0 / np.arange(1, len(STEAM_TAGS) + 1) ** 0.9
+    counts = rng.integers(0, 21, size=rows)
+    counts[rng.random(rows) < 0.6] //= 3  # sebagian besar game hanya punya sedikit tag
+    flat = np.asarray(STEAM_TAGS, dtype=object)[rng.choice(len(STEAM_TAGS), size=int(counts.sum()), p=weights / weights.sum())]
+    separators = np.array([', ', ',', ' , ', ',  '], dtype=object)[rng.choice(4, size=rows, p=[0.85, 0.1, 0.03, 0.02])]
+    trailing = rng.random(rows) < 0.03
+    tags = np.empty(rows, dtype=object)
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    for i in range(rows):
+        if counts[i]:
+            text = separators[i].join(flat[offsets[i]:offsets[i + 1]])
+            tags[i] = text + ',' if trailing[i] else text
+    return tags
+
+
+def _descriptions(rng, rows):
+    templates = []
+    for _ in range(256):
+        sentences = rng.choice(DESCRIPTION_SENTENCES, size=rng.integers(1, 12))
+        templates.append('. '.join(sentences) + '.')
+    descriptions = np.asarray(templates, dtype=object)[rng.integers(0, len(templates), size=rows)]
+    descriptions[rng.random(rows) < 0.02] = None
+    return descriptions
+
+
+def generate_raw_frame(rows, seed=42):
+    """DataFrame mentah seperti file Steam (kolom RAW_COLUMNS, semua nilai sebagai teks)."""
+    rng = np.random.default_rng(seed)
+    ids = np.arange(rows)
+    names = pd.Series(ids).map('Game {}'.format).to_numpy(dtype=object)
+    special = rng.random(rows) < 0.01
+    names[special] = pd.Series(ids[special]).map('Café Simulator® {}'.format).to_numpy()
+    return pd.DataFrame({
+        'Unnamed: 0': ids,
+        'Name': names,
+        'Price': _prices(rng, rows),
+        'Release_date': _release_dates(rng, rows),
+        'Review_no': _review_numbers(rng, rows),
+        'Review_type': _pick(rng, rows, REVIEW_TYPES, REVIEW_TYPE_WEIGHTS),
+        'Tags': _tags(rng, rows),
+        'Description': _descriptions(rng, rows),
+        'Link': pd.Series(rng.integers(1, 2500000, size=rows)).map('https://store.steampowered.com/app/{}/'.format),
+    }, columns=RAW_COLUMNS)
+
+
+def generate_clean_frame(rows, seed=42):
+    """
+    DataFrame bersih seperti keluaran parser (kolom GAME_COLUMNS, tags kosong sebagai None):
+    generate_raw_frame yang dibersihkan clean_dataframe. Baris yang dibuang parser (tanggal
+    'Coming soon', nama/tanggal kosong) tidak ikut, sehingga jumlah barisnya sedikit < rows.
+    """
+    frame = clean_dataframe(generate_raw_frame(rows, seed))
+    return frame[GAME_COLUMNS].reset_index(drop=True)
+
+
+def dataset_path(directory, rows, seed, file_format):
+    return os.path.join(directory, f'steam_{rows}_seed{seed}.{file_format}')
+
+
+def write_dataset(directory, rows, seed=42, file_format='csv', frame=None):
+    """
+    Menulis dataset ke `directory` (nama file memuat rows dan seed) dan mengembalikan path-nya.
+    File yang sudah ada dipakai ulang karena isinya deterministik.
+    """
+    path = dataset_path(directory, rows, seed, file_format)
+    if os.path.exists(path):
+        return path
+    os.makedirs(directory, exist_ok=True)
+    if frame is None:
+        frame = generate_raw_frame(rows, seed)
+    # Ditulis ke nama sementara dulu agar file yang terpotong (proses dihentikan) tidak dipakai ulang
+    partial = os.path.join(directory, 'partial_' + os.path.basename(path))
+    if file_format == 'csv':
+        frame.to_csv(partial, index=False, encoding='latin-1', errors='replace')
+    elif file_format == 'xlsx':
+        frame.to_excel(partial, index=False, engine='openpyxl')
+    else:
+        raise ValueError(f"Format tidak didukung: {file_format}")
+    os.replace(partial, path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10k,100k,1m', help='Daftar ukuran, mis. 10k,100k,1m atau 25000')
+    parser.add_argument('--formats', default='csv', help='csv, xlsx, atau csv,xlsx')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', required=True, help='Folder tujuan')
+    args = parser.parse_args()
+
+    for size in args.sizes.split(','):
+        rows = parse_size(size)
+        frame = None
+        for file_format in args.formats.split(','):
+            start = time.perf_counter()
+            if frame is None and not os.path.exists(dataset_path(args.out, rows, args.seed, file_format)):
+                frame = generate_raw_frame(rows, args.seed)
+            path = write_dataset(args.out, rows, args.seed, file_format, frame=frame)
+            print(f"{path}: {os.path.getsize(path) / 2**20:.1f} MiB ({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
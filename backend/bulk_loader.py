@@ -0,0 +1,170 @@
+# bulk_loader.py
+
+import math
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+import mysql.connector
+
+# Urutan kolom tabel games yang diisi saat upload
+GAME_COLUMNS = ['name', 'price', 'release_date', 'review_no', 'review_type', 'tags', 'description']
+
+# Ukuran batch jalur lama (executemany per 100 baris), dipertahankan untuk pembanding benchmark
+LEGACY_BATCH_SIZE = 100
+
+# Sisa ruang paket untuk teks SQL di luar nilai (nama kolom, tanda kurung, escape)
+PACKET_SAFETY_RATIO = 0.8
+ROW_OVERHEAD_BYTES = 64
+
+BULK_LOAD_METHODS = ('multirow', 'infile', 'executemany')
+
+
+def clean_nan_to_none(value):
+    """Mengubah nilai NaN dari Pandas menjadi None yang diterima MySQL (NULL) untuk menghindari Error 1054."""
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def _insert_prefix(table):
+    return f"INSERT INTO {table} ({', '.join(GAME_COLUMNS)}) VALUES "
+
+
+def frame_to_rows(df):
+    """
+    Konversi DataFrame ke list of tuples dengan NaN -> None secara vektorisasi
+    (satu operasi where() per frame, bukan clean_nan_to_none per sel).
+    """
+    frame = df.reindex(columns=GAME_COLUMNS)
+    frame = frame.astype(object).where(frame.notna(), None)
+    return list(frame.itertuples(index=False, name=None))
+
+
+def _estimate_row_bytes(df):
+    """Perkiraan ukuran setiap baris dalam statement SQL (vektorisasi per kolom)."""
+    sizes = np.full(len(df), ROW_OVERHEAD_BYTES, dtype=np.int64)
+    for col in GAME_COLUMNS:
+        if col not in df.columns:
+            continue
+        lengths = df[col].astype(str).str.len().to_numpy(dtype=np.int64, na_value=4)
+        # Kemungkinan karakter multibyte / escape dihitung dua kali lipat
+        sizes += lengths * 2 + 4
+    return sizes
+
+
+def get_max_allowed_packet(cursor):
+    cursor.execute("SELECT @@max_allowed_packet")
+    return int(cursor.fetchone()[0])
+
+
+def insert_executemany(cursor, df, table='games'):
+    """Jalur lama: konversi per sel lewat clean_nan_to_none dan executemany per 100 baris."""
+    data = df.to_dict('records')
+    values = [tuple(clean_nan_to_none(d.get(col)) for col in GAME_COLUMNS) for d in data]
+    query = _insert_prefix(table) + "(" + ", ".join(["%s"] * len(GAME_COLUMNS)) + ")"
+
+    inserted_count = 0
+    for start_index in range(0, len(values), LEGACY_BATCH_SIZE):
+        batch_values = values[start_index:start_index + LEGACY_BATCH_SIZE]
+        cursor.executemany(query, batch_values)
+        inserted_count += len(batch_values)
+    return inserted_count
+
+
+def insert_multirow(cursor, df, table='games', max_allowed_packet=None):
+    """
+    INSERT multi-row: satu statement VALUES (...), (...), ... sebesar mungkin
+    tanpa melewati max_allowed_packet server.
+    """
+    if df.empty:
+        return 0
+    if max_allowed_packet is None:
+        max_allowed_packet = get_max_allowed_packet(cursor)
+
+    budget = int(max_allowed_packet * PACKET_SAFETY_RATIO)
+    row_bytes = _estimate_row_bytes(df)
+    # Nomor grup statement dari jumlah kumulatif ukuran baris
+    group_ids = (np.cumsum(row_bytes) // max(budget, 1)).astype(np.int64)
+    boundaries = np.flatnonzero(np.diff(group_ids)) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(df)]))
+
+    rows = frame_to_rows(df)
+    row_placeholder = "(" + ", ".join(["%s"] * len(GAME_COLUMNS)) + ")"
+    prefix = _insert_prefix(table)
+
+    inserted_count = 0
+    for start_index, end_index in zip(starts, ends):
+        batch = rows[start_index:end_index]
+        query = prefix + ", ".join([row_placeholder] * len(batch))
+        params = [value for row in batch for value in row]
+        cursor.execute(query, params)
+        inserted_count += len(batch)
+    return inserted_count
+
+
+def _escape_tsv_column(series):
+    """Escape sesuai default LOAD DATA (ESCAPED BY '\\\\'), NULL menjadi \\N."""
+    text = series.astype(str)
+    text = (text.str.replace('\\', '\\\\', regex=False)
+                .str.replace('\t', '\\t', regex=False)
+                .str.replace('\n', '\\n', regex=False)
+                .str.replace('\r', '\\r', regex=False))
+    return text.where(series.notna(), '\\N')
+
+
+def write_tsv(df, file_obj):
+    """Menulis DataFrame sebagai TSV siap LOAD DATA (tanpa header)."""
+    frame = df.reindex(columns=GAME_COLUMNS)
+    columns = [_escape_tsv_column(frame[col]) for col in GAME_COLUMNS]
+    lines = columns[0].str.cat(columns[1:], sep='\t')
+    if len(lines):
+        file_obj.write('\n'.join(lines.tolist()))
+        file_obj.write('\n')
+    return len(lines)
+
+
+def insert_load_data(cursor, df, table='games'):
+    """
+    LOAD DATA LOCAL INFILE dari file TSV sementara.
+    Memerlukan allow_local_infile=True di koneksi dan local_infile=ON di server.
+    """
+    if df.empty:
+        return 0
+    fd, tsv_path = tempfile.mkstemp(prefix='games_bulk_', suffix='.tsv')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as tsv_file:
+            row_count = write_tsv(df, tsv_file)
+        cursor.execute(
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} "
+            "CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+            "LINES TERMINATED BY '\\n' "
+            f"({', '.join(GAME_COLUMNS)})",
+            (tsv_path,)
+        )
+        return row_count
+    finally:
+        os.remove(tsv_path)
+
+
+def bulk_insert_frame(cursor, df, method='multirow', table='games', max_allowed_packet=None):
+    """
+    Menyimpan satu DataFrame bersih dengan metode bulk yang dipilih.
+    Jika LOAD DATA ditolak server (local_infile mati), otomatis jatuh ke multi-row INSERT.
+    """
+    if method == 'infile':
+        try:
+            return insert_load_data(cursor, df, table=table)
+        except mysql.connector.Error as err:
+            print(f"LOAD DATA LOCAL INFILE gagal, beralih ke multi-row INSERT: {err}")
+            return insert_multirow(cursor, df, table=table, max_allowed_packet=max_allowed_packet)
+    if method == 'executemany':
+        return insert_executemany(cursor, df, table=table)
+    return insert_multirow(cursor, df, table=table, max_allowed_packet=max_allowed_packet)
+
+
+def records_to_frame(data):
+    """Konversi list of dicts (format lama save_data_to_db) menjadi DataFrame."""
+    return pd.DataFrame(list(data), columns=GAME_COLUMNS)
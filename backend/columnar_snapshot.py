@@ -0,0 +1,175 @@
+# columnar_snapshot.py
+
+# Snapshot kolumnar (Arrow IPC, tanpa kompresi) dari kolom analisis tabel games di disk.
+# File di-memory-map saat dibaca sehingga kolom numerik dimuat nyaris tanpa salinan, dan
+# beberapa worker proses berbagi satu salinan di page cache. Snapshot dibuat ulang saat
+# versi dataset berubah, atau hanya ditambah baris baru jika perubahan sejak snapshot
+# terakhir bersifat append-only (rewrite_version sama, lihat dataset_version.py).
+# Id auto-increment bisa di-commit tidak berurutan (upload panjang memesan id kecil, add_game
+# meng-commit id lebih besar lebih dulu), sehingga baris baru tidak selalu berada di atas
+# max_id snapshot. Jumlah baris tambahan dicocokkan dengan selisih rows_changed versi dataset;
+# jika berbeda, snapshot dibangun ulang penuh.
+
+import os
+import threading
+import uuid
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+except ImportError:  # pyarrow opsional; tanpa pyarrow analisis membaca langsung dari MySQL
+    pa = None
+    ipc = None
+
+SNAPSHOT_PREFIX = 'games_'
+SNAPSHOT_SUFFIX = '.arrow'
+
+# Kolom yang dikonversi kembali ke categorical saat dimuat (disimpan sebagai string agar
+# snapshot lama dan baris tambahan bisa digabung tanpa menyatukan dictionary Arrow)
+CATEGORICAL_COLUMNS = ['review_type']
+
+
+def snapshot_supported():
+    return pa is not None
+
+
+def _read_table(path):
+    # Tanpa `with`: buffer tabel tetap mereferensikan memory map selama tabel dipakai
+    source = pa.memory_map(path, 'r')
+    return ipc.open_file(source).read_all()
+
+
+def _table_metadata(table):
+    raw = table.schema.metadata or {}
+    return {key.decode(): value.decode() for key, value in raw.items()}
+
+
+def _frame_to_table(df):
+    df = df.copy()
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('string')
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+class ColumnarSnapshot:
+    """Snapshot Arrow per versi dataset dengan load memory-mapped dan pembaruan append-only."""
+
+    def __init__(self, snapshot_dir):
+        self.snapshot_dir = snapshot_dir
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._current = (None, None)  # (token versi, pyarrow.Table)
+        self._stats = {"hits": 0, "loads": 0, "builds": 0, "appends": 0, "rows_appended": 0}
+
+    def _path(self, token):
+        return os.path.join(self.snapshot_dir, f"{SNAPSHOT_PREFIX}{token}{SNAPSHOT_SUFFIX}")
+
+    def _snapshot_files(self):
+        try:
+            names = os.listdir(self.snapshot_dir)
+        except OSError:
+            return []
+        return [
+            os.path.join(self.snapshot_dir, name) for name in names
+            if name.startswith(SNAPSHOT_PREFIX) and name.endswith(SNAPSHOT_SUFFIX)
+        ]
+
+    def _find_appendable(self, version):
+        """Snapshot lama yang bisa ditambah baris baru untuk mencapai `version`, atau None."""
+        for path in sorted(self._snapshot_files(), key=os.path.getmtime, reverse=True):
+            try:
+                table = _read_table(path)
+            except (OSError, pa.ArrowInvalid):
+                continue
+            meta = _table_metadata(table)
+            if (meta.get('epoch') == str(version['epoch'])
+                    and 'rows_changed' in meta
+                    and int(meta.get('rewrite_version', -1)) == version['rewrite_version']
+                    and int(meta.get('version', 0)) <= version['version']):
+                return table, meta
+        return None
+
+    def _write(self, table, version, max_id):
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        table = table.replace_schema_metadata({
+            'epoch': str(version['epoch']),
+            'version': str(version['version']),
+            'rewrite_version': str(version['rewrite_version']),
+            'rows_changed': str(version['rows_changed']),
+            'max_id': str(max_id),
+        })
+        path = self._path(version['token'])
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        # Rename atomik agar worker lain tidak membaca file setengah jadi
+        os.replace(tmp_path, path)
+        for other in self._snapshot_files():
+            if other != path:
+                try:
+                    os.remove(other)
+                except OSError:
+                    pass
+        return path
+
+    def get_table(self, version, fetch_rows):
+        """
+        Tabel Arrow untuk `version` (dict dari get_dataset_version). `fetch_rows(after_id)`
+        mengembalikan DataFrame baris games dengan id > after_id (0 = semua baris).
+        """
+        token = version['token']
+        with self._lock:
+            if self._current[0] == token:
+                self._stats["hits"] += 1
+                return self._current[1]
+
+        # Satu build per proses; proses lain yang membangun bersamaan cukup saling menimpa file
+        with self._build_lock:
+            with self._lock:
+                if self._current[0] == token:
+                    self._stats["hits"] += 1
+                    return self._current[1]
+
+            path = self._path(token)
+            if os.path.exists(path):
+                stat_key = "loads"
+            else:
+                base = self._find_appendable(version)
+                new_rows = fetch_rows(int(base[1].get('max_id', 0))) if base is not None else None
+                # Snapshot dengan kolom berbeda (mis. sebelum kolom analisis ditambah) dibangun ulang,
+                # begitu pula jika ada baris append yang di-commit dengan id <= max_id snapshot
+                if (base is not None and list(new_rows.columns) == base[0].schema.names
+                        and len(new_rows) == version['rows_changed'] - int(base[1]['rows_changed'])):
+                    base_table, meta = base
+                    max_id = int(meta.get('max_id', 0))
+                    table = base_table
+                    if len(new_rows):
+                        new_table = _frame_to_table(new_rows).cast(base_table.schema.remove_metadata())
+                        table = pa.concat_tables([base_table.replace_schema_metadata(None), new_table])
+                        max_id = max(max_id, int(new_rows['id'].max()))
+                    self._stats["rows_appended"] += len(new_rows)
+                    stat_key = "appends"
+                else:
+                    df = fetch_rows(0)
+                    table = _frame_to_table(df)
+                    max_id = int(df['id'].max()) if len(df) else 0
+                    stat_key = "builds"
+                path = self._write(table, version, max_id)
+
+            # Dibaca ulang dari memory map agar memori proses berbagi page cache dengan worker lain
+            table = _read_table(path)
+            with self._lock:
+                self._current = (token, table)
+                self._stats[stat_key] += 1
+            return table
+
+    def load_frame(self, version, fetch_rows):
+        """DataFrame analisis dari snapshot (kolom kategori dikembalikan ke categorical)."""
+        table = self.get_table(version, fetch_rows)
+        return table.to_pandas(categories=[c for c in CATEGORICAL_COLUMNS if c in table.column_names])
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, version=self._current[0], snapshot_dir=self.snapshot_dir)
@@ -1,3 +1,9 @@
+import os
+
+# Folder backend; path file dan folder di bawah di-resolve terhadap folder ini, bukan working directory
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
 class Config:
     # Ganti dengan kredensial MySQL Anda
     MYSQL_HOST = 'localhost'
@@ -5,5 +11,53 @@ class Config:
     MYSQL_PASSWORD = '' 
     MYSQL_DB = 'steam_analysis_db'
     
+    # Pengaturan Backend Penyimpanan
+    STORAGE_BACKEND = 'mysql'     # 'mysql' (server MySQL di atas), 'sqlite' (file lokal tanpa server), 'duckdb' (kolumnar, pip install duckdb)
+    EMBEDDED_DB_PATH = os.path.join(BACKEND_DIR, 'data', 'veritas.db')  # File database untuk 'sqlite'/'duckdb', ':memory:' untuk sementara
+
     # Pengaturan Flask
-    SECRET_KEY = 'super_secret_key' # Ganti dengan kunci rahasia yang kuat
\ No newline at end of file
+    SECRET_KEY = 'super_secret_key' # Ganti dengan kunci rahasia yang kuat
+
+    # Pengaturan Connection Pool MySQL
+    MYSQL_POOL_SIZE = 5           # Jumlah koneksi idle yang dipertahankan
+    MYSQL_POOL_MAX_OVERFLOW = 10  # Koneksi tambahan sementara saat beban puncak
+    MYSQL_POOL_TIMEOUT = 10       # Detik menunggu koneksi bebas sebelum gagal
+    MYSQL_POOL_RECYCLE = 1800     # Umur maksimum koneksi (detik), 0 = tidak pernah di-recycle
+    MYSQL_POOL_PRE_PING = True    # Health-check (ping) setiap kali koneksi dipinjam
+
+    # Pengaturan Upload Dataset
+    UPLOAD_CHUNK_SIZE = 50000     # Baris per chunk saat parsing streaming (membatasi memori puncak)
+    CSV_PARSER_ENGINE = 'auto'    # 'auto' (pyarrow jika terpasang, selain itu C; engine python hanya untuk blok rusak), 'pyarrow', 'c', 'python' (jalur lama)
+    BULK_LOAD_METHOD = 'multirow' # 'multirow' (INSERT sebesar max_allowed_packet), 'infile' (LOAD DATA LOCAL INFILE), 'executemany' (jalur lama)
+    MYSQL_ALLOW_LOCAL_INFILE = False  # Set True (dan local_infile=ON di server) untuk BULK_LOAD_METHOD = 'infile'
+    UPLOAD_JOB_WORKERS = 2        # Jumlah job upload yang diproses paralel di background
+    UPLOAD_JOB_HISTORY = 50       # Jumlah job selesai yang disimpan untuk polling status
+    UPLOAD_DEDUP_MODE = 'upsert'  # 'upsert' (upload ulang meng-update game dengan nama + release_date sama) atau 'append' (selalu insert)
+
+    # Pengaturan Cache
+    TAG_CACHE_TTL = 300           # Detik; batas umur cache tag agar perubahan dari worker lain terlihat
+    COUNT_CACHE_TTL = 60          # Detik; umur cache total record per kombinasi filter (count=cached)
+    COUNT_CACHE_MAX_ENTRIES = 256 # Jumlah kombinasi filter yang disimpan
+
+    # Pengaturan Pencarian
+    SEARCH_MODE = 'fulltext'      # 'fulltext' (index FULLTEXT + ranking relevansi) atau 'like' (jalur lama)
+
+    # Pengaturan Dashboard & Analitik
+    DASHBOARD_CACHE_PERSIST = True    # Simpan hasil dashboard ke disk agar restart tidak memaksa hitung ulang
+    DASHBOARD_CACHE_DIR = os.path.join(BACKEND_DIR, 'cache')  # Folder cache dashboard di disk
+    DASHBOARD_AGGREGATION = 'sql'     # 'sql' (agregat berjalan di MySQL) atau 'pandas' (muat kolom analisis ke DataFrame)
+    ANALYTICS_SNAPSHOT = True         # Analisis pandas & training membaca snapshot Arrow di disk (butuh pyarrow)
+    ANALYTICS_SNAPSHOT_DIR = os.path.join(BACKEND_DIR, 'cache', 'snapshots')  # Folder snapshot kolumnar
+
+    # Pengaturan Model Klasifikasi
+    MODEL_DIR = os.path.join(BACKEND_DIR, 'models')  # Folder registry model
+    MODEL_KEEP = 3                        # Jumlah model terakhir yang disimpan di disk
+    MODEL_RETRAIN_MIN_CHANGE_RATIO = 0.05 # Latih ulang jika baris yang berubah >= 5% dari data training
+    CLASSIFIER_N_JOBS = -1                # Core untuk training RandomForest (-1 = semua core, 1 = satu core)
+    CLASSIFIER_CV_FOLDS = 0               # >= 2 mengaktifkan k-fold cross-validation paralel (0 = nonaktif)
+    CLASSIFIER_MAX_TRAINING_ROWS = 200000 # Row budget training; di atasnya memakai sampel terstratifikasi (0 = seluruh data)
+    PREDICT_MAX_ROWS = 200000             # Batas baris per request /api/predict (JSON atau file)
+
+    # Pengaturan Monitoring
+    METRICS_PROFILE_ENABLED = True    # Izinkan ?profile=1 / ?profile=memory (rincian tahap di respons JSON)
+    METRICS_TRACE_MEMORY = False      # tracemalloc selalu aktif untuk puncak memori per tahap di /metrics (lebih lambat)
@@ -0,0 +1,121 @@
+# dashboard_cache.py
+
+import json
+import os
+import threading
+import numpy as np
+
+
+class _Flight:
+    """Satu komputasi yang sedang berjalan; request lain untuk versi yang sama menunggu di sini."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def _json_default(value):
+    # Nilai numpy (np.int64, np.float64, ndarray) dari pandas/sklearn
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class DashboardCache:
+    """
+    Cache payload /api/dashboard-stats yang dikunci dengan token versi dataset.
+
+    - Nilai adalah objek JSON (dict); hasil di memori sama dengan hasil yang dibaca dari disk.
+    - Hanya hasil untuk versi terbaru yang disimpan (di memori dan opsional di disk).
+    - Request bersamaan saat komputasi berjalan menunggu satu komputasi yang sama (single-flight).
+    """
+
+    def __init__(self, cache_dir=None, name='dashboard'):
+        self.cache_dir = cache_dir
+        self.name = name
+        self._version = None
+        self._value = None
+        self._flights = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "disk_hits": 0, "computes": 0, "waits": 0}
+
+    def _path(self, version):
+        return os.path.join(self.cache_dir, f"{self.name}_{version}.json")
+
+    def _load_from_disk(self, version):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(version), encoding='utf-8') as cache_file:
+                value = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        # File dengan format lain (mis. dari versi lama) dianggap miss dan dihitung ulang
+        return value if isinstance(value, dict) else None
+
+    def _save_to_disk(self, version, value):
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = self._path(version) + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(value, cache_file, default=_json_default)
+            # Rename atomik agar worker lain tidak membaca file setengah jadi
+            os.replace(tmp_path, self._path(version))
+            for filename in os.listdir(self.cache_dir):
+                if filename.startswith(f"{self.name}_") and filename != os.path.basename(self._path(version)):
+                    os.remove(os.path.join(self.cache_dir, filename))
+        except OSError as e:
+            print(f"Gagal menyimpan cache {self.name} ke disk: {e}")
+
+    def get_or_compute(self, version, compute):
+        """Mengembalikan nilai untuk `version`, memanggil compute() paling banyak sekali per versi."""
+        with self._lock:
+            if self._version == version:
+                self._stats["hits"] += 1
+                return self._value
+            flight = self._flights.get(version)
+            owner = flight is None
+            if owner:
+                flight = self._flights[version] = _Flight()
+            else:
+                self._stats["waits"] += 1
+
+        if not owner:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            value = self._load_from_disk(version)
+            with self._lock:
+                self._stats["disk_hits" if value is not None else "computes"] += 1
+            if value is None:
+                value = compute()
+                self._save_to_disk(version, value)
+            # Round-trip JSON agar hasil memori sama persis dengan hasil yang dibaca dari disk
+            value = json.loads(json.dumps(value, default=_json_default))
+            flight.result = value
+            with self._lock:
+                self._version, self._value = version, value
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(version, None)
+            flight.done.set()
+        return value
+
+    def invalidate(self):
+        with self._lock:
+            self._version, self._value = None, None
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, cached_version=self._version)
@@ -0,0 +1,229 @@
+# dashboard_stats.py
+
+# Statistik dashboard dari agregat berjalan (running aggregates) di MySQL yang dapat digabung:
+# jumlah, jumlah kuadrat, dan hasil kali silang price/review_no/review_score, jumlah per
+# review_type, serta jumlah game dan total skor per tag. Setiap insert/edit/delete menambahkan
+# atau mengurangi kontribusi barisnya dalam transaksi yang sama, sehingga dashboard dibaca
+# dalam O(1) tanpa memindai tabel games. Hanya baris yang lolos prepare_analysis_frame
+# (price, review_no, dan review_score tersimpan tidak NULL) yang dihitung.
+
+from decimal import Decimal, localcontext
+
+# Jumlah genre teratas pada distribusi dan rata-rata skor (sama dengan GENRE_STATS_TOP_N)
+GENRE_TOP_N = 10
+
+# Kolom jumlahan pada tabel dashboard_aggregates dan ekspresi kontribusi per baris
+SUM_COLUMNS = {
+    'game_count': '1',
+    'sum_price': 'price',
+    'sum_review_no': 'review_no',
+    'sum_score': 'review_score',
+    'sum_price_sq': 'price * price',
+    'sum_review_no_sq': 'review_no * review_no',
+    'sum_score_sq': 'review_score * review_score',
+    'sum_price_score': 'price * review_score',
+    'sum_review_no_score': 'review_no * review_score',
+}
+
+# Jumlah tag per statement UPDATE saat delta statistik tag diterapkan
+TAG_DELTA_BATCH_SIZE = 1000
+
+def analysis_filter():
+    """
+    Klausa WHERE yang setara dengan prepare_analysis_frame (dropna setelah pemetaan skor),
+    memakai kolom turunan review_score yang sudah tersimpan (lihat derived_columns.py).
+    """
+    return "price IS NOT NULL AND review_no IS NOT NULL AND review_score IS NOT NULL", []
+
+
+def pearson_from_sums(n, sum_x, sum_y, sum_xx, sum_yy, sum_xy):
+    """
+    Korelasi Pearson dari sufficient statistics. Untuk kolom DECIMAL/INT jumlahan dari MySQL
+    sudah eksak, sehingga selisih n*Sxx - Sx^2 dihitung dengan Decimal presisi tinggi.
+    Mengembalikan None jika salah satu variabel tidak bervariasi.
+    """
+    with localcontext() as ctx:
+        ctx.prec = 60
+        n, sum_x, sum_y, sum_xx, sum_yy, sum_xy = (
+            Decimal(value) for value in (n, sum_x, sum_y, sum_xx, sum_yy, sum_xy)
+        )
+        covariance = n * sum_xy - sum_x * sum_y
+        variance_x = n * sum_xx - sum_x * sum_x
+        variance_y = n * sum_yy - sum_y * sum_y
+        if variance_x <= 0 or variance_y <= 0:
+            return None
+        return float(covariance / (variance_x * variance_y).sqrt())
+
+
+def merge_games(cursor, where, params, sign=1, lock=True):
+    """
+    Menambahkan (sign=1) atau mengurangkan (sign=-1) kontribusi game yang cocok dengan
+    klausa `where` ke semua agregat. Dipanggil setelah baris (dan tag-nya) di-insert, atau
+    sebelum baris dihapus/diubah, di dalam transaksi penulisan yang sama.
+    MIN/MAX harga tidak bisa dikurangkan: jika baris yang dihapus berada di batas rentang,
+    rentang ditandai stale dan dihitung ulang saat dibaca.
+
+    Delta dihitung dengan SELECT lalu diterapkan sebagai nilai literal, sehingga mode baca
+    menentukan baris mana yang terhitung:
+      - lock=True : locking read (FOR UPDATE) atas versi terbaru baris; untuk game yang sudah
+                    ada dan akan diubah/dihapus (id eksplisit).
+      - lock=False: consistent read pada snapshot transaksi; untuk rentang "id > id_awal" hasil
+                    insert transaksi ini. Baris transaksi lain yang di-commit setelah snapshot
+                    (dan menambahkan kontribusinya sendiri) tidak ikut terhitung. Snapshot harus
+                    diambil sebelum id_awal dibaca (lihat MySQLGameStore._begin_snapshot).
+    """
+    analysis_where, analysis_params = analysis_filter()
+    games_where = f"({where}) AND {analysis_where}"
+    games_params = list(params) + analysis_params
+    locking = " FOR UPDATE" if lock else ""
+
+    sums_select = ', '.join(f"COALESCE(SUM({expr}), 0)" for expr in SUM_COLUMNS.values())
+    cursor.execute(
+        f"SELECT {sums_select}, MIN(price), MAX(price) FROM games WHERE {games_where}{locking}",
+        games_params
+    )
+    *sums, min_price, max_price = cursor.fetchone()
+    if not sums[0]:
+        return
+
+    sums_update = ', '.join(f"{col} = {col} + %s" for col in SUM_COLUMNS)
+    if sign > 0:
+        range_update = (
+            "min_price = IF(min_price IS NULL, %s, LEAST(min_price, %s)), "
+            "max_price = IF(max_price IS NULL, %s, GREATEST(max_price, %s))"
+        )
+        range_params = [min_price, min_price, max_price, max_price]
+    else:
+        range_update = "minmax_stale = minmax_stale OR COALESCE(%s <= min_price OR %s >= max_price, 1)"
+        range_params = [min_price, max_price]
+    cursor.execute(
+        f"UPDATE dashboard_aggregates SET {sums_update}, {range_update} WHERE id = 1",
+        [sign * value for value in sums] + range_params
+    )
+
+    cursor.execute(
+        f"SELECT review_type, COUNT(*) FROM games WHERE {games_where} GROUP BY review_type{locking}",
+        games_params
+    )
+    review_rows = [(review_type, sign * int(count)) for review_type, count in cursor.fetchall()]
+    cursor.execute(
+        "INSERT INTO review_type_counts (review_type, game_count) "
+        f"SELECT review_type, delta FROM ({_rows_select(('review_type', 'delta'), len(review_rows))}) d "
+        "ON DUPLICATE KEY UPDATE game_count = review_type_counts.game_count + d.delta",
+        [value for row in review_rows for value in row]
+    )
+
+    cursor.execute(
+        "SELECT gt.tag_id, COUNT(*), SUM(review_score) "
+        "FROM game_tags gt JOIN games ON games.id = gt.game_id "
+        f"WHERE {games_where} GROUP BY gt.tag_id{locking}",
+        games_params
+    )
+    tag_rows = cursor.fetchall()
+    for start in range(0, len(tag_rows), TAG_DELTA_BATCH_SIZE):
+        batch = tag_rows[start:start + TAG_DELTA_BATCH_SIZE]
+        cursor.execute(
+            f"UPDATE tags t JOIN ({_rows_select(('tag_id', 'count_delta', 'score_delta'), len(batch))}) d "
+            "ON d.tag_id = t.id "
+            "SET t.stats_count = t.stats_count + d.count_delta, t.score_sum = t.score_sum + d.score_delta",
+            [value for tag_id, count, score_sum in batch
+             for value in (tag_id, sign * int(count), sign * int(score_sum))]
+        )
+
+
+def _rows_select(columns, row_count):
+    """
+    SELECT ... UNION ALL ... berisi `row_count` baris parameter dengan nama kolom `columns`.
+    Dipakai sebagai derived table pengganti VALUES ROW(...) / INSERT ... AS alias yang baru
+    ada sejak MySQL 8.0.19, sehingga berjalan juga di MySQL 5.7 dan MariaDB.
+    """
+    first = "SELECT " + ', '.join(f"%s AS {col}" for col in columns)
+    rest = " UNION ALL SELECT " + ', '.join(['%s'] * len(columns))
+    return first + rest * (row_count - 1)
+
+
+def reset_dashboard_aggregates(cursor):
+    """Mengosongkan semua agregat (dipakai saat tabel games dikosongkan)."""
+    sums_reset = ', '.join(f"{col} = 0" for col in SUM_COLUMNS)
+    cursor.execute(
+        f"UPDATE dashboard_aggregates SET {sums_reset}, min_price = NULL, max_price = NULL, minmax_stale = 0 WHERE id = 1"
+    )
+    cursor.execute("DELETE FROM review_type_counts")
+    cursor.execute("UPDATE tags SET stats_count = 0, score_sum = 0")
+
+
+def rebuild_dashboard_aggregates(cursor):
+    """Menghitung ulang semua agregat dari tabel games (backfill awal / perbaikan)."""
+    reset_dashboard_aggregates(cursor)
+    merge_games(cursor, "1=1", [], sign=1, lock=False)
+
+
+def _refresh_price_range(cursor):
+    """Menghitung ulang MIN/MAX harga setelah baris di batas rentang dihapus."""
+    analysis_where, analysis_params = analysis_filter()
+    cursor.execute(f"SELECT MIN(price), MAX(price) FROM games WHERE {analysis_where}", analysis_params)
+    min_price, max_price = cursor.fetchone()
+    cursor.execute(
+        "UPDATE dashboard_aggregates SET min_price = %s, max_price = %s, minmax_stale = 0 WHERE id = 1",
+        (min_price, max_price)
+    )
+    return min_price, max_price
+
+
+def fetch_dashboard_stats(cursor):
+    """
+    Statistik lengkap dashboard (struktur sama seperti calculate_dashboard_stats) dari agregat
+    berjalan. Dapat menulis ulang rentang harga yang stale, jadi pemanggil perlu commit.
+    """
+    columns = list(SUM_COLUMNS) + ['min_price', 'max_price', 'minmax_stale']
+    cursor.execute(f"SELECT {', '.join(columns)} FROM dashboard_aggregates WHERE id = 1")
+    row = cursor.fetchone()
+    aggregates = dict(zip(columns, row)) if row else {col: 0 for col in columns}
+
+    total = int(aggregates['game_count'] or 0)
+    min_price, max_price = aggregates['min_price'], aggregates['max_price']
+    if total > 0 and aggregates['minmax_stale']:
+        min_price, max_price = _refresh_price_range(cursor)
+
+    cursor.execute(
+        "SELECT review_type, game_count FROM review_type_counts WHERE game_count > 0 "
+        "ORDER BY game_count DESC, review_type"
+    )
+    review_distribution = {review_type: int(count) for review_type, count in cursor.fetchall()}
+
+    descriptive_stats = {
+        "total_games": total,
+        "avg_review_no": round(float(aggregates['sum_review_no']) / total, 2) if total else 0,
+        "price_range": f"${float(min_price or 0):.2f} - ${float(max_price or 0):.2f}",
+        "review_distribution": review_distribution,
+    }
+
+    correlation_results = {}
+    if total > 1:
+        correlations = {
+            'price_vs_review_score': ('sum_price', 'sum_price_sq', 'sum_price_score'),
+            'review_no_vs_review_score': ('sum_review_no', 'sum_review_no_sq', 'sum_review_no_score'),
+        }
+        for key, (sum_x, sum_xx, sum_xy) in correlations.items():
+            value = pearson_from_sums(
+                total, aggregates[sum_x], aggregates['sum_score'],
+                aggregates[sum_xx], aggregates['sum_score_sq'], aggregates[sum_xy]
+            )
+            correlation_results[key] = round(value, 4) if value is not None else None
+
+    genre_data = {"distribution": {}, "avg_score": {}}
+    if total > 0:
+        cursor.execute(
+            "SELECT name, stats_count, score_sum FROM tags WHERE stats_count > 0 "
+            "ORDER BY stats_count DESC, name LIMIT %s",
+            (GENRE_TOP_N,)
+        )
+        for name, count, score_sum in cursor.fetchall():
+            genre_data["distribution"][name] = int(count)
+            genre_data["avg_score"][name] = round(float(score_sum) / int(count), 4)
+
+    return {
+        "descriptive_stats": descriptive_stats,
+        "correlation_results": correlation_results,
+        "genre_data": genre_data,
+    }
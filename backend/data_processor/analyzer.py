@@ -2,11 +2,13 @@
 
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import train_test_split, StratifiedKFold, cross_validate
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import MinMaxScaler
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, confusion_matrix
 import traceback # NEW: Untuk menangkap detail error
+from .tag_encoding import encode_tags
+from metrics import stage, timed
 
 # Mapping Review_type ke skor numerik (diperlukan untuk perhitungan korelasi)
 REVIEW_SCORE_MAP = {
@@ -19,59 +21,108 @@ REVIEW_SCORE_MAP = {
     'Very Negative': 1
 }
 
-def run_classification(df_clean: pd.DataFrame):
+# Jumlah tag teratas yang dipakai sebagai fitur klasifikasi dan statistik genre (None = semua tag)
+CLASSIFIER_TAG_FEATURES = 10
+GENRE_STATS_TOP_N = 10
+
+# Metrik cross-validation: nama di hasil -> scorer sklearn (weighted, sama dengan evaluasi split tunggal)
+CV_SCORING = {
+    "Accuracy": 'accuracy',
+    "Precision": 'precision_weighted',
+    "Recall": 'recall_weighted',
+    "F1_Score": 'f1_weighted',
+}
+
+def prepare_analysis_frame(df: pd.DataFrame):
+    """
+    Memastikan kolom review_score dan membuang baris tanpa price/review_no/review_score (in-place).
+    Skor yang sudah tersimpan di database (kolom turunan) dipakai langsung; pemetaan
+    REVIEW_SCORE_MAP hanya untuk DataFrame tanpa kolom tersebut (mis. snapshot lama).
+    """
+    if 'review_score' in df.columns:
+        df['review_score'] = df['review_score'].astype('float64')
+    else:
+        # astype: review_type categorical (DataFrame bertipe ringkas) menghasilkan kolom categorical
+        df['review_score'] = df['review_type'].map(REVIEW_SCORE_MAP).astype('float64')
+    # Hapus baris yang mungkin memiliki nilai null pada kolom kunci setelah pemetaan/konversi
+    df.dropna(subset=['price', 'review_no', 'review_score'], inplace=True)
+    return df
+
+def cross_validate_classifier(X, y, folds=5, n_jobs=None):
+    """
+    K-fold cross-validation (stratified) dengan fold dilatih paralel (joblib, n_jobs proses/thread).
+    Model di dalam fold memakai satu core agar tidak terjadi oversubscription.
+    Mengembalikan {"folds", "metrics": {nama: {"mean", "std"}}}.
+    """
+    model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=1)
+    scores = cross_validate(
+        model, X, y,
+        cv=StratifiedKFold(n_splits=folds, shuffle=True, random_state=42),
+        scoring=CV_SCORING,
+        n_jobs=n_jobs,
+        error_score='raise',
+    )
+    return {
+        "folds": folds,
+        "metrics": {
+            name: {
+                "mean": round(float(scores[f"test_{name}"].mean()), 4),
+                "std": round(float(scores[f"test_{name}"].std()), 4),
+            }
+            for name in CV_SCORING
+        },
+    }
+
+def train_classifier(df_clean: pd.DataFrame, tag_matrix=None, n_tag_features=CLASSIFIER_TAG_FEATURES,
+                     n_jobs=None, cv_folds=0):
     """
     Melakukan Normalisasi, Encoding Genre, Pelatihan Model Random Forest, dan Evaluasi.
     (Implementasi Fitur #3.b, #3.c, dan #5.c)
+    Mengembalikan (artifacts, classification_results, error); artifacts berisi model, scaler,
+    dan daftar fitur/top tags yang diperlukan untuk menyimpan model ke registry.
+    `tag_matrix` (TagMatrix dari encode_tags) dapat diberikan agar encoding tag tidak diulang.
+    `n_jobs` jumlah core untuk training/prediksi RandomForest (-1 = semua core, None = satu core).
+    `cv_folds` >= 2 menambahkan k-fold cross-validation paralel (mean dan std tiap metrik).
     """
     try: # NEW: Wrap seluruh logika ML dalam try-except block
         if df_clean.empty or len(df_clean) < 100: # Memerlukan minimal data untuk split
-            return None, "Data terlalu sedikit (minimal 100 baris) untuk pelatihan model."
+            return None, None, "Data terlalu sedikit (minimal 100 baris) untuk pelatihan model."
 
-        # Inisialisasi DataFrame untuk ML
-        df_ml = df_clean.copy()
-        
-        # 1. Feature Engineering & Encoding Genre (One-Hot Encoding)
-        
-        # Memastikan kolom tags sudah ada dan memprosesnya
-        df_ml['tags_list'] = df_ml['tags'].astype(str).str.split(',').apply(lambda x: [t.strip() for t in x if t.strip()])
-        
-        all_tags = df_ml['tags_list'].explode().str.strip()
-        top_10_tags = all_tags.value_counts().head(10).index.tolist()
-        
-        # Membuat kolom biner (0 atau 1) untuk Top 10 Tags
-        for tag in top_10_tags:
-            # 1 jika game memiliki tag, 0 jika tidak
-            df_ml[tag] = df_ml['tags_list'].apply(lambda x: 1 if tag in x else 0)
+        # 1. Feature Engineering & Encoding Genre (One-Hot Encoding, matriks sparse)
+        if tag_matrix is None:
+            tag_matrix = encode_tags(df_clean['tags'])
+        top_tags = tag_matrix.top_tags(n_tag_features)
 
         # 2. Normalisasi Data (Min-Max Scaling) - Fitur #3.b
         
         scaler = MinMaxScaler()
-        df_ml[['price_normalized', 'review_no_normalized']] = scaler.fit_transform(
-            df_ml[['price', 'review_no']]
-        )
+        numeric_normalized = scaler.fit_transform(df_clean[['price', 'review_no']].to_numpy(dtype=np.float64))
 
         # 3. Definisikan Features (X) dan Target (y)
         
-        feature_cols = ['price_normalized', 'review_no_normalized'] + top_10_tags
+        feature_cols = ['price_normalized', 'review_no_normalized'] + top_tags
         target_col = 'review_type'
         
-        X = df_ml[feature_cols]
-        y = df_ml[target_col]
-        
-        # PENTING: Filter data jika ada nilai NaN (walaupun seharusnya sudah di-clean di parser)
-        X = X.fillna(0) 
+        # PENTING: NaN diganti 0 (walaupun seharusnya sudah di-clean di parser).
+        # Kolom tag dipadatkan di sini: RandomForest jauh lebih lambat pada input sparse.
+        X = np.hstack([
+            np.nan_to_num(numeric_normalized),
+            tag_matrix.columns(top_tags).toarray().astype(np.float64)
+        ])
+        y = df_clean[target_col].to_numpy()
 
         # 4. Split Data dan Training Model
         
         # Periksa apakah target memiliki cukup kelas
-        if len(y.unique()) < 2:
-            return None, f"Hanya ditemukan satu kelas ulasan ({y.unique()[0]}). Klasifikasi memerlukan minimal 2 kelas."
+        classes = pd.unique(y)
+        if len(classes) < 2:
+            return None, None, f"Hanya ditemukan satu kelas ulasan ({classes[0]}). Klasifikasi memerlukan minimal 2 kelas."
 
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
         
-        model = RandomForestClassifier(n_estimators=100, random_state=42)
-        model.fit(X_train, y_train)
+        model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=n_jobs)
+        with stage('random_forest_fit', rows=len(X_train)):
+            model.fit(X_train, y_train)
         y_pred = model.predict(X_test)
 
         # 5. Evaluasi Model (Fitur #5.c)
@@ -83,8 +134,8 @@ def run_classification(df_clean: pd.DataFrame):
         f1 = f1_score(y_test, y_pred, average='weighted', zero_division=0)
 
         # Confusion Matrix
-        cm = confusion_matrix(y_test, y_pred, labels=y.unique())
-        cm_df = pd.DataFrame(cm, index=y.unique(), columns=y.unique())
+        cm = confusion_matrix(y_test, y_pred, labels=classes)
+        cm_df = pd.DataFrame(cm, index=classes, columns=classes)
 
         # Format hasil
         classification_results = {
@@ -95,26 +146,46 @@ def run_classification(df_clean: pd.DataFrame):
                 "F1_Score": round(f1, 4),
             },
             "confusion_matrix": cm_df.to_dict('split'), # Menggunakan format split untuk transfer JSON
-            "feature_importances": dict(zip(X.columns, model.feature_importances_.round(4)))
+            "feature_importances": dict(zip(feature_cols, model.feature_importances_.round(4)))
+        }
+        if cv_folds and cv_folds >= 2:
+            with stage('cross_validation', rows=len(X)):
+                classification_results["cross_validation"] = cross_validate_classifier(X, y, cv_folds, n_jobs)
+
+        artifacts = {
+            "model": model,
+            "scaler": scaler,
+            "feature_cols": feature_cols,
+            "top_tags": top_tags,
+            "n_rows": int(len(df_clean)),
         }
         
-        return classification_results, None
+        return artifacts, classification_results, None
         
     except Exception as e:
         # Menangkap semua error dan mengembalikannya sebagai pesan
         detailed_error = f"ML Error: {str(e)}. Traceback: {traceback.format_exc()}"
         print(detailed_error) # Cetak ke konsol Flask
-        return None, "Gagal menjalankan Model Klasifikasi. Data mungkin tidak seimbang atau ada error dalam perhitungan."
+        return None, None, "Gagal menjalankan Model Klasifikasi. Data mungkin tidak seimbang atau ada error dalam perhitungan."
+
+@timed('run_classification')
+def run_classification(df_clean: pd.DataFrame, tag_matrix=None, n_jobs=None, cv_folds=0):
+    """Melatih dan mengevaluasi model; hanya mengembalikan (classification_results, error)."""
+    _, classification_results, error = train_classifier(
+        df_clean, tag_matrix=tag_matrix, n_jobs=n_jobs, cv_folds=cv_folds
+    )
+    return classification_results, error
 
 # ... calculate_dashboard_stats tetap sama, kecuali penambahan traceback di atas sudah menangani error-nya.
-def calculate_dashboard_stats(df: pd.DataFrame):
+@timed('calculate_dashboard_stats', rows=lambda stats: stats['descriptive_stats']['total_games'])
+def calculate_dashboard_stats(df: pd.DataFrame, include_classification=True):
     """
     Menghitung statistik deskriptif, nilai korelasi Pearson (Fitur #5), dan Klasifikasi ML.
+    include_classification=False melewati pelatihan model (hasil klasifikasi diambil dari
+    model registry oleh pemanggil).
     """
     # 1. Pra-pemrosesan Data (untuk korelasi)
-    df['review_score'] = df['review_type'].map(REVIEW_SCORE_MAP)
-    # Hapus baris yang mungkin memiliki nilai null pada kolom kunci setelah pemetaan/konversi
-    df.dropna(subset=['price', 'review_no', 'review_score'], inplace=True)
+    prepare_analysis_frame(df)
     
     total_games = len(df)
 
@@ -122,12 +193,14 @@ def calculate_dashboard_stats(df: pd.DataFrame):
     min_price = df['price'].min() if not df.empty else 0.00
     max_price = df['price'].max() if not df.empty else 0.00
     avg_review_no = df['review_no'].mean() if not df.empty else 0
+    # review_type bisa kategorikal (typed_frame): kategori tanpa game tidak ikut ditampilkan
+    review_counts = df['review_type'].value_counts()
     
     descriptive_stats = {
         "total_games": int(total_games),
         "avg_review_no": round(avg_review_no, 2),
         "price_range": f"${min_price:.2f} - ${max_price:.2f}",
-        "review_distribution": df['review_type'].value_counts().to_dict() # Distribusi ulasan
+        "review_distribution": review_counts[review_counts > 0].to_dict() # Distribusi ulasan
     }
     
     # 3. Analisis Korelasi (Pearson) 
@@ -136,32 +209,29 @@ def calculate_dashboard_stats(df: pd.DataFrame):
         correlation_cols = ['price', 'review_no', 'review_score']
         corr_matrix = df[correlation_cols].corr(method='pearson')
         
+        # Korelasi tak terdefinisi (variabel konstan) menjadi None, sama seperti jalur SQL
         correlation_results = {
-            'price_vs_review_score': round(corr_matrix.loc['price', 'review_score'], 4),
-            'review_no_vs_review_score': round(corr_matrix.loc['review_no', 'review_score'], 4)
+            key: round(float(value), 4) if pd.notna(value) else None
+            for key, value in (
+                ('price_vs_review_score', corr_matrix.loc['price', 'review_score']),
+                ('review_no_vs_review_score', corr_matrix.loc['review_no', 'review_score']),
+            )
         }
         
     # 4. Analisis Genre (Distribusi dan Rata-rata Skor per Genre) 
     genre_distribution = {}
     genre_avg_score = {}
     
+    # Encoding tag dibangun sekali dan dipakai ulang oleh statistik genre dan klasifikasi
+    tag_matrix = encode_tags(df['tags'])
     if total_games > 0:
-        genre_df = df.copy()
-        genre_df['tags_list'] = genre_df['tags'].astype(str).str.split(',').apply(lambda x: [t.strip() for t in x if t.strip()])
-        
-        all_tags = genre_df['tags_list'].explode().str.strip()
-        genre_counts = all_tags.value_counts().head(10) 
-        genre_distribution = genre_counts.to_dict()
-
-        genre_scores = {}
-        for tag in genre_counts.index:
-            games_with_tag = genre_df[genre_df['tags_list'].apply(lambda x: tag in x)]
-            genre_scores[tag] = round(games_with_tag['review_score'].mean(), 4)
-            
-        genre_avg_score = genre_scores
+        genre_distribution = tag_matrix.distribution(GENRE_STATS_TOP_N)
+        genre_avg_score = tag_matrix.mean_by_tag(df['review_score'].to_numpy(), GENRE_STATS_TOP_N)
         
     # 5. Klasifikasi Random Forest (BARU)
-    classification_data, ml_error = run_classification(df)
+    classification_data, ml_error = None, None
+    if include_classification:
+        classification_data, ml_error = run_classification(df, tag_matrix=tag_matrix)
 
     return {
         "descriptive_stats": descriptive_stats,
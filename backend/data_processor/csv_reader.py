@@ -0,0 +1,223 @@
+# data_processor/csv_reader.py
+
+# Pembaca CSV adaptif untuk upload dataset. File dibaca per blok byte yang selalu berakhir
+# di batas record (jumlah tanda kutip genap), lalu setiap blok di-parse sebagai string dengan
+# engine cepat: pyarrow jika terpasang (hanya kolom yang dipakai yang dikonversi), selain itu
+# engine C. Engine python yang toleran hanya dipakai ulang untuk blok yang gagal di-parse
+# (misalnya tanda kutip tidak seimbang, atau bad line pada engine C). Baris yang lebih panjang
+# dari header (pyarrow: jumlah kolom berbeda) dilewati dan dihitung sebagai bad line lewat
+# callback parser: invalid_row_handler (pyarrow) dan on_bad_lines (engine python).
+# Header hanya dibaca sekali; setiap blok di-parse tanpa header dengan names dari header.
+
+import io
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+CSV_ENGINES = ('auto', 'pyarrow', 'c', 'python')
+
+# Encoding file upload (sama dengan jalur lama)
+CSV_ENCODING = 'latin-1'
+
+# Ukuran blok byte yang di-parse sekaligus
+CSV_BLOCK_BYTES = 16 * 1024 * 1024
+
+
+def resolve_engine(engine='auto'):
+    """Engine cepat yang dipakai: 'auto' memilih pyarrow jika terpasang, selain itu C."""
+    if engine == 'auto':
+        return 'pyarrow' if PYARROW_AVAILABLE else 'c'
+    if engine == 'pyarrow' and not PYARROW_AVAILABLE:
+        return 'c'
+    return engine
+
+
+def _record_boundary(buffer):
+    """
+    Posisi setelah newline terakhir di `buffer` yang berada di luar field bertanda kutip
+    (jumlah '"' sebelumnya genap; kutip ganda "" ter-escape tidak mengubah paritas), atau 0.
+    """
+    total_quotes = buffer.count(b'"')
+    tail_quotes = 0
+    end = len(buffer)
+    while True:
+        newline = buffer.rfind(b'\n', 0, end)
+        if newline < 0:
+            return 0
+        tail_quotes += buffer.count(b'"', newline + 1, end)
+        if (total_quotes - tail_quotes) % 2 == 0:
+            return newline + 1
+        end = newline
+
+
+def iter_csv_blocks(file_obj, block_bytes=CSV_BLOCK_BYTES):
+    """
+    Membaca file biner per blok yang berakhir di batas record. Blok terakhir (sisa file)
+    bisa berisi tanda kutip yang tidak pernah ditutup.
+    """
+    pending = b''
+    while True:
+        data = file_obj.read(block_bytes)
+        if not data:
+            break
+        buffer = pending + data
+        cut = _record_boundary(buffer)
+        if cut == 0:
+            # Record lebih panjang dari satu blok: terus baca sampai batas record ditemukan
+            pending = buffer
+            continue
+        yield buffer[:cut]
+        pending = buffer[cut:]
+    if pending.strip():
+        yield pending
+
+
+def _first_record_end(buffer):
+    """Posisi setelah newline pertama di `buffer` yang berada di luar field bertanda kutip."""
+    quotes = 0
+    start = 0
+    while True:
+        newline = buffer.find(b'\n', start)
+        if newline < 0:
+            return len(buffer)
+        quotes += buffer.count(b'"', start, newline)
+        if quotes % 2 == 0:
+            return newline + 1
+        start = newline + 1
+
+
+def header_names(header):
+    """Nama kolom dari baris header (duplikat diberi akhiran .1, .2 seperti pd.read_csv)."""
+    return list(pd.read_csv(io.BytesIO(header), encoding=CSV_ENCODING, nrows=0).columns)
+
+
+def _read_pyarrow(block, names, usecols, counter):
+    # pyarrow hanya mengonversi kolom usecols dan tetap memeriksa jumlah kolom setiap baris
+    def on_invalid_row(row):
+        counter["bad_lines"] += 1
+        return 'skip'
+
+    table = pa_csv.read_csv(
+        io.BytesIO(block),
+        read_options=pa_csv.ReadOptions(column_names=names, encoding=CSV_ENCODING),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True, invalid_row_handler=on_invalid_row),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=usecols, column_types={col: pa.string() for col in usecols},
+            strings_can_be_null=True,
+        ),
+    )
+    return table.to_pandas()
+
+
+def _read_c(block, names, usecols, counter):
+    # Engine C tidak punya callback bad line: blok dengan bad line gagal (on_bad_lines='error')
+    # dan di-parse ulang oleh engine python yang menghitungnya. usecols tidak diteruskan karena
+    # tokenizer C melewati pengecekan jumlah kolom per baris jika usecols diisi.
+    df = pd.read_csv(io.BytesIO(block), encoding=CSV_ENCODING, engine='c', header=None,
+                     names=names, dtype=str, on_bad_lines='error')
+    if not isinstance(df.index, pd.RangeIndex):
+        # Record pertama lebih panjang dari header: kolom lebihnya dijadikan index
+        raise pd.errors.ParserError("Record pertama blok memiliki kolom lebih banyak dari header")
+    return df[usecols]
+
+
+def _read_python(block, names, usecols, counter):
+    def on_bad_line(fields):
+        counter["bad_lines"] += 1
+        return None
+
+    # Seperti engine C, on_bad_lines hanya dipanggil tanpa usecols
+    bad_lines_before = counter["bad_lines"]
+    while True:
+        df = pd.read_csv(io.BytesIO(block), encoding=CSV_ENCODING, engine='python', header=None,
+                         names=names, dtype=str, on_bad_lines=on_bad_line)
+        if isinstance(df.index, pd.RangeIndex):
+            return df[usecols]
+        # Record pertama yang lebih panjang dari header dijadikan index (bukan diteruskan ke
+        # on_bad_lines): record itu dibuang dan sisa blok di-parse ulang
+        counter["bad_lines"] = bad_lines_before + 1
+        bad_lines_before = counter["bad_lines"]
+        block = block[_first_record_end(block):]
+
+
+FAST_READERS = {
+    'pyarrow': _read_pyarrow,
+    'c': _read_c,
+}
+
+
+def read_csv_block(block, names, usecols, engine, counter):
+    """
+    Parse satu blok record (tanpa header) dengan engine cepat; blok yang gagal di-parse,
+    berisi bad line (engine C), atau tanda kutip tidak seimbang di-parse ulang dengan engine python.
+    """
+    reader = FAST_READERS.get(engine)
+    if reader is not None and block.count(b'"') % 2 == 0:
+        bad_lines_before = counter["bad_lines"]
+        try:
+            return reader(block, names, usecols, counter)
+        except (pd.errors.ParserError, ValueError):
+            counter["bad_lines"] = bad_lines_before
+    if reader is not None:
+        counter["fallback_blocks"] += 1
+    return _read_python(block, names, usecols, counter)
+
+
+def _rechunk(frames, chunksize):
+    """Menggabungkan/memotong DataFrame per blok menjadi chunk berisi tepat `chunksize` baris."""
+    buffer = []
+    buffered = 0
+    for frame in frames:
+        buffer.append(frame)
+        buffered += len(frame)
+        while buffered >= chunksize:
+            merged = pd.concat(buffer, ignore_index=True) if len(buffer) > 1 else buffer[0]
+            yield merged.iloc[:chunksize].reset_index(drop=True)
+            rest = merged.iloc[chunksize:]
+            buffer = [rest] if len(rest) else []
+            buffered = len(rest)
+    if buffered:
+        yield pd.concat(buffer, ignore_index=True) if len(buffer) > 1 else buffer[0].reset_index(drop=True)
+
+
+def iter_csv_frames(file_path, usecols, chunksize=None, engine='auto', counter=None,
+                    block_bytes=CSV_BLOCK_BYTES):
+    """
+    Iterator DataFrame (kolom `usecols`, semua bertipe string) berisi `chunksize` baris
+    (None = satu DataFrame per blok).
+    `counter` (dict) diperbarui dengan bad_lines dan fallback_blocks selama iterasi.
+    engine='python' memaksa jalur lama (engine python untuk seluruh file).
+    """
+    if counter is None:
+        counter = {}
+    counter.setdefault("bad_lines", 0)
+    counter.setdefault("fallback_blocks", 0)
+    usecols = list(usecols)
+    fast_engine = resolve_engine(engine)
+
+    def frames():
+        with open(file_path, 'rb') as csv_file:
+            header = csv_file.readline()
+            if not header.strip():
+                return
+            names = header_names(header)
+            for block in iter_csv_blocks(csv_file, block_bytes):
+                if fast_engine == 'python':
+                    yield _read_python(block, names, usecols, counter)
+                else:
+                    yield read_csv_block(block, names, usecols, fast_engine, counter)
+
+    return _rechunk(frames(), chunksize) if chunksize else frames()
+
+
+def read_csv_adaptive(file_path, usecols, engine='auto', counter=None):
+    """Membaca seluruh file CSV sekaligus (mode non-streaming) dengan pembaca adaptif."""
+    frames = list(iter_csv_frames(file_path, usecols, engine=engine, counter=counter))
+    if not frames:
+        return pd.DataFrame(columns=list(usecols))
+    return pd.concat(frames, ignore_index=True)
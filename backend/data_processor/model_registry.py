@@ -0,0 +1,211 @@
+# data_processor/model_registry.py
+
+import json
+import os
+import shutil
+import threading
+import uuid
+from datetime import datetime, timezone
+import joblib
+import numpy as np
+
+MODEL_FILENAME = 'model.joblib'
+METADATA_FILENAME = 'metadata.json'
+LATEST_POINTER = 'latest.json'
+FULL_BASELINE = 'full_baseline.json'
+
+
+def _json_default(value):
+    # Nilai numpy dari hasil evaluasi sklearn
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _write_json_atomic(path, payload):
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as json_file:
+        json.dump(payload, json_file, default=_json_default)
+    os.replace(tmp_path, path)
+
+
+class ModelRegistry:
+    """
+    Registry model klasifikasi di disk:
+        <model_dir>/<model_id>/model.joblib   -> model, scaler, feature_cols, top_tags
+        <model_dir>/<model_id>/metadata.json  -> versi dataset, waktu & durasi training, metrik
+        <model_dir>/latest.json               -> pointer ke model terbaru
+        <model_dir>/full_baseline.json        -> metrik model terakhir yang dilatih dengan seluruh data
+
+    Metadata terbaru di-cache berdasarkan mtime pointer sehingga dashboard bisa membacanya
+    tanpa memuat model. Beberapa worker proses dapat berbagi folder yang sama.
+    """
+
+    def __init__(self, model_dir, keep=3):
+        self.model_dir = model_dir
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._metadata_cache = (None, None)  # (mtime pointer, metadata)
+        self._model_cache = (None, None)     # (model_id, artifacts)
+
+    def _pointer_path(self):
+        return os.path.join(self.model_dir, LATEST_POINTER)
+
+    def save(self, artifacts, metadata):
+        """Menyimpan artifacts + metadata sebagai model baru lalu memindahkan pointer latest."""
+        model_id = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S') + '-' + uuid.uuid4().hex[:8]
+        model_path = os.path.join(self.model_dir, model_id)
+        os.makedirs(model_path, exist_ok=True)
+
+        metadata = dict(metadata, model_id=model_id)
+        joblib.dump(artifacts, os.path.join(model_path, MODEL_FILENAME))
+        _write_json_atomic(os.path.join(model_path, METADATA_FILENAME), metadata)
+        if metadata.get("sampling") is None:
+            # Baseline disimpan terpisah agar tetap ada walaupun modelnya sudah di-prune
+            _write_json_atomic(os.path.join(self.model_dir, FULL_BASELINE), {
+                "model_id": model_id,
+                "dataset_version": metadata["dataset_version"],
+                "n_rows": metadata["n_rows"],
+                "training_seconds": metadata["training_seconds"],
+                "metrics": metadata["classification"]["metrics"],
+            })
+        # Pointer dipindah paling akhir agar pembaca tidak melihat model setengah tersimpan
+        _write_json_atomic(self._pointer_path(), {"model_id": model_id})
+
+        self._prune(keep_id=model_id)
+        return metadata
+
+    def _prune(self, keep_id):
+        """Menghapus model lama di luar `keep` model terbaru."""
+        model_ids = sorted(
+            name for name in os.listdir(self.model_dir)
+            if os.path.isdir(os.path.join(self.model_dir, name))
+        )
+        for model_id in model_ids[:-self.keep] if self.keep > 0 else []:
+            if model_id != keep_id:
+                shutil.rmtree(os.path.join(self.model_dir, model_id), ignore_errors=True)
+
+    def latest_metadata(self):
+        """Metadata model terbaru, atau None jika belum ada model."""
+        pointer = self._pointer_path()
+        try:
+            mtime = os.path.getmtime(pointer)
+        except OSError:
+            return None
+
+        with self._lock:
+            cached_mtime, cached_metadata = self._metadata_cache
+            if cached_mtime == mtime:
+                return cached_metadata
+
+        try:
+            with open(pointer, encoding='utf-8') as pointer_file:
+                model_id = json.load(pointer_file)["model_id"]
+            with open(os.path.join(self.model_dir, model_id, METADATA_FILENAME), encoding='utf-8') as meta_file:
+                metadata = json.load(meta_file)
+        except (OSError, ValueError, KeyError):
+            return None
+
+        with self._lock:
+            self._metadata_cache = (mtime, metadata)
+        return metadata
+
+    def full_data_baseline(self):
+        """Metrik model full-data terakhir (tanpa sampling), atau None."""
+        try:
+            with open(os.path.join(self.model_dir, FULL_BASELINE), encoding='utf-8') as baseline_file:
+                return json.load(baseline_file)
+        except (OSError, ValueError):
+            return None
+
+    def load_latest(self):
+        """(artifacts, metadata) model terbaru, dimuat sekali per model_id; (None, None) jika belum ada."""
+        metadata = self.latest_metadata()
+        if metadata is None:
+            return None, None
+
+        model_id = metadata["model_id"]
+        with self._lock:
+            cached_id, cached_artifacts = self._model_cache
+            if cached_id == model_id:
+                return cached_artifacts, metadata
+
+        artifacts = joblib.load(os.path.join(self.model_dir, model_id, MODEL_FILENAME))
+        with self._lock:
+            self._model_cache = (model_id, artifacts)
+        return artifacts, metadata
+
+
+def build_metadata(dataset_version, classification_results, artifacts, training_seconds, sampling=None):
+    """Metadata standar untuk model yang baru dilatih (`sampling` None = seluruh data)."""
+    return {
+        "dataset_version": dataset_version["token"],
+        "version": dataset_version["version"],
+        "rows_changed": dataset_version["rows_changed"],
+        "n_rows": artifacts["n_rows"],
+        "top_tags": artifacts["top_tags"],
+        "feature_cols": artifacts["feature_cols"],
+        "trained_at": datetime.now(timezone.utc).isoformat(),
+        "training_seconds": round(training_seconds, 3),
+        "classification": classification_results,
+        "sampling": sampling,
+    }
+
+
+def compare_with_baseline(metadata, baseline):
+    """
+    Membandingkan metrik model sampel dengan baseline full-data terakhir: selisih tiap metrik
+    (sampel - full) dan rasio waktu training. Selalu mengembalikan dict dengan `status`:
+    'full_data' (model tidak di-sample), 'no_baseline' (belum ada model full-data untuk
+    pembanding), atau 'compared'.
+    """
+    if metadata.get("sampling") is None:
+        return {
+            "status": "full_data",
+            "message": "Model dilatih dengan seluruh data; tidak ada sampel yang dibandingkan.",
+        }
+    if baseline is None:
+        return {
+            "status": "no_baseline",
+            "sample_rows": metadata["n_rows"],
+            "message": ("Belum ada baseline full-data untuk pembanding. "
+                        "Latih baseline lewat POST /api/model/train?full=1."),
+        }
+    sample_metrics = metadata["classification"]["metrics"]
+    full_metrics = baseline["metrics"]
+    return {
+        "status": "compared",
+        "baseline_model_id": baseline["model_id"],
+        "baseline_dataset_version": baseline["dataset_version"],
+        "baseline_rows": baseline["n_rows"],
+        "sample_rows": metadata["n_rows"],
+        "metrics_delta": {
+            name: round(sample_metrics[name] - full_metrics[name], 4)
+            for name in sample_metrics if name in full_metrics
+        },
+        "training_speedup": (
+            round(baseline["training_seconds"] / metadata["training_seconds"], 2)
+            if metadata["training_seconds"] else None
+        ),
+    }
+
+
+def needs_retraining(metadata, dataset_version, min_change_ratio):
+    """
+    True jika belum ada model, dataset dibuat ulang (epoch berbeda), atau jumlah baris yang
+    berubah sejak training melebihi min_change_ratio x jumlah baris data training.
+    """
+    if metadata is None:
+        return True
+    if metadata["dataset_version"].split('-')[0] != dataset_version["token"].split('-')[0]:
+        return True
+    if metadata["dataset_version"] == dataset_version["token"]:
+        return False
+    changed = dataset_version["rows_changed"] - metadata.get("rows_changed", 0)
+    # Model sampel dibandingkan dengan ukuran populasi, bukan jumlah baris sampelnya
+    sampling = metadata.get("sampling")
+    training_rows = sampling["population_rows"] if sampling else metadata.get("n_rows", 0)
+    return changed >= max(min_change_ratio * training_rows, 1)
+
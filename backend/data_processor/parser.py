@@ -3,6 +3,9 @@
 import pandas as pd
 from datetime import datetime
 import numpy as np
+from data_processor.csv_reader import read_csv_adaptive, iter_csv_frames
+from metrics import stage, timed
+from derived_columns import add_derived_columns
 
 # Mapping nama kolom dari file mentah ke nama kolom di database 
 COLUMN_MAPPING = {
@@ -21,74 +24,216 @@ EXPECTED_DTYPES = {
     'review_no': np.int64,
 }
 
-def parse_and_validate_data(file_path, file_extension):
+# Jumlah baris per chunk untuk mode streaming (membatasi memori puncak)
+DEFAULT_CHUNK_SIZE = 50000
+
+
+class ParseError(ValueError):
+    """Dilempar oleh iterator chunk jika sebuah chunk gagal dibersihkan."""
+
+
+def _read_raw_file(file_path, file_extension, engine='auto'):
+    """Membaca seluruh file mentah (mode non-streaming)."""
+    if file_extension == '.csv':
+        # Pembaca adaptif: engine cepat hanya untuk kolom COLUMN_MAPPING, engine python
+        # (on_bad_lines='skip') hanya untuk blok yang rusak
+        return read_csv_adaptive(file_path, COLUMN_MAPPING.keys(), engine=engine)
+    return pd.read_excel(file_path)
+
+
+def _validate_columns(columns):
+    """Mengembalikan pesan error jika ada kolom wajib yang hilang, atau None."""
+    required_columns = list(COLUMN_MAPPING.keys())
+    missing_columns = [col for col in required_columns if col not in columns]
+
+    if missing_columns:
+        return f"Kolom wajib tidak ditemukan: {', '.join(missing_columns)}. Wajib ada: {', '.join(required_columns)}."
+    return None
+
+
+def clean_review_no(series):
+    """
+    --- PERBAIKAN 1: Membersihkan kolom Review_no (Menghapus koma/teks) ---
+    Menghapus semua karakter non-digit dari string (seperti " 574,097 User Reviews "),
+    nilai kosong menjadi 0.
+    """
+    series = series.astype(str).str.replace(r'[^0-9]', '', regex=True)
+    series = pd.to_numeric(series, errors='coerce')
+    # Mengisi NaN (jika review_no benar-benar kosong) dengan 0 dan konversi ke integer
+    return series.fillna(0.0).astype(np.int64)
+
+
+def clean_price(series):
+    """
+    --- PERBAIKAN 2: Handle Price (Menghapus '$', koma, dan mengubah "Free to Play" menjadi 0) ---
+    """
+    # Hapus simbol '$' dan koma (,) agar dapat dikonversi ke numerik
+    series = series.astype(str).str.replace(r'[\$,]', '', regex=True).str.strip()
+
+    # Mengubah nilai non-numerik (misalnya 'Free To Play' atau 'Prepurchase') menjadi NaN
+    series = pd.to_numeric(series, errors='coerce')
+
+    # Mengisi nilai NaN dengan 0.00 (Handle Free To Play/Prepurchase)
+    return series.fillna(0.00).astype(float)
+
+
+def clean_dataframe(df):
+    """
+    Rename, seleksi, dan pembersihan kolom (review_no, price, description, release_date),
+    ditambah kolom turunan derived_columns.DERIVED_COLUMNS.
+    Dipakai bersama oleh mode penuh dan mode streaming per chunk.
+    """
+    # 3. Rename dan Seleksi Kolom yang Diperlukan
+    df = df[list(COLUMN_MAPPING.keys())].rename(columns=COLUMN_MAPPING)
+
+    # 4. Validasi dan Konversi Tipe Data
+    df['review_no'] = clean_review_no(df['review_no'])
+    df['price'] = clean_price(df['price'])
+
+    # --- PERBAIKAN 3: Batasi panjang Description ---
+    # Untuk mencegah error SQL jika Description terlalu panjang.
+    df['description'] = df['description'].astype(str).str.slice(0, 5000)
+
+    # Konversi Release_date menjadi format DATE (YYYY-MM-DD)
+    df['release_date'] = pd.to_datetime(df['release_date'], errors='coerce').dt.strftime('%Y-%m-%d')
+    
+    # Hapus baris yang mungkin memiliki nilai null pada kolom kunci utama
+    # Kolom yang TIDAK BOLEH NULL: name, price, review_no, review_type, release_date
+    required_for_analysis = ['name', 'price', 'review_no', 'review_type', 'release_date']
+    df = df.dropna(subset=required_for_analysis)
+
+    # Kolom turunan (review_score, release_year) dihitung sekali di sini, bukan saat dibaca
+    return add_derived_columns(df)
+
+
+@timed('parse_and_validate_data', rows=lambda result: len(result[0]) if result[0] else 0)
+def parse_and_validate_data(file_path, file_extension, engine='auto'):
     """
     Membaca, memvalidasi, dan membersihkan data dari file yang diunggah.
+    `engine` memilih engine CSV (lihat csv_reader.CSV_ENGINES).
     """
     
     # 1. Baca File (Mendukung CSV dan XLSX)
+    if file_extension not in ('.csv', '.xlsx'):
+        return None, "Format file tidak didukung. Hanya mendukung .csv atau .xlsx."
     try:
         if file_extension == '.csv':
-            # Menggunakan konfigurasi robust untuk CSV (encoding='latin-1', engine='python', on_bad_lines='skip')
-            df = pd.read_csv(file_path, 
-                             encoding='latin-1', 
-                             sep=',', 
-                             engine='python',
-                             on_bad_lines='skip' 
-                            ) 
-        elif file_extension == '.xlsx':
-            df = pd.read_excel(file_path)
-        else:
-            return None, "Format file tidak didukung. Hanya mendukung .csv atau .xlsx."
+            error = _validate_columns(_read_header(file_path, file_extension))
+            if error:
+                return None, error
+        df = _read_raw_file(file_path, file_extension, engine=engine)
     except Exception as e:
         return None, f"Gagal membaca file: {e}"
 
     # 2. Validasi Kolom Wajib
-    required_columns = list(COLUMN_MAPPING.keys())
-    missing_columns = [col for col in required_columns if col not in df.columns]
-
-    if missing_columns:
-        return None, f"Kolom wajib tidak ditemukan: {', '.join(missing_columns)}. Wajib ada: {', '.join(required_columns)}."
-
-    # 3. Rename dan Seleksi Kolom yang Diperlukan
-    df = df[required_columns].rename(columns=COLUMN_MAPPING)
+    error = _validate_columns(df.columns)
+    if error:
+        return None, error
 
-    # 4. Validasi dan Konversi Tipe Data
     try:
-        # --- PERBAIKAN 1: Membersihkan kolom Review_no (Menghapus koma/teks) ---
-        # Menghapus semua karakter non-digit dari string (seperti " 574,097 User Reviews ")
-        df['review_no'] = df['review_no'].astype(str).str.replace(r'[^0-9]', '', regex=True)
-        df['review_no'] = pd.to_numeric(df['review_no'], errors='coerce')
-        # Mengisi NaN (jika review_no benar-benar kosong) dengan 0 dan konversi ke integer
-        df['review_no'] = df['review_no'].fillna(0.0).astype(np.int64)
-
-        # --- PERBAIKAN 2: Handle Price (Menghapus '$', koma, dan mengubah "Free to Play" menjadi 0) ---
-        # Hapus simbol '$' dan koma (,) agar dapat dikonversi ke numerik
-        df['price'] = df['price'].astype(str).str.replace(r'[\$,]', '', regex=True).str.strip()
-        
-        # Mengubah nilai non-numerik (misalnya 'Free To Play' atau 'Prepurchase') menjadi NaN
-        df['price'] = pd.to_numeric(df['price'], errors='coerce') 
-        
-        # Mengisi nilai NaN dengan 0.00 (Handle Free To Play/Prepurchase)
-        df['price'] = df['price'].fillna(0.00)
-        df['price'] = df['price'].astype(float)
-
-        # --- PERBAIKAN 3: Batasi panjang Description ---
-        # Untuk mencegah error SQL jika Description terlalu panjang.
-        df['description'] = df['description'].astype(str).str.slice(0, 5000)
-
-        # Konversi Release_date menjadi format DATE (YYYY-MM-DD)
-        df['release_date'] = pd.to_datetime(df['release_date'], errors='coerce').dt.strftime('%Y-%m-%d')
-        
-        # Hapus baris yang mungkin memiliki nilai null pada kolom kunci utama
-        # Kolom yang TIDAK BOLEH NULL: name, price, review_no, review_type, release_date
-        required_for_analysis = ['name', 'price', 'review_no', 'review_type', 'release_date']
-        df.dropna(subset=required_for_analysis, inplace=True) 
-        
+        df = clean_dataframe(df)
     except Exception as e:
         return None, f"Gagal melakukan konversi tipe data otomatis: {e}"
     
     # 5. Konversi DataFrame ke list of dictionaries untuk insert ke DB
     data_to_insert = df.to_dict('records')
 
-    return data_to_insert, "Data berhasil diparsing dan divalidasi."
\ No newline at end of file
+    return data_to_insert, "Data berhasil diparsing dan divalidasi."
+
+
+def _iter_xlsx_chunks(file_path, chunksize):
+    """Membaca XLSX baris demi baris (openpyxl read-only) dan mengelompokkannya per chunk."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        header = [str(h) if h is not None else '' for h in header]
+        buffer = []
+        for row in rows:
+            buffer.append(row)
+            if len(buffer) >= chunksize:
+                yield pd.DataFrame(buffer, columns=header)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=header)
+    finally:
+        workbook.close()
+
+
+def _read_header(file_path, file_extension):
+    """Membaca baris header saja untuk validasi kolom sebelum streaming dimulai."""
+    if file_extension == '.csv':
+        return list(pd.read_csv(file_path, encoding='latin-1', sep=',', nrows=0).columns)
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        header = next(workbook.active.iter_rows(values_only=True, max_row=1), ())
+    finally:
+        workbook.close()
+    return [str(h) for h in header if h is not None]
+
+
+def parse_and_validate_chunks(file_path, file_extension, chunksize=DEFAULT_CHUNK_SIZE, stats=None,
+                              engine='auto'):
+    """
+    Mode streaming: membaca file per chunk (CSV dengan pembaca adaptif csv_reader) dan
+    membersihkan setiap chunk dengan aturan yang sama seperti parse_and_validate_data.
+
+    Mengembalikan (iterator DataFrame bersih, pesan). Iterator melempar ParseError jika sebuah
+    chunk gagal dikonversi. Jika `stats` (dict) diberikan, jumlah baris dibaca/valid/dibuang,
+    bad line yang dilewati, dan blok yang di-parse ulang dengan engine python diperbarui
+    selama iterasi.
+    """
+    if file_extension not in ('.csv', '.xlsx'):
+        return None, "Format file tidak didukung. Hanya mendukung .csv atau .xlsx."
+
+    try:
+        header = _read_header(file_path, file_extension)
+    except Exception as e:
+        return None, f"Gagal membaca file: {e}"
+
+    error = _validate_columns(header)
+    if error:
+        return None, error
+
+    if stats is not None:
+        stats.update({"rows_read": 0, "rows_valid": 0, "rows_dropped": 0, "chunks": 0,
+                      "bad_lines": 0, "fallback_blocks": 0})
+
+    def generate():
+        if file_extension == '.csv':
+            raw_chunks = iter_csv_frames(file_path, COLUMN_MAPPING.keys(), chunksize=chunksize,
+                                         engine=engine, counter=stats)
+        else:
+            raw_chunks = _iter_xlsx_chunks(file_path, chunksize)
+
+        while True:
+            # Diukur per chunk (bukan melintasi yield) agar tidak bercampur dengan tahap insert
+            with stage('parse_chunk') as parse_stage:
+                try:
+                    raw = next(raw_chunks, None)
+                except Exception as e:
+                    raise ParseError(f"Gagal membaca file: {e}") from e
+                if raw is None:
+                    break
+
+                try:
+                    cleaned = clean_dataframe(raw)
+                except Exception as e:
+                    raise ParseError(f"Gagal melakukan konversi tipe data otomatis: {e}") from e
+                parse_stage.rows = len(raw)
+
+            if stats is not None:
+                stats["rows_read"] += len(raw)
+                stats["rows_valid"] += len(cleaned)
+                stats["rows_dropped"] += len(raw) - len(cleaned)
+                stats["chunks"] += 1
+            yield cleaned
+
+    return generate(), "Data siap diproses secara streaming."
@@ -0,0 +1,71 @@
+# data_processor/predictor.py
+
+# Prediksi review_type untuk game baru memakai artifacts model dari registry (model, scaler,
+# top_tags). Fitur dibangun dengan aturan yang sama seperti train_classifier, untuk seluruh
+# batch sekaligus (satu transform scaler, satu encode_tags, satu predict_proba).
+
+import numpy as np
+import pandas as pd
+from data_processor.parser import COLUMN_MAPPING, clean_price, clean_review_no
+from data_processor.tag_encoding import encode_tags
+
+# Kolom input prediksi (nama kolom database); kolom lain diabaikan
+PREDICT_COLUMNS = ['name', 'price', 'review_no', 'tags']
+
+
+def normalize_input(df):
+    """
+    Menyamakan input JSON/CSV: kolom boleh memakai nama database (price) atau nama file mentah
+    (Price), price/review_no dibersihkan seperti saat upload, kolom yang tidak ada diisi kosong.
+    """
+    raw_names = {db_name: raw_name for raw_name, db_name in COLUMN_MAPPING.items()}
+    columns = {}
+    for column in PREDICT_COLUMNS:
+        series = df[column] if column in df.columns else None
+        raw_name = raw_names.get(column)
+        if raw_name in df.columns:
+            series = df[raw_name] if series is None else series.combine_first(df[raw_name])
+        columns[column] = series if series is not None else pd.Series(None, index=df.index, dtype=object)
+    result = pd.DataFrame(columns, index=df.index).reset_index(drop=True)
+    result['price'] = clean_price(result['price'])
+    result['review_no'] = clean_review_no(result['review_no'])
+    return result
+
+
+def build_features(artifacts, df):
+    """Matriks fitur (float64) sesuai artifacts["feature_cols"]: numerik ter-scale + indikator top_tags."""
+    numeric = artifacts["scaler"].transform(df[['price', 'review_no']].to_numpy(dtype=np.float64))
+    tag_matrix = encode_tags(df['tags'])
+    return np.hstack([
+        np.nan_to_num(numeric),
+        tag_matrix.columns(artifacts["top_tags"]).toarray().astype(np.float64)
+    ])
+
+
+def predict_frame(artifacts, df):
+    """
+    Prediksi untuk DataFrame yang sudah dinormalisasi (normalize_input).
+    Mengembalikan (label prediksi, matriks probabilitas n x kelas, daftar kelas).
+    """
+    model = artifacts["model"]
+    if df.empty:
+        return np.array([], dtype=object), np.empty((0, len(model.classes_))), list(model.classes_)
+    probabilities = model.predict_proba(build_features(artifacts, df))
+    classes = model.classes_
+    labels = classes[probabilities.argmax(axis=1)]
+    return labels, probabilities, [str(c) for c in classes]
+
+
+def format_predictions(df, labels, probabilities, classes, decimals=4):
+    """List of dict per game: index input, nama (jika ada), review_type, dan probabilitas per kelas."""
+    rounded = np.round(probabilities, decimals).tolist()
+    names = df['name'].astype(object).where(df['name'].notna(), None).tolist()
+    return [
+        {
+            "index": i,
+            "name": name,
+            "review_type": str(label),
+            "probabilities": dict(zip(classes, row)),
+        }
+        for i, (name, label, row) in enumerate(zip(names, labels, rounded))
+    ]
@@ -0,0 +1,98 @@
+# data_processor/tag_encoding.py
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from metrics import timed
+from tag_index import MAX_TAG_LENGTH, tag_key
+
+
+class TagMatrix:
+    """
+    Matriks indikator tag (sparse CSR, baris = game, kolom = tag) yang dibangun sekali per
+    DataFrame dengan operasi string vektor. Kolom diurutkan dari tag paling sering dipakai.
+    Dipakai bersama oleh distribusi genre, rata-rata skor per genre, dan fitur klasifikasi.
+    Tag dikelompokkan dengan kunci tag_index.tag_key (tanpa membedakan huruf besar/kecil),
+    sama seperti agregat SQL; nama yang ditampilkan adalah ejaan kemunculan pertama.
+    """
+
+    def __init__(self, matrix, tags):
+        self.matrix = matrix                   # scipy.sparse.csr_matrix (n_games x n_tags), int8
+        self.tags = tags                       # list nama tag sesuai urutan kolom
+        self.counts = np.asarray(matrix.sum(axis=0)).ravel().astype(np.int64)  # jumlah game per tag
+        self._positions = {tag_key(tag): i for i, tag in enumerate(tags)}
+
+    @property
+    def n_games(self):
+        return self.matrix.shape[0]
+
+    def top_tags(self, n=10):
+        """n tag dengan jumlah game terbanyak (None = semua tag)."""
+        return list(self.tags if n is None else self.tags[:n])
+
+    def columns(self, tags):
+        """
+        Sub-matriks sparse untuk daftar tag tertentu (urutan mengikuti `tags`).
+        Tag yang tidak ada di dataset menghasilkan kolom nol, misalnya saat memakai
+        daftar fitur dari model yang dilatih pada data lain.
+        """
+        n_tags = len(self.tags)
+        positions = [self._positions.get(tag_key(tag), n_tags) for tag in tags]
+        if n_tags in positions:
+            padded = sparse.hstack(
+                [self.matrix, sparse.csr_matrix((self.n_games, 1), dtype=np.int8)], format='csr'
+            )
+            return padded[:, positions]
+        return self.matrix[:, positions]
+
+    def distribution(self, n=10):
+        """{tag: jumlah game} untuk n tag teratas."""
+        return {tag: int(count) for tag, count in zip(self.tags[:n], self.counts[:n])}
+
+    def mean_by_tag(self, values, n=10):
+        """Rata-rata `values` (array sepanjang n_games) untuk game yang memiliki tiap tag teratas."""
+        values = np.asarray(values, dtype=np.float64)
+        sums = self.matrix[:, :n].T @ values
+        counts = self.counts[:n]
+        return {
+            tag: round(float(total / count), 4)
+            for tag, total, count in zip(self.tags[:n], sums, counts) if count > 0
+        }
+
+
+@timed('encode_tags', rows=lambda tag_matrix: tag_matrix.n_games)
+def encode_tags(tags):
+    """
+    Membangun TagMatrix dari Series string tags ("Action, RPG, Indie").
+    Tag di-strip dan dipotong ke MAX_TAG_LENGTH, string kosong/NaN diabaikan, dan tag ganda
+    dalam satu game (tanpa membedakan huruf besar/kecil) dihitung sekali.
+    Baris matriks mengikuti urutan posisi Series (bukan label index).
+    """
+    n_games = len(tags)
+    exploded = (
+        pd.Series(tags.to_numpy(dtype=object), dtype='string')
+        .str.split(',')
+        .explode()
+        .str.strip()
+    )
+    exploded = exploded[exploded.notna() & (exploded != '')]
+
+    if exploded.empty:
+        return TagMatrix(sparse.csr_matrix((n_games, 0), dtype=np.int8), [])
+
+    exploded = exploded.str[:MAX_TAG_LENGTH]
+    pairs = pd.DataFrame({
+        'row': exploded.index.to_numpy(),
+        'key': exploded.str.lower().str[:MAX_TAG_LENGTH].to_numpy(),
+        'tag': exploded.to_numpy(),
+    }).drop_duplicates(['row', 'key'])
+    names = pairs.drop_duplicates('key').set_index('key')['tag']
+    # Urutan kolom: frekuensi menurun, seri dipecah berdasarkan kemunculan pertama (seperti value_counts)
+    ordered_keys = pairs['key'].value_counts(sort=True).index
+    codes = pd.Index(ordered_keys).get_indexer(pairs['key'])
+
+    matrix = sparse.csr_matrix(
+        (np.ones(len(pairs), dtype=np.int8), (pairs['row'].to_numpy(), codes)),
+        shape=(n_games, len(ordered_keys))
+    )
+    return TagMatrix(matrix, [str(tag) for tag in names.loc[ordered_keys]])
@@ -0,0 +1,49 @@
+# dataset_version.py
+
+# Penanda versi dataset: satu baris di tabel dataset_version yang dinaikkan dalam transaksi
+# yang sama dengan setiap operasi tulis pada tabel games (upload, add, edit, delete, clear).
+# Cache hasil analisis memakai token versi ini sebagai kunci.
+
+# `epoch` acak dibuat saat baris pertama kali diisi, sehingga cache di disk tidak tertukar
+# jika tabel dataset_version dibuat ulang dan nomor versi kembali ke 0.
+# `rewrite_version` adalah versi terakhir yang mengubah/menghapus baris lama (edit, delete,
+# clear); selama nilainya sama, perubahan di antara dua versi hanya berupa baris baru.
+DATASET_VERSION_SEED = """
+INSERT IGNORE INTO dataset_version (id, epoch, version, rows_changed)
+VALUES (1, REPLACE(UUID(), '-', ''), 0, 0)
+"""
+
+
+def bump_dataset_version(cursor, rows_changed=0, append_only=False):
+    """
+    Menaikkan versi dataset; panggil sebelum commit operasi tulis.
+    append_only=True untuk operasi yang hanya menambah baris baru (upload, add).
+    """
+    # Kolom di-assign berurutan: rewrite_version memakai nilai version sebelum dinaikkan
+    cursor.execute(
+        "UPDATE dataset_version SET rewrite_version = IF(%s, rewrite_version, version + 1), "
+        "version = version + 1, rows_changed = rows_changed + %s, "
+        "updated_at = CURRENT_TIMESTAMP WHERE id = 1",
+        (bool(append_only), int(rows_changed))
+    )
+
+
+def get_dataset_version(cursor):
+    """
+    Mengembalikan dict {token, epoch, version, rows_changed, rewrite_version}. `token`
+    (epoch-version) dipakai sebagai kunci cache; rows_changed adalah jumlah kumulatif baris
+    yang pernah berubah.
+    """
+    cursor.execute("SELECT epoch, version, rows_changed, rewrite_version FROM dataset_version WHERE id = 1")
+    row = cursor.fetchone()
+    if row is None:
+        cursor.execute(DATASET_VERSION_SEED)
+        return {"token": "0-0", "epoch": "0", "version": 0, "rows_changed": 0, "rewrite_version": 0}
+    epoch, version, rows_changed, rewrite_version = row
+    return {
+        "token": f"{epoch}-{version}",
+        "epoch": epoch,
+        "version": int(version),
+        "rows_changed": int(rows_changed),
+        "rewrite_version": int(rewrite_version),
+    }
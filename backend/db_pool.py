@@ -0,0 +1,230 @@
+# db_pool.py
+
+import threading
+import time
+from collections import deque
+import mysql.connector
+
+
+class PoolTimeoutError(Exception):
+    """Dilempar jika tidak ada koneksi bebas sampai batas waktu checkout habis."""
+
+
+class PooledConnection:
+    """
+    Pembungkus koneksi MySQL milik pool.
+    Semua atribut diteruskan ke koneksi asli, kecuali close() yang mengembalikan
+    koneksi ke pool (bukan menutup socket), sehingga kode lama `conn.close()` tetap berlaku.
+    """
+
+    def __init__(self, pool, raw_conn):
+        self._pool = pool
+        self._raw = raw_conn
+        self._created_at = time.monotonic()
+        self._returned = True
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    @property
+    def age(self):
+        return time.monotonic() - self._created_at
+
+    def close(self):
+        if not self._returned:
+            self._returned = True
+            self._pool._release(self)
+
+    def discard(self):
+        """
+        Mengembalikan slot ke pool dengan menutup koneksi fisik, tanpa menghabiskan sisa
+        result set (misalnya streaming export yang dihentikan klien di tengah jalan).
+        """
+        if not self._returned:
+            self._returned = True
+            self._pool._release(self, discard=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ConnectionPool:
+    """
+    Pool koneksi MySQL yang dibatasi (bounded) dan thread-safe.
+
+    - pool_size   : jumlah koneksi idle yang dipertahankan untuk dipakai ulang
+    - max_overflow: koneksi tambahan sementara saat beban puncak (ditutup saat dikembalikan)
+    - timeout     : detik menunggu koneksi bebas sebelum PoolTimeoutError
+    - recycle     : umur maksimum koneksi (detik) sebelum dibuat ulang; <= 0 berarti tidak pernah
+    - pre_ping    : health-check (ping) setiap kali koneksi dipinjam
+    """
+
+    def __init__(self, connect_args, pool_size=5, max_overflow=10, timeout=10.0,
+                 recycle=1800, pre_ping=True):
+        self._connect_args = dict(connect_args)
+        self.pool_size = max(int(pool_size), 1)
+        self.max_overflow = max(int(max_overflow), 0)
+        self.timeout = float(timeout)
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+
+        self._idle = deque()
+        self._open_count = 0
+        self._checked_out = 0
+        self._cond = threading.Condition(threading.Lock())
+
+        # Statistik untuk keperluan sizing pool
+        self._stats = {
+            "connections_created": 0,
+            "checkouts": 0,
+            "checkout_timeouts": 0,
+            "failed_health_checks": 0,
+            "recycled": 0,
+            "overflow_closed": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+            "peak_checked_out": 0,
+        }
+
+    # --- Siklus Hidup Koneksi ---
+
+    def _create(self):
+        raw = mysql.connector.connect(**self._connect_args)
+        with self._cond:
+            self._stats["connections_created"] += 1
+        return PooledConnection(self, raw)
+
+    def _discard(self, conn):
+        """Menutup koneksi fisik dan membebaskan slot kapasitasnya."""
+        try:
+            conn._raw.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._open_count -= 1
+            self._cond.notify()
+
+    def _is_healthy(self, conn):
+        if self.recycle and self.recycle > 0 and conn.age > self.recycle:
+            with self._cond:
+                self._stats["recycled"] += 1
+            return False
+        if self.pre_ping:
+            try:
+                conn._raw.ping(reconnect=False)
+            except Exception:
+                with self._cond:
+                    self._stats["failed_health_checks"] += 1
+                return False
+        return True
+
+    def get_connection(self):
+        """Meminjam koneksi dari pool (membuat baru jika masih ada kapasitas)."""
+        start = time.monotonic()
+        deadline = start + self.timeout
+
+        while True:
+            conn = None
+            with self._cond:
+                while True:
+                    if self._idle:
+                        conn = self._idle.pop()
+                        break
+                    if self._open_count < self.pool_size + self.max_overflow:
+                        # Reservasi slot, koneksi dibuat di luar lock
+                        self._open_count += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["checkout_timeouts"] += 1
+                        raise PoolTimeoutError(
+                            f"Tidak ada koneksi bebas dalam {self.timeout} detik "
+                            f"(pool_size={self.pool_size}, max_overflow={self.max_overflow})."
+                        )
+                    self._cond.wait(remaining)
+
+            if conn is None:
+                try:
+                    conn = self._create()
+                except Exception:
+                    with self._cond:
+                        self._open_count -= 1
+                        self._cond.notify()
+                    raise
+            elif not self._is_healthy(conn):
+                self._discard(conn)
+                continue
+
+            waited = time.monotonic() - start
+            with self._cond:
+                self._checked_out += 1
+                self._stats["checkouts"] += 1
+                self._stats["wait_time_total"] += waited
+                self._stats["wait_time_max"] = max(self._stats["wait_time_max"], waited)
+                self._stats["peak_checked_out"] = max(self._stats["peak_checked_out"], self._checked_out)
+            conn._returned = False
+            return conn
+
+    def _release(self, conn, discard=False):
+        """
+        Mengembalikan koneksi ke pool; transaksi yang belum di-commit di-rollback.
+        discard=True langsung menutup koneksi (sisa result set tidak dibaca).
+        """
+        reusable = False
+        if discard:
+            try:
+                # Menutup socket tanpa COM_QUIT (yang gagal jika masih ada result yang belum dibaca)
+                conn._raw.shutdown()
+            except Exception:
+                pass
+        else:
+            try:
+                if conn._raw.unread_result:
+                    conn._raw.consume_results()
+                if conn._raw.in_transaction:
+                    conn._raw.rollback()
+                reusable = conn._raw.is_connected()
+            except Exception:
+                reusable = False
+
+        with self._cond:
+            self._checked_out -= 1
+            if reusable and len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                self._cond.notify()
+                return
+            if reusable:
+                self._stats["overflow_closed"] += 1
+        self._discard(conn)
+
+    def dispose(self):
+        """Menutup semua koneksi idle (misalnya saat shutdown)."""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+        for conn in idle:
+            self._discard(conn)
+
+    def stats(self):
+        """Snapshot statistik pool untuk endpoint monitoring."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats.update({
+                "pool_size": self.pool_size,
+                "max_overflow": self.max_overflow,
+                "timeout": self.timeout,
+                "recycle": self.recycle,
+                "pre_ping": self.pre_ping,
+                "open_connections": self._open_count,
+                "idle": len(self._idle),
+                "checked_out": self._checked_out,
+                "overflow_in_use": max(self._open_count - self.pool_size, 0),
+            })
+        checkouts = stats["checkouts"]
+        stats["wait_time_avg"] = round(stats["wait_time_total"] / checkouts, 6) if checkouts else 0.0
+        stats["wait_time_total"] = round(stats["wait_time_total"], 6)
+        stats["wait_time_max"] = round(stats["wait_time_max"], 6)
+        return stats
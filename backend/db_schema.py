@@ -0,0 +1,167 @@
+# db_schema.py
+
+from tag_index import rebuild_tag_index, clear_tag_index
+from search_index import fulltext_index_statements
+from dataset_version import DATASET_VERSION_SEED
+from dashboard_stats import rebuild_dashboard_aggregates
+from game_upsert import GAME_KEY_COLUMN_MIGRATIONS, GAME_KEY_INDEX_MIGRATIONS
+from derived_columns import DERIVED_COLUMN_MIGRATIONS, DERIVED_INDEX_MIGRATIONS
+
+# Tabel pendukung yang dikelola backend (tabel games sendiri dibuat manual).
+# Dijalankan idempoten saat koneksi pertama berhasil dibuat.
+SCHEMA_STATEMENTS = [
+    # Kamus tag yang sudah dinormalisasi (satu baris per tag unik)
+    """
+    CREATE TABLE IF NOT EXISTS tags (
+        id INT UNSIGNED NOT NULL AUTO_INCREMENT,
+        name VARCHAR(191) NOT NULL,
+        name_key VARCHAR(191) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL,
+        game_count INT UNSIGNED NOT NULL DEFAULT 0,
+        stats_count BIGINT NOT NULL DEFAULT 0,
+        score_sum BIGINT NOT NULL DEFAULT 0,
+        PRIMARY KEY (id),
+        UNIQUE KEY uq_tags_name_key (name_key)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """,
+    # Relasi game <-> tag; PK diawali tag_id agar filter genre memakai index range scan
+    """
+    CREATE TABLE IF NOT EXISTS game_tags (
+        game_id INT NOT NULL,
+        tag_id INT UNSIGNED NOT NULL,
+        PRIMARY KEY (tag_id, game_id),
+        KEY idx_game_tags_game (game_id)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """,
+    # Versi dataset (satu baris) untuk kunci cache hasil analisis
+    """
+    CREATE TABLE IF NOT EXISTS dataset_version (
+        id TINYINT UNSIGNED NOT NULL,
+        epoch CHAR(32) NOT NULL,
+        version BIGINT UNSIGNED NOT NULL DEFAULT 0,
+        rows_changed BIGINT UNSIGNED NOT NULL DEFAULT 0,
+        rewrite_version BIGINT UNSIGNED NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (id)
+    ) ENGINE=InnoDB
+    """,
+    DATASET_VERSION_SEED,
+    # Agregat berjalan untuk statistik dashboard (satu baris, lihat dashboard_stats.py)
+    """
+    CREATE TABLE IF NOT EXISTS dashboard_aggregates (
+        id TINYINT UNSIGNED NOT NULL,
+        game_count BIGINT NOT NULL DEFAULT 0,
+        sum_price DECIMAL(65, 6) NOT NULL DEFAULT 0,
+        sum_review_no DECIMAL(65, 6) NOT NULL DEFAULT 0,
+        sum_score DECIMAL(65, 6) NOT NULL DEFAULT 0,
+        sum_price_sq DECIMAL(65, 6) NOT NULL DEFAULT 0,
+        sum_review_no_sq DECIMAL(65, 6) NOT NULL DEFAULT 0,
+        sum_score_sq DECIMAL(65, 6) NOT NULL DEFAULT 0,
+        sum_price_score DECIMAL(65, 6) NOT NULL DEFAULT 0,
+        sum_review_no_score DECIMAL(65, 6) NOT NULL DEFAULT 0,
+        min_price DECIMAL(65, 6) NULL,
+        max_price DECIMAL(65, 6) NULL,
+        minmax_stale TINYINT(1) NOT NULL DEFAULT 0,
+        PRIMARY KEY (id)
+    ) ENGINE=InnoDB
+    """,
+    "INSERT IGNORE INTO dashboard_aggregates (id) VALUES (1)",
+    # Jumlah game per review_type (bagian dari agregat dashboard)
+    """
+    CREATE TABLE IF NOT EXISTS review_type_counts (
+        review_type VARCHAR(64) NOT NULL,
+        game_count BIGINT NOT NULL DEFAULT 0,
+        PRIMARY KEY (review_type)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """,
+]
+
+# Kolom yang ditambahkan setelah tabel pertama kali dibuat:
+# (tabel, kolom, DDL penambahan, SQL pengisian awal atau None)
+COLUMN_MIGRATIONS = [
+    (
+        'tags', 'game_count',
+        "ALTER TABLE tags ADD COLUMN game_count INT UNSIGNED NOT NULL DEFAULT 0",
+        "UPDATE tags t SET game_count = (SELECT COUNT(*) FROM game_tags gt WHERE gt.tag_id = t.id)",
+    ),
+    # Diisi oleh rebuild_dashboard_aggregates (tabel dashboard_aggregates dibuat bersamaan)
+    ('tags', 'stats_count', "ALTER TABLE tags ADD COLUMN stats_count BIGINT NOT NULL DEFAULT 0", None),
+    ('tags', 'score_sum', "ALTER TABLE tags ADD COLUMN score_sum BIGINT NOT NULL DEFAULT 0", None),
+    # Versi terakhir yang bukan append-only; diisi versi saat ini agar snapshot lama tidak dipakai ulang
+    (
+        'dataset_version', 'rewrite_version',
+        "ALTER TABLE dataset_version ADD COLUMN rewrite_version BIGINT UNSIGNED NOT NULL DEFAULT 0",
+        "UPDATE dataset_version SET rewrite_version = version",
+    ),
+    # Kunci natural dan hash isi untuk upload idempoten (lihat game_upsert.py)
+    *GAME_KEY_COLUMN_MIGRATIONS,
+    # Skor review dan tahun rilis yang dihitung saat baris ditulis (lihat derived_columns.py);
+    # harus ada sebelum agregat dashboard dibangun ulang di bawah
+    *DERIVED_COLUMN_MIGRATIONS,
+]
+
+# Kunci tag biner untuk tabel tags lama (unik pada name yang accent-insensitive); tabel
+# dikosongkan lebih dulu lalu index tag dibangun ulang dengan kunci tag_index.tag_key
+TAG_KEY_MIGRATION = (
+    "ALTER TABLE tags DROP INDEX uq_tags_name, "
+    "ADD COLUMN name_key VARCHAR(191) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL AFTER name, "
+    "ADD UNIQUE KEY uq_tags_name_key (name_key)"
+)
+
+# Index tambahan pada tabel games: (nama index, DDL)
+INDEX_MIGRATIONS = fulltext_index_statements() + GAME_KEY_INDEX_MIGRATIONS + DERIVED_INDEX_MIGRATIONS
+
+
+def _table_exists(cursor, table):
+    cursor.execute("SHOW TABLES LIKE %s", (table,))
+    return cursor.fetchone() is not None
+
+
+def _column_exists(cursor, table, column):
+    cursor.execute(f"SHOW COLUMNS FROM {table} LIKE %s", (column,))
+    return cursor.fetchone() is not None
+
+
+def _index_exists(cursor, table, index_name):
+    cursor.execute(f"SHOW INDEX FROM {table} WHERE Key_name = %s", (index_name,))
+    return len(cursor.fetchall()) > 0
+
+
+def ensure_schema(conn):
+    """
+    Membuat tabel pendukung jika belum ada. Jika index tag atau agregat dashboard baru dibuat
+    untuk tabel games yang sudah berisi data, keduanya diisi ulang (backfill) dari tabel games.
+    """
+    cursor = conn.cursor()
+    try:
+        needs_tag_backfill = not _table_exists(cursor, 'game_tags')
+        needs_stats_backfill = not _table_exists(cursor, 'dashboard_aggregates')
+
+        for statement in SCHEMA_STATEMENTS:
+            cursor.execute(statement)
+
+        if not _column_exists(cursor, 'tags', 'name_key'):
+            clear_tag_index(cursor)
+            cursor.execute(TAG_KEY_MIGRATION)
+            needs_tag_backfill = True
+
+        for table, column, ddl, backfill in COLUMN_MIGRATIONS:
+            if not _column_exists(cursor, table, column):
+                cursor.execute(ddl)
+                if backfill:
+                    cursor.execute(backfill)
+
+        for index_name, ddl in INDEX_MIGRATIONS:
+            if not _index_exists(cursor, 'games', index_name):
+                print(f"Membuat index {index_name} pada tabel games...")
+                cursor.execute(ddl)
+
+        if needs_tag_backfill:
+            indexed = rebuild_tag_index(cursor)
+            print(f"Index tag dibangun ulang untuk {indexed} game.")
+        if needs_tag_backfill or needs_stats_backfill:
+            # Statistik per tag ikut terhapus saat index tag dibangun ulang
+            rebuild_dashboard_aggregates(cursor)
+            print("Agregat statistik dashboard dibangun ulang.")
+        conn.commit()
+    finally:
+        cursor.close()
@@ -0,0 +1,92 @@
+# derived_columns.py
+
+# Kolom turunan tabel games yang dihitung sekali saat data ditulis (upload, tambah, edit),
+# bukan setiap kali dibaca: review_score (review_type lewat REVIEW_SCORE_MAP, NULL jika tidak
+# terpetakan) dan release_year (tahun dari release_date). Di MySQL keduanya kolom generated
+# STORED, sehingga terisi oleh semua jalur tulis (multi-row INSERT, LOAD DATA, merge staging,
+# CRUD) dan dapat diberi index; backend tertanam dan parser menghitungnya dengan
+# add_derived_columns. Tag ternormalisasi disimpan sebagai relasi game_tags ke kamus tags
+# (lihat tag_index.py).
+
+import pandas as pd
+from data_processor.analyzer import REVIEW_SCORE_MAP
+
+DERIVED_COLUMNS = ['review_score', 'release_year']
+
+# Ekspresi SQL dengan literal (dipakai di DDL kolom generated, tanpa parameter)
+REVIEW_SCORE_SQL = "CASE review_type {} ELSE NULL END".format(' '.join(
+    "WHEN '{}' THEN {}".format(review_type.replace("'", "''"), score)
+    for review_type, score in REVIEW_SCORE_MAP.items()
+))
+RELEASE_YEAR_SQL = "YEAR(release_date)"
+
+# Migrasi kolom games: (tabel, kolom, DDL penambahan, SQL pengisian awal atau None).
+# Kolom STORED diisi MySQL untuk baris lama saat ALTER TABLE (tabel dibangun ulang sekali).
+DERIVED_COLUMN_MIGRATIONS = [
+    ('games', 'review_score', f"ALTER TABLE games ADD COLUMN review_score TINYINT AS ({REVIEW_SCORE_SQL}) STORED", None),
+    ('games', 'release_year', f"ALTER TABLE games ADD COLUMN release_year SMALLINT AS ({RELEASE_YEAR_SQL}) STORED", None),
+]
+
+# Index untuk filter tahun rilis / skor minimum dan scan analisis (review_score IS NOT NULL)
+DERIVED_INDEX_MIGRATIONS = [
+    ('idx_games_review_score', "ALTER TABLE games ADD INDEX idx_games_review_score (review_score)"),
+    ('idx_games_release_year', "ALTER TABLE games ADD INDEX idx_games_release_year (release_year)"),
+]
+
+
+def add_derived_columns(df):
+    """
+    Menambahkan review_score (Int8) dan release_year (Int16) ke DataFrame berkolom games
+    (release_date berupa teks 'YYYY-MM-DD' atau objek tanggal). Kolom yang sudah ada tidak
+    dihitung ulang. Mengembalikan DataFrame yang sama.
+    """
+    if 'review_score' not in df.columns:
+        df['review_score'] = df['review_type'].map(REVIEW_SCORE_MAP).astype('Int8')
+    if 'release_year' not in df.columns:
+        years = df['release_date'].astype('string').str.slice(0, 4)
+        df['release_year'] = pd.to_numeric(years, errors='coerce').astype('Int16')
+    return df
+
+
+def parse_year_range(text):
+    """
+    Parameter filter tahun rilis: '2019', '2015-2020', '2015-', atau '-2020' menjadi
+    (tahun_awal, tahun_akhir) dengan None untuk sisi terbuka; string kosong menjadi None.
+    Melempar ValueError jika formatnya tidak valid.
+    """
+    text = (text or '').strip()
+    if not text:
+        return None
+    invalid = ValueError("Parameter release_year tidak valid. Gunakan format 2019, 2015-2020, 2015-, atau -2020.")
+    start, separator, end = text.partition('-')
+    try:
+        start = int(start) if start.strip() else None
+        end = int(end) if end.strip() else None
+    except ValueError:
+        raise invalid
+    if not separator:
+        end = start
+    if start is None and end is None:
+        raise invalid
+    return start, end
+
+
+def derived_filter_conditions(release_year=None, min_score=None, placeholder='%s'):
+    """
+    Kondisi WHERE untuk filter tahun rilis ((awal, akhir) dari parse_year_range) dan skor
+    review minimum di atas kolom turunan ber-index. Mengembalikan (list kondisi, params).
+    """
+    conditions = []
+    params = []
+    if release_year:
+        start, end = release_year
+        if start is not None:
+            conditions.append(f"release_year >= {placeholder}")
+            params.append(start)
+        if end is not None:
+            conditions.append(f"release_year <= {placeholder}")
+            params.append(end)
+    if min_score is not None:
+        conditions.append(f"review_score >= {placeholder}")
+        params.append(min_score)
+    return conditions, params
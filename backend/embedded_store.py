@@ -0,0 +1,708 @@
+# embedded_store.py
+
+# GameStore tertanam tanpa server database: SQLite (modul bawaan Python, file lokal atau
+# ':memory:') atau DuckDB (engine kolumnar, opsional: pip install duckdb). Dipakai untuk
+# development dan test tanpa MySQL, serta sebagai pembanding scan analitik dashboard.
+
+# Skema mengikuti MySQL: tabel games (+ kolom natural_key/content_hash untuk upload upsert,
+# dihitung di Python), kamus tags dan relasi game_tags untuk filter genre, dan satu baris
+# dataset_version. Statistik dashboard dihitung dengan scan agregat SQL setiap kali cache
+# dashboard kedaluwarsa (tanpa agregat berjalan). Pencarian memakai LIKE tanpa ranking
+# relevansi. Penulisan diserialkan dengan lock; id game diberikan oleh store (MAX(id) + n).
+
+import hashlib
+import os
+import threading
+import uuid
+import sqlite3
+from abc import abstractmethod
+from collections import Counter
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+from bulk_loader import GAME_COLUMNS
+from tag_index import split_tags, tag_key
+from search_index import SEARCH_FIELDS
+from dashboard_stats import GENRE_TOP_N, pearson_from_sums
+from derived_columns import (DERIVED_COLUMNS, REVIEW_SCORE_SQL, add_derived_columns,
+                             derived_filter_conditions)
+from typed_frame import fetch_typed_frame
+from exporter import EXPORT_BATCH_SIZE
+from metrics import stage, timed
+from storage import GameStore, StorageError, GAME_SELECT_FIELDS, ANALYSIS_FIELDS
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    duckdb = None
+    DUCKDB_AVAILABLE = False
+
+STAGING_TABLE = 'games_upload_staging'
+TARGETS_TABLE = 'games_upload_targets'
+
+# Jumlah kunci tag per SELECT ... IN (batas parameter SQLite lama: 999)
+TAG_LOOKUP_BATCH_SIZE = 500
+
+# Tipe kolom games (nama tipe diterima SQLite maupun DuckDB)
+GAME_COLUMN_TYPES = {
+    'name': 'VARCHAR',
+    'price': 'DOUBLE',
+    'release_date': 'DATE',
+    'review_no': 'BIGINT',
+    'review_type': 'VARCHAR',
+    'tags': 'VARCHAR',
+    'description': 'VARCHAR',
+    'review_score': 'SMALLINT',
+    'release_year': 'SMALLINT',
+}
+
+# Kolom games yang ditulis store: kolom upload + kolom turunan (derived_columns.py)
+STORED_COLUMNS = GAME_COLUMNS + DERIVED_COLUMNS
+
+# Pengisian kolom turunan untuk file database yang dibuat sebelum kolom tersebut ada
+DERIVED_BACKFILL_SQL = {
+    'review_score': REVIEW_SCORE_SQL,
+    'release_year': "CAST(SUBSTR(CAST(release_date AS VARCHAR), 1, 4) AS INTEGER)",
+}
+
+
+def _game_table_ddl(table, id_column='id', temporary=False):
+    columns = ', '.join(f"{col} {GAME_COLUMN_TYPES[col]}" for col in STORED_COLUMNS)
+    return (
+        f"CREATE {'TEMP ' if temporary else ''}TABLE IF NOT EXISTS {table} ("
+        f"{id_column} INTEGER PRIMARY KEY, {columns}, natural_key VARCHAR, content_hash VARCHAR)"
+    )
+
+
+SCHEMA_STATEMENTS = [
+    _game_table_ddl('games'),
+    "CREATE TABLE IF NOT EXISTS tags (name_key VARCHAR PRIMARY KEY, name VARCHAR NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS game_tags (game_id INTEGER NOT NULL, tag_key VARCHAR NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS dataset_version (id INTEGER PRIMARY KEY, epoch VARCHAR NOT NULL, "
+    "version BIGINT NOT NULL, rows_changed BIGINT NOT NULL, rewrite_version BIGINT NOT NULL)",
+]
+
+
+def game_keys(df):
+    """
+    (natural_key, content_hash) per baris, setara game_upsert.py: SHA1 dari nama (trim +
+    lowercase) dan release_date, serta SHA1 dari seluruh kolom GAME_COLUMNS (NULL -> \\N).
+    """
+    frame = df.reindex(columns=GAME_COLUMNS).astype(object)
+    frame = frame.where(frame.notna(), None)
+    natural_keys = [
+        hashlib.sha1(f"{name.strip().lower()}|{release_date or ''}".encode()).hexdigest()
+        if isinstance(name, str) else None
+        for name, release_date in zip(frame['name'], frame['release_date'])
+    ]
+    content_hashes = [
+        hashlib.sha1('|'.join('\\N' if value is None else str(value) for value in row).encode()).hexdigest()
+        for row in frame.itertuples(index=False, name=None)
+    ]
+    return natural_keys, content_hashes
+
+
+def _scored_games_cte():
+    """CTE `scored`: baris yang lolos prepare_analysis_frame beserta skor tersimpannya."""
+    return (
+        "WITH scored AS (SELECT id, price, CAST(review_no AS DOUBLE) AS review_no, review_type, "
+        "review_score AS score FROM games WHERE price IS NOT NULL AND review_no IS NOT NULL "
+        "AND review_score IS NOT NULL) ",
+        []
+    )
+
+
+class EmbeddedGameStore(GameStore):
+    """Implementasi bersama SQLite/DuckDB; subclass menyediakan koneksi dan bulk insert."""
+
+    # Exception driver yang diterjemahkan menjadi StorageError
+    errors = ()
+    index_statements = []
+
+    def __init__(self, path, count_cache=None):
+        self.path = path
+        self.count_cache = count_cache
+        self._write_lock = threading.RLock()
+        self._local = threading.local()
+        self._connections = []
+        with self._transaction() as conn:
+            for statement in SCHEMA_STATEMENTS:
+                conn.execute(statement)
+            self._add_missing_columns(conn)
+            for statement in self.index_statements:
+                conn.execute(statement)
+            conn.execute(
+                "INSERT OR IGNORE INTO dataset_version (id, epoch, version, rows_changed, rewrite_version) "
+                "VALUES (1, ?, 0, 0, 0)", (uuid.uuid4().hex,)
+            )
+
+    def _add_missing_columns(self, conn):
+        existing = {desc[0] for desc in conn.execute("SELECT * FROM games LIMIT 0").description}
+        for column in DERIVED_COLUMNS:
+            if column not in existing:
+                conn.execute(f"ALTER TABLE games ADD COLUMN {column} {GAME_COLUMN_TYPES[column]}")
+                conn.execute(f"UPDATE games SET {column} = {DERIVED_BACKFILL_SQL[column]}")
+
+    # --- Koneksi dan Transaksi (diimplementasikan per engine) ---
+
+    @abstractmethod
+    def _open_connection(self):
+        """Koneksi baru ke file database (satu per thread)."""
+
+    @abstractmethod
+    def _cursor(self, conn):
+        """Objek dengan execute()/description/fetchmany() untuk fetch_typed_frame."""
+
+    @abstractmethod
+    def _insert_frame(self, conn, table, df, ignore=False):
+        """Bulk insert DataFrame (nama kolom = kolom tabel)."""
+
+    def _connection(self):
+        """Koneksi milik thread ini (dibuka saat pertama dipakai)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._open_connection()
+            self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Transaksi tulis (satu penulis sekaligus); error driver dilempar sebagai StorageError."""
+        with self._write_lock:
+            conn = self._connection()
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException as exc:
+                conn.execute("ROLLBACK")
+                if isinstance(exc, self.errors):
+                    raise StorageError(str(exc)) from exc
+                raise
+
+    @contextmanager
+    def _reading(self):
+        try:
+            yield self._connection()
+        except self.errors as err:
+            raise StorageError(str(err)) from err
+
+    def close(self):
+        for conn in self._connections:
+            conn.close()
+        self._connections = []
+
+    def ping(self):
+        try:
+            with self._reading() as conn:
+                conn.execute("SELECT 1").fetchone()
+            return True
+        except StorageError:
+            return False
+
+    def stats(self):
+        return {
+            "backend": self.backend,
+            "path": self.path,
+            "size_bytes": os.path.getsize(self.path) if os.path.exists(self.path) else None,
+        }
+
+    # --- Helper Penulisan ---
+
+    @staticmethod
+    def _scalar(conn, query, params=()):
+        return conn.execute(query, params).fetchone()[0]
+
+    def _max_game_id(self, conn):
+        return int(self._scalar(conn, "SELECT COALESCE(MAX(id), 0) FROM games"))
+
+    def _insert_games(self, conn, df, first_id, table='games', id_column='id'):
+        """
+        Insert chunk dengan id berurutan mulai first_id + 1; mengembalikan array id. Kolom
+        turunan dari parser dipakai apa adanya, yang belum ada dihitung di sini.
+        """
+        frame = add_derived_columns(df.reindex(columns=GAME_COLUMNS + [col for col in DERIVED_COLUMNS if col in df.columns]))
+        frame = frame.astype(object).where(frame.notna(), None)
+        ids = np.arange(first_id + 1, first_id + 1 + len(frame), dtype=np.int64)
+        frame.insert(0, id_column, ids)
+        frame['natural_key'], frame['content_hash'] = game_keys(frame)
+        self._insert_frame(conn, table, frame)
+        return ids
+
+    def _index_tags(self, conn, rows):
+        """Menambah relasi game_tags untuk (game_id, tags); mengembalikan Counter {tag: +n}."""
+        pairs = []
+        names = {}
+        for game_id, tags in rows:
+            for tag in split_tags(tags):
+                key = tag_key(tag)
+                names.setdefault(key, tag)
+                pairs.append((int(game_id), key))
+        if not pairs:
+            return Counter()
+        self._insert_frame(conn, 'tags', pd.DataFrame(
+            {'name_key': list(names), 'name': list(names.values())}
+        ), ignore=True)
+        self._insert_frame(conn, 'game_tags', pd.DataFrame(pairs, columns=['game_id', 'tag_key']))
+        # Nama yang tersimpan (kemunculan pertama) menjadi nama tampilan tag; hanya tag chunk ini
+        keys = list(names)
+        stored = {}
+        for start in range(0, len(keys), TAG_LOOKUP_BATCH_SIZE):
+            batch = keys[start:start + TAG_LOOKUP_BATCH_SIZE]
+            stored.update(conn.execute(
+                f"SELECT name_key, name FROM tags WHERE name_key IN ({', '.join(['?'] * len(batch))})", batch
+            ).fetchall())
+        return Counter(stored[key] for _, key in pairs)
+
+    def _remove_tags(self, conn, id_subquery, params=()):
+        """Menghapus relasi tag game hasil `id_subquery`; mengembalikan Counter {tag: -n}."""
+        removed = conn.execute(
+            "SELECT t.name, COUNT(*) FROM game_tags gt JOIN tags t ON t.name_key = gt.tag_key "
+            f"WHERE gt.game_id IN ({id_subquery}) GROUP BY t.name", params
+        ).fetchall()
+        conn.execute(f"DELETE FROM game_tags WHERE game_id IN ({id_subquery})", params)
+        return Counter({name: -int(count) for name, count in removed})
+
+    def _bump_version(self, conn, rows_changed=0, append_only=False):
+        """Sama seperti dataset_version.bump_dataset_version."""
+        conn.execute(
+            "UPDATE dataset_version SET rewrite_version = CASE WHEN ? THEN rewrite_version ELSE version + 1 END, "
+            "version = version + 1, rows_changed = rows_changed + ? WHERE id = 1",
+            (bool(append_only), int(rows_changed))
+        )
+
+    # --- Upload ---
+
+    def save_chunks(self, chunks, on_chunk_saved=None, dedup='append'):
+        upsert = dedup == 'upsert'
+        total_inserted_count = 0
+        tag_deltas = Counter()
+        with self._transaction() as conn:
+            try:
+                if upsert:
+                    conn.execute(_game_table_ddl(STAGING_TABLE, id_column='staging_id', temporary=True))
+                last_id = self._max_game_id(conn)
+                for chunk in chunks:
+                    with stage('bulk_insert', rows=len(chunk)):
+                        if upsert:
+                            self._insert_games(conn, chunk, total_inserted_count, table=STAGING_TABLE,
+                                               id_column='staging_id')
+                        else:
+                            ids = self._insert_games(conn, chunk, last_id)
+                            tag_deltas.update(self._index_tags(conn, zip(ids, chunk['tags'])))
+                            last_id += len(ids)
+                    total_inserted_count += len(chunk)
+                    if on_chunk_saved:
+                        on_chunk_saved(len(chunk))
+
+                if upsert:
+                    with stage('merge_staging', rows=total_inserted_count):
+                        summary, tag_deltas = self._merge_staging(conn)
+                    rows_changed = summary["inserted"] + summary["updated"]
+                    if rows_changed:
+                        self._bump_version(conn, rows_changed, append_only=summary["updated"] == 0)
+                else:
+                    self._bump_version(conn, total_inserted_count, append_only=True)
+                    summary = {"inserted": total_inserted_count, "updated": 0, "unchanged": 0, "duplicates_in_file": 0}
+            finally:
+                if upsert:
+                    conn.execute(f"DROP TABLE IF EXISTS {TARGETS_TABLE}")
+                    conn.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+        return total_inserted_count, summary, tag_deltas
+
+    def _merge_staging(self, conn):
+        """Langkah yang sama seperti game_upsert.merge_staging, dengan jumlah baris dari COUNT."""
+        columns = ', '.join(STORED_COLUMNS)
+        staged = self._scalar(conn, f"SELECT COUNT(*) FROM {STAGING_TABLE}")
+
+        # Kunci yang muncul berulang di file yang sama: baris terakhir yang dipakai
+        conn.execute(
+            f"DELETE FROM {STAGING_TABLE} WHERE natural_key IS NOT NULL AND staging_id NOT IN ("
+            f"SELECT MAX(staging_id) FROM {STAGING_TABLE} WHERE natural_key IS NOT NULL GROUP BY natural_key)"
+        )
+        deduplicated = self._scalar(conn, f"SELECT COUNT(*) FROM {STAGING_TABLE}")
+
+        # Baris yang identik dengan game yang sudah ada
+        conn.execute(
+            f"DELETE FROM {STAGING_TABLE} WHERE EXISTS (SELECT 1 FROM games g "
+            f"WHERE g.natural_key = {STAGING_TABLE}.natural_key AND g.content_hash = {STAGING_TABLE}.content_hash)"
+        )
+        remaining = self._scalar(conn, f"SELECT COUNT(*) FROM {STAGING_TABLE}")
+
+        # Sisa baris dengan kunci yang sudah ada: isi berubah, game lama di-update
+        conn.execute(
+            f"CREATE TEMP TABLE {TARGETS_TABLE} AS SELECT DISTINCT g.id AS game_id "
+            f"FROM games g JOIN {STAGING_TABLE} s ON g.natural_key = s.natural_key"
+        )
+        targets = f"SELECT game_id FROM {TARGETS_TABLE}"
+        updated = self._scalar(conn, f"SELECT COUNT(*) FROM {TARGETS_TABLE}")
+        tag_deltas = Counter()
+        if updated:
+            tag_deltas.update(self._remove_tags(conn, targets))
+            assignments = ', '.join(f"{col} = s.{col}" for col in STORED_COLUMNS + ['content_hash'])
+            conn.execute(
+                f"UPDATE games SET {assignments} FROM {STAGING_TABLE} s WHERE games.natural_key = s.natural_key"
+            )
+            rows = conn.execute(f"SELECT id, tags FROM games WHERE id IN ({targets}) ORDER BY id").fetchall()
+            tag_deltas.update(self._index_tags(conn, rows))
+
+        # Kunci baru di-insert sesuai urutan di file
+        last_id = self._max_game_id(conn)
+        conn.execute(
+            f"INSERT INTO games (id, {columns}, natural_key, content_hash) "
+            f"SELECT ? + ROW_NUMBER() OVER (ORDER BY s.staging_id), {columns}, s.natural_key, s.content_hash "
+            f"FROM {STAGING_TABLE} s WHERE NOT EXISTS (SELECT 1 FROM games g WHERE g.natural_key = s.natural_key)",
+            (last_id,)
+        )
+        rows = conn.execute("SELECT id, tags FROM games WHERE id > ? ORDER BY id", (last_id,)).fetchall()
+        tag_deltas.update(self._index_tags(conn, rows))
+
+        summary = {
+            "inserted": len(rows),
+            "updated": updated,
+            "unchanged": deduplicated - remaining,
+            "duplicates_in_file": staged - deduplicated,
+        }
+        return summary, tag_deltas
+
+    # --- Pembacaan Data Tampilan ---
+
+    def build_game_filters(self, search=None, genre=None, review_type=None, search_fields='name',
+                           release_year=None, min_score=None):
+        """
+        Klausa FROM/WHERE dan parameter ('?') untuk pencarian (LIKE), genre (semua), review type,
+        tahun rilis, dan skor review minimum.
+        """
+        conditions = ["1=1"]
+        params = []
+        if search:
+            _, columns = SEARCH_FIELDS.get(search_fields, SEARCH_FIELDS['name'])
+            columns = [col.strip() for col in columns.split(',')]
+            conditions.append("(" + " OR ".join(f"LOWER({col}) LIKE ?" for col in columns) + ")")
+            params.extend([f"%{search.lower()}%"] * len(columns))
+
+        if genre:
+            genres = {tag_key(g.strip()) for g in genre.split(',') if g.strip()}
+            for key in sorted(genres):
+                conditions.append("id IN (SELECT game_id FROM game_tags WHERE tag_key = ?)")
+                params.append(key)
+
+        if review_type:
+            reviews = [r.strip() for r in review_type.split(',') if r.strip()]
+            if reviews:
+                conditions.append(f"review_type IN ({', '.join(['?'] * len(reviews))})")
+                params.extend(reviews)
+
+        derived_conditions, derived_params = derived_filter_conditions(release_year, min_score, placeholder='?')
+        conditions.extend(derived_conditions)
+        params.extend(derived_params)
+
+        return "FROM games WHERE " + " AND ".join(conditions), params
+
+    def _count_games(self, conn, base_query, params, count_mode):
+        """Mode count seperti MySQLGameStore; 'approx' sama dengan 'cached' (COUNT murah di file lokal)."""
+        if count_mode == 'none':
+            return None
+        cache_key = (self.backend, base_query, tuple(params))
+        use_cache = count_mode in ('cached', 'approx') and self.count_cache is not None
+        if use_cache:
+            cached_total = self.count_cache.get(cache_key)
+            if cached_total is not None:
+                return cached_total
+        total = int(self._scalar(conn, "SELECT COUNT(id) " + base_query, params))
+        if use_cache:
+            self.count_cache.set(cache_key, total)
+        return total
+
+    def fetch_games(self, limit=None, offset=None, search=None, genre=None, review_type=None,
+                    after_id=None, before_id=None, count_mode='exact', search_fields='name',
+                    sort='id', fields=None, typed=False, release_year=None, min_score=None):
+        select_fields = fields or GAME_SELECT_FIELDS
+        base_query, params = self.build_game_filters(
+            search=search, genre=genre, review_type=review_type, search_fields=search_fields,
+            release_year=release_year, min_score=min_score
+        )
+        data_query = f"SELECT {select_fields} " + base_query
+        data_params = list(params)
+        # Tanpa ranking relevansi: sort='relevance' tetap diurutkan berdasarkan id
+        if after_id is not None:
+            data_query += " AND id < ? ORDER BY id DESC LIMIT ?"
+            data_params.extend([after_id, limit])
+        elif before_id is not None:
+            data_query += " AND id > ? ORDER BY id ASC LIMIT ?"
+            data_params.extend([before_id, limit])
+        elif limit is not None and offset is not None:
+            data_query += " ORDER BY id DESC LIMIT ? OFFSET ?"
+            data_params.extend([limit, offset])
+        else:
+            data_query += " ORDER BY id DESC"
+
+        with self._reading() as conn:
+            total_records = self._count_games(conn, base_query, params, count_mode)
+            if typed:
+                df = fetch_typed_frame(self._cursor(conn), data_query, data_params)
+            else:
+                result = conn.execute(data_query, data_params)
+                rows = result.fetchall()
+                df = pd.DataFrame(rows, columns=[desc[0] for desc in result.description]) if rows else pd.DataFrame()
+        if before_id is not None:
+            df = df.iloc[::-1].reset_index(drop=True)
+        return df, total_records
+
+    def open_export(self, search=None, genre=None, review_type=None, search_fields='name',
+                    release_year=None, min_score=None):
+        """Batch export dibaca dengan pagination keyset (id DESC), sehingga koneksi tidak ditahan."""
+        base_query, params = self.build_game_filters(
+            search=search, genre=genre, review_type=review_type, search_fields=search_fields,
+            release_year=release_year, min_score=min_score
+        )
+        columns = [col.strip() for col in GAME_SELECT_FIELDS.split(',')]
+
+        def batches():
+            last_id = None
+            while True:
+                query = f"SELECT {GAME_SELECT_FIELDS} " + base_query
+                batch_params = list(params)
+                if last_id is not None:
+                    query += " AND id < ?"
+                    batch_params.append(last_id)
+                with self._reading() as conn:
+                    rows = conn.execute(query + " ORDER BY id DESC LIMIT ?", batch_params + [EXPORT_BATCH_SIZE]).fetchall()
+                if not rows:
+                    return
+                yield rows
+                last_id = rows[-1][0]
+
+        return columns, batches(), lambda finished: None
+
+    # --- CRUD Game Tunggal ---
+
+    def add_game(self, values):
+        with self._transaction() as conn:
+            # Hanya kolom input; kolom turunan selalu dihitung ulang dari nilainya
+            row = pd.DataFrame([values]).reindex(columns=GAME_COLUMNS)
+            game_id = int(self._insert_games(conn, row, self._max_game_id(conn))[0])
+            tag_deltas = self._index_tags(conn, [(game_id, values['tags'])])
+            self._bump_version(conn, 1, append_only=True)
+        return game_id, tag_deltas
+
+    def update_game(self, game_id, values):
+        frame = add_derived_columns(pd.DataFrame([{col: values[col] for col in GAME_COLUMNS}]))
+        natural_keys, content_hashes = game_keys(frame)
+        row = frame.astype(object).where(frame.notna(), None).iloc[0]
+        with self._transaction() as conn:
+            if not self._scalar(conn, "SELECT COUNT(*) FROM games WHERE id = ?", (game_id,)):
+                return False, Counter()
+            assignments = ', '.join(f"{col} = ?" for col in STORED_COLUMNS)
+            conn.execute(
+                f"UPDATE games SET {assignments}, natural_key = ?, content_hash = ? WHERE id = ?",
+                [row[col] for col in STORED_COLUMNS] + [natural_keys[0], content_hashes[0], game_id]
+            )
+            tag_deltas = self._remove_tags(conn, "?", (game_id,))
+            tag_deltas.update(self._index_tags(conn, [(game_id, values['tags'])]))
+            self._bump_version(conn, 1)
+        return True, tag_deltas
+
+    def delete_game(self, game_id):
+        with self._transaction() as conn:
+            if not self._scalar(conn, "SELECT COUNT(*) FROM games WHERE id = ?", (game_id,)):
+                return False, Counter()
+            tag_deltas = self._remove_tags(conn, "?", (game_id,))
+            conn.execute("DELETE FROM games WHERE id = ?", (game_id,))
+            self._bump_version(conn, 1)
+        return True, tag_deltas
+
+    def clear_games(self):
+        with self._transaction() as conn:
+            removed_count = self._scalar(conn, "SELECT COUNT(id) FROM games")
+            for table in ('game_tags', 'tags', 'games'):
+                conn.execute(f"DELETE FROM {table}")
+            self._bump_version(conn, removed_count)
+
+    # --- Tag, Versi Dataset, dan Analisis ---
+
+    def tag_counts(self):
+        with self._reading() as conn:
+            rows = conn.execute(
+                "SELECT t.name, COUNT(*) FROM game_tags gt JOIN tags t ON t.name_key = gt.tag_key GROUP BY t.name"
+            ).fetchall()
+        return {name: int(count) for name, count in rows}
+
+    def dataset_version(self):
+        with self._reading() as conn:
+            epoch, version, rows_changed, rewrite_version = conn.execute(
+                "SELECT epoch, version, rows_changed, rewrite_version FROM dataset_version WHERE id = 1"
+            ).fetchone()
+        return {
+            "token": f"{epoch}-{version}",
+            "epoch": epoch,
+            "version": int(version),
+            "rows_changed": int(rows_changed),
+            "rewrite_version": int(rewrite_version),
+        }
+
+    def analysis_rows(self, after_id=0):
+        with self._reading() as conn:
+            return fetch_typed_frame(
+                self._cursor(conn), f"SELECT {ANALYSIS_FIELDS} FROM games WHERE id > ? ORDER BY id", (after_id,)
+            )
+
+    @timed('fetch_dashboard_stats_sql')
+    def dashboard_stats(self):
+        """Statistik dashboard dari scan agregat SQL (struktur sama seperti fetch_dashboard_stats)."""
+        cte, cte_params = _scored_games_cte()
+        with self._reading() as conn:
+            (total, sum_price, sum_review_no, sum_score, sum_price_sq, sum_review_no_sq, sum_score_sq,
+             sum_price_score, sum_review_no_score, min_price, max_price) = conn.execute(
+                cte + "SELECT COUNT(*), SUM(price), SUM(review_no), SUM(score), SUM(price * price), "
+                "SUM(review_no * review_no), SUM(score * score), SUM(price * score), SUM(review_no * score), "
+                "MIN(price), MAX(price) FROM scored", cte_params
+            ).fetchone()
+            review_rows = conn.execute(
+                cte + "SELECT review_type, COUNT(*) AS game_count FROM scored "
+                "GROUP BY review_type ORDER BY game_count DESC, review_type", cte_params
+            ).fetchall()
+            genre_rows = conn.execute(
+                cte + "SELECT t.name, COUNT(*) AS game_count, SUM(s.score) FROM scored s "
+                "JOIN game_tags gt ON gt.game_id = s.id JOIN tags t ON t.name_key = gt.tag_key "
+                "GROUP BY t.name ORDER BY game_count DESC, t.name LIMIT ?", cte_params + [GENRE_TOP_N]
+            ).fetchall() if total else []
+
+        total = int(total or 0)
+        descriptive_stats = {
+            "total_games": total,
+            "avg_review_no": round(float(sum_review_no) / total, 2) if total else 0,
+            "price_range": f"${float(min_price or 0):.2f} - ${float(max_price or 0):.2f}",
+            "review_distribution": {review_type: int(count) for review_type, count in review_rows},
+        }
+
+        correlation_results = {}
+        if total > 1:
+            correlations = {
+                'price_vs_review_score': (sum_price, sum_price_sq, sum_price_score),
+                'review_no_vs_review_score': (sum_review_no, sum_review_no_sq, sum_review_no_score),
+            }
+            for key, (sum_x, sum_xx, sum_xy) in correlations.items():
+                value = pearson_from_sums(total, sum_x, sum_score, sum_xx, sum_score_sq, sum_xy)
+                correlation_results[key] = round(value, 4) if value is not None else None
+
+        genre_data = {"distribution": {}, "avg_score": {}}
+        for name, count, score_sum in genre_rows:
+            genre_data["distribution"][name] = int(count)
+            genre_data["avg_score"][name] = round(float(score_sum) / int(count), 4)
+
+        return {
+            "descriptive_stats": descriptive_stats,
+            "correlation_results": correlation_results,
+            "genre_data": genre_data,
+        }
+
+
+class SQLiteGameStore(EmbeddedGameStore):
+    """SQLite (mode WAL untuk file): pembaca berjalan paralel dengan satu penulis."""
+
+    backend = 'sqlite'
+    errors = (sqlite3.Error,)
+    index_statements = [
+        "CREATE INDEX IF NOT EXISTS idx_games_review_type ON games (review_type)",
+        "CREATE INDEX IF NOT EXISTS idx_games_natural_key ON games (natural_key)",
+        "CREATE INDEX IF NOT EXISTS idx_games_review_score ON games (review_score)",
+        "CREATE INDEX IF NOT EXISTS idx_games_release_year ON games (release_year)",
+        "CREATE INDEX IF NOT EXISTS idx_game_tags_tag ON game_tags (tag_key, game_id)",
+        "CREATE INDEX IF NOT EXISTS idx_game_tags_game ON game_tags (game_id)",
+    ]
+
+    def __init__(self, path, count_cache=None):
+        # Database ':memory:' hanya terlihat dari satu koneksi: semua thread memakai koneksi
+        # yang sama dan pembacaan ikut diserialkan dengan lock penulisan
+        self._shared_conn = None
+        if path == ':memory:':
+            self._shared_conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        super().__init__(path, count_cache=count_cache)
+
+    def _open_connection(self):
+        if self._shared_conn is not None:
+            return self._shared_conn
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _reading(self):
+        if self._shared_conn is None:
+            with super()._reading() as conn:
+                yield conn
+            return
+        with self._write_lock, super()._reading() as conn:
+            yield conn
+
+    def close(self):
+        super().close()
+        if self._shared_conn is not None:
+            self._shared_conn.close()
+            self._shared_conn = None
+
+    def _cursor(self, conn):
+        return conn.cursor()
+
+    def _insert_frame(self, conn, table, df, ignore=False):
+        frame = df.astype(object).where(df.notna(), None)
+        placeholders = ', '.join(['?'] * len(frame.columns))
+        conn.executemany(
+            f"INSERT {'OR IGNORE ' if ignore else ''}INTO {table} ({', '.join(frame.columns)}) VALUES ({placeholders})",
+            frame.itertuples(index=False, name=None)
+        )
+
+
+class DuckDBGameStore(EmbeddedGameStore):
+    """
+    DuckDB: penyimpanan kolumnar dengan eksekusi vektor untuk scan agregat dashboard.
+    Tanpa index sekunder (filter memakai zone map per row group); setiap thread memakai
+    koneksi turunan (cursor) dari satu database.
+    """
+
+    backend = 'duckdb'
+    errors = (duckdb.Error,) if DUCKDB_AVAILABLE else ()
+
+    def __init__(self, path, count_cache=None):
+        if not DUCKDB_AVAILABLE:
+            raise StorageError("STORAGE_BACKEND='duckdb' membutuhkan paket duckdb (pip install duckdb).")
+        self._database = duckdb.connect(path)
+        super().__init__(path, count_cache=count_cache)
+
+    def _open_connection(self):
+        return self._database.cursor()
+
+    def close(self):
+        super().close()
+        self._database.close()
+
+    def _cursor(self, conn):
+        return conn
+
+    def _insert_frame(self, conn, table, df, ignore=False):
+        # Frame didaftarkan sebagai view lalu di-insert dalam satu statement (tanpa executemany)
+        frame = df.astype(object).where(df.notna(), None)
+        view = f"_insert_{table}"
+        conn.register(view, frame)
+        try:
+            conn.execute(
+                f"INSERT {'OR IGNORE ' if ignore else ''}INTO {table} ({', '.join(frame.columns)}) "
+                f"SELECT {', '.join(frame.columns)} FROM {view}"
+            )
+        finally:
+            conn.unregister(view)
+
+
+EMBEDDED_STORES = {
+    'sqlite': SQLiteGameStore,
+    'duckdb': DuckDBGameStore,
+}
+
+
+def create_embedded_store(backend, path, count_cache=None):
+    if path != ':memory:' and os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    return EMBEDDED_STORES[backend](path, count_cache=count_cache)
@@ -0,0 +1,115 @@
+# exporter.py
+
+# Export data game sebagai stream: baris dibaca per batch dari cursor unbuffered (server-side)
+# dan langsung ditulis ke response dalam format CSV, NDJSON, atau XLSX, opsional gzip.
+# Memori yang dipakai sebanding ukuran batch, bukan jumlah baris hasil export.
+
+import csv
+import datetime
+import io
+import json
+import os
+import tempfile
+import zlib
+from decimal import Decimal
+from openpyxl import Workbook
+
+# Jumlah baris per fetchmany
+EXPORT_BATCH_SIZE = 2000
+
+# Ukuran potongan saat mengirim file XLSX sementara
+FILE_CHUNK_SIZE = 64 * 1024
+
+# format -> (mimetype, ekstensi file)
+EXPORT_FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+}
+
+
+def iter_row_batches(cursor, batch_size=EXPORT_BATCH_SIZE):
+    """Batch tuple dari cursor yang sudah di-execute."""
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield rows
+
+
+def _json_value(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+def iter_csv(columns, batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def iter_ndjson(columns, batches):
+    for rows in batches:
+        yield ''.join(
+            json.dumps({col: _json_value(value) for col, value in zip(columns, row)}, ensure_ascii=False) + '\n'
+            for row in rows
+        ).encode('utf-8')
+
+
+def iter_xlsx(columns, batches):
+    """
+    XLSX adalah arsip zip sehingga tidak bisa ditulis bertahap ke socket: baris ditulis ke
+    workbook write-only (memori konstan) di file sementara, lalu file dikirim per potongan.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('games')
+    sheet.append(columns)
+    for rows in batches:
+        for row in rows:
+            sheet.append([float(v) if isinstance(v, Decimal) else v for v in row])
+
+    fd, path = tempfile.mkstemp(suffix='.xlsx')
+    os.close(fd)
+    try:
+        workbook.save(path)
+        with open(path, 'rb') as xlsx_file:
+            while True:
+                chunk = xlsx_file.read(FILE_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+    finally:
+        os.remove(path)
+
+
+EXPORT_WRITERS = {
+    'csv': iter_csv,
+    'ndjson': iter_ndjson,
+    'xlsx': iter_xlsx,
+}
+
+
+def gzip_stream(chunks, level=6):
+    """Membungkus stream bytes menjadi stream gzip (header + trailer gzip standar)."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_stream(columns, batches, export_format, compress=False):
+    """Generator bytes untuk format export yang diminta."""
+    stream = EXPORT_WRITERS[export_format](columns, batches)
+    return gzip_stream(stream) if compress else stream
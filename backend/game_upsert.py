@@ -0,0 +1,139 @@
+# game_upsert.py
+
+# Upload idempoten: baris upload ditulis dulu ke tabel staging sementara, lalu digabung ke
+# tabel games berdasarkan kunci natural (nama ternormalisasi + release_date). Baris dengan
+# kunci baru di-insert, baris dengan kunci sama tetapi isi berbeda (content_hash) di-update,
+# dan baris yang identik dilewati. Semua langkah berupa statement set-based di MySQL.
+
+from collections import Counter
+from bulk_loader import GAME_COLUMNS
+from tag_index import get_max_game_id, index_games_after, remove_games_in, index_games_in
+from dashboard_stats import merge_games
+
+# Mode upload: 'upsert' (dedup berdasarkan kunci natural) atau 'append' (selalu insert)
+DEDUP_MODES = ('upsert', 'append')
+
+STAGING_TABLE = 'games_upload_staging'
+KEEP_TABLE = 'games_upload_keep'
+TARGETS_TABLE = 'games_upload_targets'
+
+# Kunci natural: nama (trim + lowercase) dan tanggal rilis
+NATURAL_KEY_SQL = "SHA1(CONCAT(LOWER(TRIM(name)), '|', IFNULL(CAST(release_date AS CHAR), '')))"
+
+# Hash isi seluruh kolom upload; NULL ditandai \\N agar berbeda dari string kosong
+CONTENT_HASH_SQL = "SHA1(CONCAT_WS('|', {}))".format(', '.join(
+    f"IFNULL(CAST({col} AS CHAR), '\\\\N')" for col in GAME_COLUMNS
+))
+
+# Migrasi kolom games (kolom virtual: tidak perlu rebuild tabel, nilainya dihitung MySQL)
+GAME_KEY_COLUMN_MIGRATIONS = [
+    ('games', 'natural_key', f"ALTER TABLE games ADD COLUMN natural_key CHAR(40) AS ({NATURAL_KEY_SQL}) VIRTUAL", None),
+    ('games', 'content_hash', f"ALTER TABLE games ADD COLUMN content_hash CHAR(40) AS ({CONTENT_HASH_SQL}) VIRTUAL", None),
+]
+
+# Index non-unik: data lama mungkin sudah berisi duplikat dari upload sebelum mode upsert
+GAME_KEY_INDEX_MIGRATIONS = [
+    ('idx_games_natural_key', "ALTER TABLE games ADD INDEX idx_games_natural_key (natural_key)"),
+]
+
+
+def _drop_temporary_tables(cursor):
+    for table in (TARGETS_TABLE, KEEP_TABLE, STAGING_TABLE):
+        cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {table}")
+
+
+def create_staging_table(cursor):
+    """
+    Membuat tabel staging TEMPORARY (per koneksi) dengan tipe kolom yang sama seperti games.
+    Panggil sebelum penulisan apa pun dalam transaksi: ALTER TABLE melakukan commit implisit.
+    """
+    _drop_temporary_tables(cursor)
+    cursor.execute(
+        f"CREATE TEMPORARY TABLE {STAGING_TABLE} ENGINE=InnoDB "
+        f"AS SELECT {', '.join(GAME_COLUMNS)} FROM games LIMIT 0"
+    )
+    cursor.execute(
+        f"ALTER TABLE {STAGING_TABLE} "
+        "ADD COLUMN staging_id INT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY FIRST, "
+        f"ADD COLUMN natural_key CHAR(40) AS ({NATURAL_KEY_SQL}) STORED, "
+        f"ADD COLUMN content_hash CHAR(40) AS ({CONTENT_HASH_SQL}) STORED, "
+        "ADD INDEX idx_staging_natural_key (natural_key)"
+    )
+    return STAGING_TABLE
+
+
+def drop_staging_table(cursor):
+    """Wajib dipanggil sebelum koneksi dikembalikan ke pool (tabel TEMPORARY ikut koneksi)."""
+    _drop_temporary_tables(cursor)
+
+
+def merge_staging(cursor):
+    """
+    Menggabungkan isi staging ke games dalam transaksi pemanggil; index tag dan agregat
+    dashboard ikut diperbarui. Transaksi pemanggil harus sudah memegang consistent snapshot
+    (REPEATABLE READ) agar "id > id_awal" hanya berisi baris yang di-insert di sini. Mengembalikan (summary, Counter delta tag) dengan summary
+    {inserted, updated, unchanged, duplicates_in_file}.
+    """
+    columns = ', '.join(GAME_COLUMNS)
+
+    # Kunci yang muncul berulang di file yang sama: baris terakhir yang dipakai
+    cursor.execute(
+        f"CREATE TEMPORARY TABLE {KEEP_TABLE} (PRIMARY KEY (staging_id)) "
+        f"SELECT MAX(staging_id) AS staging_id FROM {STAGING_TABLE} "
+        "WHERE natural_key IS NOT NULL GROUP BY natural_key"
+    )
+    cursor.execute(
+        f"DELETE FROM {STAGING_TABLE} WHERE natural_key IS NOT NULL "
+        f"AND staging_id NOT IN (SELECT staging_id FROM {KEEP_TABLE})"
+    )
+    duplicates_in_file = cursor.rowcount
+
+    # Baris yang identik dengan game yang sudah ada
+    cursor.execute(
+        f"DELETE s FROM {STAGING_TABLE} s JOIN games g "
+        "ON g.natural_key = s.natural_key AND g.content_hash = s.content_hash"
+    )
+    unchanged = cursor.rowcount
+
+    # Sisa baris dengan kunci yang sudah ada: isi berubah, game lama di-update
+    cursor.execute(
+        f"CREATE TEMPORARY TABLE {TARGETS_TABLE} (PRIMARY KEY (game_id)) "
+        f"SELECT DISTINCT g.id AS game_id FROM games g JOIN {STAGING_TABLE} s ON g.natural_key = s.natural_key"
+    )
+    targets = f"SELECT game_id FROM {TARGETS_TABLE}"
+    tag_deltas = Counter()
+    updated = 0
+    cursor.execute(f"SELECT COUNT(*) FROM {TARGETS_TABLE}")
+    if cursor.fetchone()[0]:
+        # Kontribusi lama dikurangkan sebelum tag dan baris berubah, lalu ditambahkan kembali
+        merge_games(cursor, f"id IN ({targets})", [], sign=-1)
+        tag_deltas.update(remove_games_in(cursor, targets))
+        assignments = ', '.join(f"g.{col} = s.{col}" for col in GAME_COLUMNS)
+        cursor.execute(
+            f"UPDATE games g JOIN {STAGING_TABLE} s ON g.natural_key = s.natural_key SET {assignments}"
+        )
+        updated = cursor.rowcount
+        tag_deltas.update(index_games_in(cursor, targets))
+        merge_games(cursor, f"id IN ({targets})", [], sign=1)
+
+    # Kunci baru di-insert sesuai urutan di file
+    last_id = get_max_game_id(cursor)
+    cursor.execute(
+        f"INSERT INTO games ({columns}) SELECT {columns} FROM {STAGING_TABLE} s "
+        "WHERE NOT EXISTS (SELECT 1 FROM games g WHERE g.natural_key = s.natural_key) "
+        "ORDER BY s.staging_id"
+    )
+    inserted = cursor.rowcount
+    if inserted:
+        _, insert_deltas = index_games_after(cursor, last_id)
+        tag_deltas.update(insert_deltas)
+        # Consistent read: hanya baris insert ini (snapshot dari MySQLGameStore._begin_snapshot)
+        merge_games(cursor, "id > %s", [last_id], lock=False)
+
+    summary = {
+        "inserted": inserted,
+        "updated": updated,
+        "unchanged": unchanged,
+        "duplicates_in_file": duplicates_in_file,
+    }
+    return summary, tag_deltas
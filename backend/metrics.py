@@ -0,0 +1,251 @@
+# metrics.py
+
+# Instrumentasi hot path backend: setiap tahap (koneksi DB, fetch, parsing, insert, analisis,
+# training, serialisasi JSON) dicatat sebagai histogram durasi, jumlah baris, dan puncak
+# memori, lalu diekspos dalam format teks Prometheus di /metrics. Mode profil per request
+# (opt-in) mengumpulkan rincian tahap yang berjalan di thread request tersebut.
+
+# Puncak memori diukur dengan tracemalloc (alokasi Python/numpy) dan hanya tersedia saat
+# tracing aktif (Config.METRICS_TRACE_MEMORY atau request profil memori). tracemalloc bersifat
+# global per proses, sehingga nilai pada request yang berjalan bersamaan bersifat perkiraan.
+
+import functools
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from contextlib import contextmanager
+
+METRIC_PREFIX = 'veritas'
+
+# Batas bucket histogram durasi (detik)
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+_local = threading.local()
+
+
+class Histogram:
+    """Histogram kumulatif gaya Prometheus (bucket le, _sum, _count)."""
+
+    def __init__(self, buckets=DURATION_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # bucket terakhir = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            yield bound, total
+
+
+class _StageStats:
+    def __init__(self):
+        self.duration = Histogram()
+        self.rows = 0
+        self.errors = 0
+        self.peak_memory_max = None
+        self.peak_memory_last = None
+
+
+def _format_bound(bound):
+    return '+Inf' if bound == float('inf') else repr(bound)
+
+
+def _labels(**labels):
+    return ','.join(f'{key}="{str(value)}"' for key, value in labels.items())
+
+
+class MetricsRegistry:
+    """Kumpulan metrik tahap dan request HTTP (thread-safe)."""
+
+    def __init__(self, prefix=METRIC_PREFIX):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._requests = {}  # (method, endpoint, status) -> Histogram
+
+    def observe_stage(self, name, seconds, rows=None, peak_memory=None, error=False):
+        with self._lock:
+            stats = self._stages.get(name)
+            if stats is None:
+                stats = self._stages[name] = _StageStats()
+            stats.duration.observe(seconds)
+            if rows:
+                stats.rows += int(rows)
+            if error:
+                stats.errors += 1
+            if peak_memory is not None:
+                stats.peak_memory_last = peak_memory
+                stats.peak_memory_max = max(stats.peak_memory_max or 0, peak_memory)
+
+    def observe_request(self, method, endpoint, status, seconds):
+        key = (method, endpoint, status)
+        with self._lock:
+            histogram = self._requests.get(key)
+            if histogram is None:
+                histogram = self._requests[key] = Histogram()
+            histogram.observe(seconds)
+
+    def _histogram_lines(self, name, histogram, **labels):
+        for bound, count in histogram.cumulative():
+            yield f'{name}_bucket{{{_labels(**labels, le=_format_bound(bound))}}} {count}'
+        yield f'{name}_sum{{{_labels(**labels)}}} {histogram.sum:.6f}'
+        yield f'{name}_count{{{_labels(**labels)}}} {histogram.count}'
+
+    def render(self, gauges=None):
+        """
+        Teks exposition format Prometheus. `gauges` opsional: {nama_metrik: (help, {label_tuple: nilai})}
+        untuk metrik tambahan dari komponen lain (misalnya connection pool).
+        """
+        p = self.prefix
+        lines = []
+        with self._lock:
+            stages = sorted(self._stages.items())
+            requests = sorted(self._requests.items())
+
+            lines += [f'# HELP {p}_stage_duration_seconds Durasi tiap tahap hot path.',
+                      f'# TYPE {p}_stage_duration_seconds histogram']
+            for name, stats in stages:
+                lines += self._histogram_lines(f'{p}_stage_duration_seconds', stats.duration, stage=name)
+
+            lines += [f'# HELP {p}_stage_rows_total Jumlah baris yang diproses tiap tahap.',
+                      f'# TYPE {p}_stage_rows_total counter']
+            lines += [f'{p}_stage_rows_total{{{_labels(stage=name)}}} {stats.rows}' for name, stats in stages]
+
+            lines += [f'# HELP {p}_stage_errors_total Jumlah eksekusi tahap yang melempar exception.',
+                      f'# TYPE {p}_stage_errors_total counter']
+            lines += [f'{p}_stage_errors_total{{{_labels(stage=name)}}} {stats.errors}' for name, stats in stages]
+
+            lines += [f'# HELP {p}_stage_peak_memory_bytes Puncak alokasi memori tahap (tracemalloc).',
+                      f'# TYPE {p}_stage_peak_memory_bytes gauge']
+            for name, stats in stages:
+                if stats.peak_memory_max is not None:
+                    lines.append(f'{p}_stage_peak_memory_bytes{{{_labels(stage=name, stat="max")}}} {stats.peak_memory_max}')
+                    lines.append(f'{p}_stage_peak_memory_bytes{{{_labels(stage=name, stat="last")}}} {stats.peak_memory_last}')
+
+            lines += [f'# HELP {p}_http_request_duration_seconds Durasi request HTTP per endpoint.',
+                      f'# TYPE {p}_http_request_duration_seconds histogram']
+            for (method, endpoint, status), histogram in requests:
+                lines += self._histogram_lines(
+                    f'{p}_http_request_duration_seconds', histogram,
+                    method=method, endpoint=endpoint, status=status
+                )
+
+        for metric, (help_text, values) in (gauges or {}).items():
+            lines += [f'# HELP {p}_{metric} {help_text}', f'# TYPE {p}_{metric} gauge']
+            for label_items, value in values.items():
+                label_text = f'{{{_labels(**dict(label_items))}}}' if label_items else ''
+                lines.append(f'{p}_{metric}{label_text} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+
+class _StageRecord:
+    def __init__(self, name, rows):
+        self.name = name
+        self.rows = rows
+        self.start_memory = 0
+        self.peak_seen = 0
+
+
+@contextmanager
+def stage(name, rows=None):
+    """
+    Mengukur satu tahap: `with stage('fetch_all_game_data') as s: ...; s.rows = len(df)`.
+    Tahap boleh bersarang; durasi bersifat inklusif (termasuk tahap anak).
+    """
+    record = _StageRecord(name, rows)
+    stack = _local.__dict__.setdefault('stack', [])
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+        # Puncak induk sejauh ini disimpan sebelum di-reset untuk tahap ini
+        if stack:
+            stack[-1].peak_seen = max(stack[-1].peak_seen, peak)
+        tracemalloc.reset_peak()
+        record.start_memory = record.peak_seen = current
+    stack.append(record)
+    error = False
+    start = time.perf_counter()
+    try:
+        yield record
+    except BaseException:
+        error = True
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        stack.pop()
+        peak_memory = None
+        if tracing and tracemalloc.is_tracing():
+            record.peak_seen = max(record.peak_seen, tracemalloc.get_traced_memory()[1])
+            peak_memory = max(record.peak_seen - record.start_memory, 0)
+            if stack:
+                stack[-1].peak_seen = max(stack[-1].peak_seen, record.peak_seen)
+        registry.observe_stage(name, elapsed, record.rows, peak_memory, error)
+
+        profile = getattr(_local, 'profile', None)
+        if profile is not None:
+            entry = {
+                "stage": name,
+                "depth": len(stack),
+                "offset_seconds": round(start - _local.profile_started, 6),
+                "seconds": round(elapsed, 6),
+                "rows": record.rows,
+                "error": error,
+            }
+            if peak_memory is not None:
+                entry["peak_memory_bytes"] = peak_memory
+            profile.append(entry)
+
+
+def timed(name, rows=None):
+    """
+    Decorator versi stage(); `rows(hasil)` opsional menghitung jumlah baris dari nilai kembalian.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name) as record:
+                result = func(*args, **kwargs)
+                if rows is not None:
+                    record.rows = rows(result)
+                return result
+        return wrapper
+    return decorator
+
+
+def start_profile(trace_memory=False):
+    """Mulai mengumpulkan rincian tahap untuk thread ini (satu request)."""
+    _local.profile = []
+    _local.started_tracing = False
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _local.started_tracing = True
+    _local.profile_started = time.perf_counter()
+
+
+def finish_profile():
+    """Menghentikan profil thread ini; mengembalikan {"total_seconds", "stages"} atau None."""
+    profile = getattr(_local, 'profile', None)
+    if profile is None:
+        return None
+    _local.profile = None
+    if _local.started_tracing:
+        tracemalloc.stop()
+    # Tahap dicatat saat selesai (anak sebelum induk); diurutkan ulang sesuai urutan mulai
+    profile.sort(key=lambda entry: (entry["offset_seconds"], entry["depth"]))
+    total = time.perf_counter() - _local.profile_started
+    return {"total_seconds": round(total, 6), "stages": profile}
+
+
+def profiling_active():
+    return getattr(_local, 'profile', None) is not None
@@ -0,0 +1,86 @@
+# model_training.py
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from data_processor.analyzer import train_classifier, prepare_analysis_frame
+from data_processor.model_registry import build_metadata, needs_retraining, compare_with_baseline
+from metrics import stage
+
+
+class TrainingManager:
+    """
+    Menjalankan pelatihan RandomForest di background thread (satu training pada satu waktu)
+    dan menyimpan hasilnya ke ModelRegistry. Dashboard hanya membaca model terbaru.
+    """
+
+    def __init__(self, registry, load_training_data, min_change_ratio=0.05, train_options=None):
+        self.registry = registry
+        self.min_change_ratio = min_change_ratio
+        # Argumen tambahan untuk train_classifier (n_jobs, cv_folds)
+        self.train_options = dict(train_options or {})
+        # load_training_data(full_data) -> (DataFrame, error, info sampling atau None)
+        self._load_training_data = load_training_data
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='model-training')
+        self._lock = threading.Lock()
+        self._running_version = None
+        self._started_at = None
+        self._last_failure = None  # (token versi dataset, pesan error)
+
+    def maybe_schedule(self, dataset_version, force=False, full_data=False):
+        """
+        Menjadwalkan training jika data berubah cukup banyak sejak model terakhir (atau force).
+        full_data=True melatih dengan seluruh data walaupun row budget sampling aktif
+        (menghasilkan baseline pembanding untuk model sampel).
+        Mengembalikan True jika training baru dijadwalkan.
+        """
+        token = dataset_version["token"]
+        with self._lock:
+            if self._running_version is not None:
+                return False
+            if not force:
+                # Jangan mengulang training yang sudah gagal untuk versi data yang sama
+                if self._last_failure and self._last_failure[0] == token:
+                    return False
+                if not needs_retraining(self.registry.latest_metadata(), dataset_version, self.min_change_ratio):
+                    return False
+            self._running_version = token
+            self._started_at = time.time()
+        self._executor.submit(self._train, dataset_version, full_data)
+        return True
+
+    def _train(self, dataset_version, full_data=False):
+        error = None
+        try:
+            with stage('load_training_data') as load_stage:
+                df, error, sampling = self._load_training_data(full_data)
+                load_stage.rows = len(df) if df is not None else 0
+            if error is None:
+                prepare_analysis_frame(df)
+                start = time.perf_counter()
+                with stage('train_classifier', rows=len(df)):
+                    artifacts, classification_results, error = train_classifier(df, **self.train_options)
+                training_seconds = time.perf_counter() - start
+                if error is None:
+                    metadata = build_metadata(
+                        dataset_version, classification_results, artifacts, training_seconds, sampling
+                    )
+                    metadata["comparison"] = compare_with_baseline(metadata, self.registry.full_data_baseline())
+                    self.registry.save(artifacts, metadata)
+        except Exception as e:
+            print(f"Error during model training: {e}")
+            error = f"Gagal melatih model: {e}"
+        finally:
+            with self._lock:
+                self._last_failure = (dataset_version["token"], error) if error else None
+                self._running_version = None
+                self._started_at = None
+
+    def status(self):
+        with self._lock:
+            return {
+                "training": self._running_version is not None,
+                "training_dataset_version": self._running_version,
+                "training_started_at": self._started_at,
+                "last_error": self._last_failure[1] if self._last_failure else None,
+            }
@@ -0,0 +1,548 @@
+# mysql_store.py
+
+# GameStore untuk MySQL: connection pool, migrasi skema sekali per proses, bulk insert
+# (multi-row INSERT / LOAD DATA), upsert lewat tabel staging, index tag ternormalisasi,
+# agregat dashboard berjalan, pencarian FULLTEXT, dan sampling training di sisi server.
+
+import threading
+from collections import Counter
+import mysql.connector
+import pandas as pd
+from db_pool import ConnectionPool, PoolTimeoutError
+from bulk_loader import bulk_insert_frame, get_max_allowed_packet
+from game_upsert import create_staging_table, drop_staging_table, merge_staging
+from db_schema import ensure_schema
+from tag_index import (get_max_game_id, index_games_after, index_game_tags, reindex_game,
+                       remove_game, clear_tag_index, genre_filter_clause, fetch_tag_counts)
+from search_index import search_clause
+from derived_columns import derived_filter_conditions
+from dataset_version import bump_dataset_version, get_dataset_version
+from dashboard_stats import fetch_dashboard_stats, merge_games, reset_dashboard_aggregates
+from training_sample import fetch_stratified_sample
+from typed_frame import fetch_typed_frame
+from exporter import iter_row_batches
+from metrics import stage, timed
+from storage import GameStore, StorageError, GAME_SELECT_FIELDS, ANALYSIS_FIELDS
+
+
+class MySQLGameStore(GameStore):
+    """Tabel games di MySQL (Config.MYSQL_*); koneksi dipinjam dari ConnectionPool."""
+
+    backend = 'mysql'
+
+    def __init__(self, config, count_cache=None):
+        self.config = config
+        self.count_cache = count_cache
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    # --- Koneksi ---
+
+    def get_pool(self):
+        """
+        Mengembalikan connection pool MySQL (dibuat lazily agar aman untuk worker yang di-fork).
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ConnectionPool(
+                        connect_args={
+                            "host": self.config['MYSQL_HOST'],
+                            "user": self.config['MYSQL_USER'],
+                            "password": self.config['MYSQL_PASSWORD'],
+                            "database": self.config['MYSQL_DB'],
+                            # Diperlukan untuk jalur bulk load LOAD DATA LOCAL INFILE
+                            "allow_local_infile": self.config['MYSQL_ALLOW_LOCAL_INFILE'],
+                        },
+                        pool_size=self.config['MYSQL_POOL_SIZE'],
+                        max_overflow=self.config['MYSQL_POOL_MAX_OVERFLOW'],
+                        timeout=self.config['MYSQL_POOL_TIMEOUT'],
+                        recycle=self.config['MYSQL_POOL_RECYCLE'],
+                        pre_ping=self.config['MYSQL_POOL_PRE_PING'],
+                    )
+        return self._pool
+
+    @timed('get_db_connection')
+    def get_connection(self):
+        """
+        Meminjam koneksi ke database MySQL dari connection pool, atau None jika gagal.
+        conn.close() mengembalikan koneksi ke pool, bukan menutup handshake-nya.
+        """
+        try:
+            conn = self.get_pool().get_connection()
+            self._ensure_schema_once(conn)
+            return conn
+        except PoolTimeoutError as err:
+            print(f"Error connecting to MySQL: {err}")
+            return None
+        except mysql.connector.Error as err:
+            print(f"Error connecting to MySQL: {err}")
+            return None
+
+    def _connect(self):
+        conn = self.get_connection()
+        if not conn:
+            raise StorageError("Gagal terhubung ke database.")
+        return conn
+
+    def _ensure_schema_once(self, conn):
+        """Membuat tabel pendukung (index tag, dll.) sekali per proses."""
+        if self._schema_ready:
+            return
+        with self._schema_lock:
+            if not self._schema_ready:
+                try:
+                    ensure_schema(conn)
+                except mysql.connector.Error:
+                    conn.close()
+                    raise
+                self._schema_ready = True
+
+    def ping(self):
+        conn = self.get_connection()
+        if not conn:
+            return False
+        conn.close()
+        return True
+
+    def stats(self):
+        return {"pool": self._pool.stats()} if self._pool is not None else None
+
+    # --- Upload ---
+
+    def save_chunks(self, chunks, on_chunk_saved=None, dedup='append'):
+        """
+        Setiap DataFrame bersih dari parser langsung di-insert lalu dilepas, sehingga memori
+        puncak dibatasi ukuran chunk. Semua chunk disimpan dalam satu transaksi.
+        Dengan dedup='upsert' chunk ditulis ke tabel staging lalu digabung ke games berdasarkan
+        kunci natural (lihat game_upsert.py).
+        """
+        conn = self._connect()
+        method = self.config['BULK_LOAD_METHOD']
+        upsert = dedup == 'upsert'
+        total_inserted_count = 0
+        try:
+            cursor = conn.cursor()
+            table = create_staging_table(cursor) if upsert else 'games'
+            max_allowed_packet = get_max_allowed_packet(cursor) if method == 'multirow' else None
+            self._begin_snapshot(conn)
+            last_id = first_id = get_max_game_id(cursor)
+            tag_deltas = Counter()
+            for chunk in chunks:
+                with stage('bulk_insert', rows=len(chunk)):
+                    inserted = bulk_insert_frame(
+                        cursor, chunk, method=method, table=table, max_allowed_packet=max_allowed_packet
+                    )
+                if not upsert:
+                    # Index tag ternormalisasi untuk baris chunk ini
+                    last_id, chunk_deltas = index_games_after(cursor, last_id)
+                    tag_deltas.update(chunk_deltas)
+                total_inserted_count += inserted
+                if on_chunk_saved:
+                    on_chunk_saved(inserted)
+
+            if upsert:
+                with stage('merge_staging', rows=total_inserted_count):
+                    summary, tag_deltas = merge_staging(cursor)
+                rows_changed = summary["inserted"] + summary["updated"]
+                # Upload ulang tanpa perubahan tidak menaikkan versi (cache tetap valid)
+                if rows_changed:
+                    bump_dataset_version(cursor, rows_changed, append_only=summary["updated"] == 0)
+            else:
+                # Agregat dashboard untuk seluruh baris upload ini dalam satu pass
+                merge_games(cursor, "id > %s", [first_id], lock=False)
+                bump_dataset_version(cursor, total_inserted_count, append_only=True)
+                summary = {"inserted": total_inserted_count, "updated": 0, "unchanged": 0, "duplicates_in_file": 0}
+            conn.commit()
+
+        except mysql.connector.Error as err:
+            conn.rollback()
+            raise StorageError(str(err)) from err
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            if 'cursor' in locals():
+                if upsert:
+                    try:
+                        drop_staging_table(cursor)
+                    except mysql.connector.Error:
+                        pass
+                cursor.close()
+            conn.close()
+
+        return total_inserted_count, summary, tag_deltas
+
+    @staticmethod
+    def _begin_snapshot(conn):
+        """
+        Memulai transaksi REPEATABLE READ dengan consistent snapshot sebelum id terbesar dibaca.
+        Consistent read berikutnya hanya melihat baris yang sudah di-commit saat itu (semuanya
+        <= id tersebut) dan baris transaksi ini sendiri, sehingga "id > id_awal" pada index tag
+        dan agregat dashboard tepat berisi baris upload ini, walaupun upload lain atau add_game
+        meng-commit baris ber-id lebih besar di tengah jalan.
+        """
+        if conn.in_transaction:
+            # Hanya berisi DDL tabel staging, tidak ada data yang ditulis
+            conn.commit()
+        conn.start_transaction(consistent_snapshot=True, isolation_level='REPEATABLE READ')
+
+    # --- Pembacaan Data Tampilan ---
+
+    def build_game_filters(self, search=None, genre=None, review_type=None, search_fields='name',
+                           release_year=None, min_score=None):
+        """
+        Menyusun klausa FROM/WHERE beserta parameter untuk filter pencarian, genre, review type,
+        tahun rilis, dan skor review minimum.
+        Mengembalikan (base_query, params, relevance); relevance berisi (ekspresi MATCH, params)
+        jika pencarian memakai index FULLTEXT, selain itu None.
+        """
+        base_query = f"FROM games WHERE 1=1"
+        params = []
+        relevance = None
+
+        # Fitur Pencarian Game (Fitur #7) - index FULLTEXT dengan prefix matching,
+        # LIKE hanya untuk SEARCH_MODE='like' atau kata yang terlalu pendek untuk index
+        if search:
+            if self.config['SEARCH_MODE'] == 'fulltext':
+                clause, search_params, relevance = search_clause(search, search_fields)
+            else:
+                clause, search_params = " AND name LIKE %s", [f"%{search}%"]
+            base_query += clause
+            params.extend(search_params)
+
+        # Fitur Filter Genre (Fitur #8) - memakai index tag ternormalisasi (game_tags),
+        # game harus memiliki SEMUA genre yang dipilih
+        if genre:
+            genres = [g.strip() for g in genre.split(',') if g.strip()]
+            genre_clause, genre_params = genre_filter_clause(genres)
+            base_query += genre_clause
+            params.extend(genre_params)
+
+        # Fitur Filter Review Type (Fitur #8)
+        if review_type:
+            reviews = [r.strip() for r in review_type.split(',') if r.strip()]
+            if reviews:
+                placeholders = ', '.join(['%s'] * len(reviews))
+                base_query += f" AND review_type IN ({placeholders})"
+                params.extend(reviews)
+
+        # Filter tahun rilis / skor minimum memakai kolom turunan ber-index (derived_columns.py)
+        conditions, derived_params = derived_filter_conditions(release_year, min_score)
+        for condition in conditions:
+            base_query += f" AND {condition}"
+        params.extend(derived_params)
+
+        return base_query, params, relevance
+
+    def count_game_records(self, cursor, base_query, params, count_mode='exact'):
+        """
+        Menghitung total record untuk filter. Mengembalikan (total, is_estimate).
+        - exact : COUNT(id) setiap request
+        - cached: COUNT(id) disimpan di count_cache sampai data berubah / TTL habis
+        - approx: estimasi statistik tabel (TABLE_ROWS) jika tanpa filter, selain itu seperti cached
+        - none  : tidak menghitung (total = None)
+        """
+        if count_mode == 'none':
+            return None, False
+
+        filtered = len(params) > 0
+        if count_mode == 'approx' and not filtered:
+            cursor.execute(
+                "SELECT TABLE_ROWS AS total FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'games'"
+            )
+            row = cursor.fetchone()
+            return int(row['total'] or 0), True
+
+        cache_key = (base_query, tuple(params))
+        use_cache = count_mode in ('cached', 'approx') and self.count_cache is not None
+        if use_cache:
+            cached_total = self.count_cache.get(cache_key)
+            if cached_total is not None:
+                return cached_total, False
+
+        # Menghitung total data
+        cursor.execute("SELECT COUNT(id) AS total " + base_query, params)
+        total_records = cursor.fetchone()['total']
+        if use_cache:
+            self.count_cache.set(cache_key, total_records)
+        return total_records, False
+
+    def fetch_games(self, limit=None, offset=None, search=None, genre=None, review_type=None,
+                    after_id=None, before_id=None, count_mode='exact', search_fields='name',
+                    sort='id', fields=None, typed=False, release_year=None, min_score=None):
+        conn = self._connect()
+
+        # Kueri dasar untuk mengambil semua kolom yang diperlukan untuk analisis/tabel
+        select_fields = fields or GAME_SELECT_FIELDS
+        base_query, params, relevance = self.build_game_filters(
+            search=search, genre=genre, review_type=review_type, search_fields=search_fields,
+            release_year=release_year, min_score=min_score
+        )
+        rank_by_relevance = sort == 'relevance' and relevance is not None and after_id is None and before_id is None
+
+        try:
+            cursor = conn.cursor(dictionary=True)
+            total_records, _ = self.count_game_records(cursor, base_query, params, count_mode)
+
+            data_query = f"SELECT {select_fields} " + base_query
+            data_params = list(params)
+
+            if rank_by_relevance:
+                relevance_expr, relevance_params = relevance
+                data_query = f"SELECT {select_fields}, {relevance_expr} AS relevance " + base_query
+                data_params = relevance_params + data_params
+                data_query += " ORDER BY relevance DESC, id DESC"
+                if limit is not None and offset is not None:
+                    data_query += " LIMIT %s OFFSET %s"
+                    data_params.extend([limit, offset])
+            elif after_id is not None:
+                # Pagination keyset: memakai PK id, biaya konstan berapa pun dalamnya halaman
+                data_query += " AND id < %s ORDER BY id DESC LIMIT %s"
+                data_params.extend([after_id, limit])
+            elif before_id is not None:
+                # Halaman sebelumnya diambil ASC lalu dibalik agar tetap id DESC
+                data_query += " AND id > %s ORDER BY id ASC LIMIT %s"
+                data_params.extend([before_id, limit])
+            elif limit is not None and offset is not None:
+                # Fitur Pagination (Fitur #6)
+                data_query += " ORDER BY id DESC LIMIT %s OFFSET %s"
+                data_params.extend([limit, offset])
+            else:
+                # Jika tidak ada limit/offset (misalnya untuk Export), ambil semua
+                data_query += " ORDER BY id DESC"
+
+            if typed:
+                data_cursor = conn.cursor()
+                try:
+                    df = fetch_typed_frame(data_cursor, data_query, data_params)
+                finally:
+                    data_cursor.close()
+                if before_id is not None:
+                    df = df.iloc[::-1].reset_index(drop=True)
+                return df, total_records
+
+            cursor.execute(data_query, data_params)
+            data = cursor.fetchall()
+            if before_id is not None:
+                data.reverse()
+
+            return pd.DataFrame(data), total_records
+        except mysql.connector.Error as err:
+            raise StorageError(str(err)) from err
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            conn.close()
+
+    def open_export(self, search=None, genre=None, review_type=None, search_fields='name',
+                    release_year=None, min_score=None):
+        base_query, params, _ = self.build_game_filters(
+            search=search, genre=genre, review_type=review_type, search_fields=search_fields,
+            release_year=release_year, min_score=min_score
+        )
+        conn = self._connect()
+        try:
+            # Cursor unbuffered: baris dialirkan dari server sesuai fetchmany, tidak dimuat sekaligus
+            cursor = conn.cursor(buffered=False)
+            cursor.execute(f"SELECT {GAME_SELECT_FIELDS} " + base_query + " ORDER BY id DESC", params)
+        except mysql.connector.Error as err:
+            conn.discard()
+            raise StorageError(str(err)) from err
+
+        def close(finished):
+            # Koneksi dengan hasil unbuffered yang belum habis dibaca tidak boleh kembali ke pool
+            if finished:
+                cursor.close()
+                conn.close()
+            else:
+                conn.discard()
+
+        columns = [desc[0] for desc in cursor.description]
+        return columns, iter_row_batches(cursor), close
+
+    # --- CRUD Game Tunggal ---
+
+    def add_game(self, values):
+        conn = self._connect()
+        query = """
+        INSERT INTO games (name, price, release_date, review_no, review_type, tags, description)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query, (
+                values['name'], values['price'], values['release_date'],
+                values['review_no'], values['review_type'], values['tags'], values['description']
+            ))
+            game_id = cursor.lastrowid
+            tag_deltas = index_game_tags(cursor, [(game_id, values['tags'])])
+            merge_games(cursor, "id = %s", [game_id])
+            bump_dataset_version(cursor, 1, append_only=True)
+            conn.commit()
+            return game_id, tag_deltas
+        except mysql.connector.Error as err:
+            conn.rollback()
+            raise StorageError(str(err)) from err
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            conn.close()
+
+    def update_game(self, game_id, values):
+        conn = self._connect()
+        query = """
+        UPDATE games
+        SET name=%s, price=%s, release_date=%s, review_no=%s,
+            review_type=%s, tags=%s, description=%s
+        WHERE id=%s
+        """
+        try:
+            cursor = conn.cursor()
+            # Kontribusi nilai lama dikurangkan dari agregat dashboard sebelum baris diubah
+            merge_games(cursor, "id = %s", [game_id], sign=-1)
+            cursor.execute(query, (
+                values['name'], values['price'], values['release_date'],
+                values['review_no'], values['review_type'], values['tags'], values['description'],
+                game_id
+            ))
+
+            if cursor.rowcount == 0:
+                conn.rollback()
+                return False, Counter()
+
+            tag_deltas = reindex_game(cursor, game_id, values['tags'])
+            merge_games(cursor, "id = %s", [game_id])
+            bump_dataset_version(cursor, 1)
+            conn.commit()
+            return True, tag_deltas
+        except mysql.connector.Error as err:
+            conn.rollback()
+            raise StorageError(str(err)) from err
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            conn.close()
+
+    def delete_game(self, game_id):
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            # Agregat dashboard dikurangi selagi baris dan tag-nya masih ada
+            merge_games(cursor, "id = %s", [game_id], sign=-1)
+            cursor.execute("DELETE FROM games WHERE id = %s", (game_id,))
+
+            if cursor.rowcount == 0:
+                conn.rollback()
+                return False, Counter()
+
+            tag_deltas = remove_game(cursor, game_id)
+            bump_dataset_version(cursor, 1)
+            conn.commit()
+            return True, tag_deltas
+        except mysql.connector.Error as err:
+            conn.rollback()
+            raise StorageError(str(err)) from err
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            conn.close()
+
+    def clear_games(self):
+        """Menghapus semua data dari tabel 'games' (TRUNCATE)."""
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(id) FROM games")
+            removed_count = cursor.fetchone()[0]
+            cursor.execute("TRUNCATE TABLE games")
+            clear_tag_index(cursor)
+            reset_dashboard_aggregates(cursor)
+            bump_dataset_version(cursor, removed_count)
+            conn.commit()
+        except mysql.connector.Error as err:
+            conn.rollback()
+            raise StorageError(str(err)) from err
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            conn.close()
+
+    # --- Tag, Versi Dataset, dan Analisis ---
+
+    def tag_counts(self):
+        """Jumlah game per tag dari tabel tags (precomputed), tanpa memindai tabel games."""
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            return fetch_tag_counts(cursor)
+        except mysql.connector.Error as err:
+            raise StorageError(str(err)) from err
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            conn.close()
+
+    def dataset_version(self):
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            version = get_dataset_version(cursor)
+            conn.commit()
+            return version
+        except mysql.connector.Error as err:
+            raise StorageError(str(err)) from err
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            conn.close()
+
+    def analysis_rows(self, after_id=0):
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            return fetch_typed_frame(
+                cursor, f"SELECT {ANALYSIS_FIELDS} FROM games WHERE id > %s ORDER BY id", (after_id,)
+            )
+        except mysql.connector.Error as err:
+            raise StorageError(str(err)) from err
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            conn.close()
+
+    @timed('fetch_dashboard_stats_sql')
+    def dashboard_stats(self):
+        """Statistik dashboard dari agregat berjalan di MySQL (tanpa memindai tabel games)."""
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            stats = fetch_dashboard_stats(cursor)
+            conn.commit() # Rentang harga yang stale mungkin dihitung ulang
+            return stats
+        except mysql.connector.Error as err:
+            raise StorageError(str(err)) from err
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            conn.close()
+
+    def training_sample(self, budget):
+        """Sampling Bernoulli per review_type di MySQL; hanya baris sampel yang dikirim ke Python."""
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT review_type, game_count FROM review_type_counts WHERE game_count > 0")
+            counts = {review_type: int(count) for review_type, count in cursor.fetchall()}
+            if sum(counts.values()) > budget:
+                return fetch_stratified_sample(cursor, ANALYSIS_FIELDS, counts, budget)
+        except mysql.connector.Error as err:
+            raise StorageError(str(err)) from err
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            conn.close()
+        return None
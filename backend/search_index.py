@@ -0,0 +1,65 @@
+# search_index.py
+
+# Pencarian full-text memakai index FULLTEXT InnoDB pada tabel games.
+# MATCH(...) harus memakai daftar kolom yang persis sama dengan salah satu index di bawah.
+
+import re
+
+# Kolom yang dicari per mode search_fields dan nama index FULLTEXT-nya
+SEARCH_FIELDS = {
+    'name': ('ft_games_name', 'name'),
+    'all': ('ft_games_all', 'name, description, tags'),
+}
+
+# Default innodb_ft_min_token_size: kata yang lebih pendek tidak pernah masuk index
+MIN_TOKEN_LENGTH = 3
+
+# Stopword bawaan InnoDB (INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD); diabaikan dari query
+# karena operator '+' pada stopword membuat hasil selalu kosong
+INNODB_STOPWORDS = {
+    'a', 'about', 'an', 'are', 'as', 'at', 'be', 'by', 'com', 'de', 'en', 'for', 'from',
+    'how', 'i', 'in', 'is', 'it', 'la', 'of', 'on', 'or', 'that', 'the', 'this', 'to',
+    'was', 'what', 'when', 'where', 'who', 'will', 'with', 'und', 'www',
+}
+
+
+def fulltext_index_statements():
+    """DDL pembuatan index FULLTEXT: list of (nama_index, statement)."""
+    return [
+        (index_name, f"ALTER TABLE games ADD FULLTEXT INDEX {index_name} ({columns})")
+        for index_name, columns in SEARCH_FIELDS.values()
+    ]
+
+
+def build_boolean_query(term):
+    """
+    Mengubah input pengguna menjadi ekspresi BOOLEAN MODE: setiap kata wajib ada (+)
+    dan dicocokkan sebagai prefix (*), operator bawaan dari input dibuang.
+    Mengembalikan (ekspresi atau None, ada_kata_pendek); kata yang lebih pendek dari
+    MIN_TOKEN_LENGTH tidak pernah masuk index sehingga tidak bisa dipakai di MATCH.
+    """
+    words = [w for w in re.findall(r'\w+', term.lower()) if w not in INNODB_STOPWORDS]
+    long_words = [w for w in words if len(w) >= MIN_TOKEN_LENGTH]
+    has_short_words = len(long_words) < len(words)
+    if not long_words:
+        return None, has_short_words
+    return ' '.join(f"+{w}*" for w in long_words), has_short_words
+
+
+def search_clause(term, search_fields='name'):
+    """
+    Mengembalikan (klausa WHERE, params, (ekspresi relevance, params)) untuk pencarian.
+    Relevance None berarti fallback LIKE (tanpa ranking).
+    """
+    boolean_query, has_short_words = build_boolean_query(term)
+    if boolean_query is None:
+        return " AND name LIKE %s", [f"%{term}%"], None
+
+    _, columns = SEARCH_FIELDS.get(search_fields, SEARCH_FIELDS['name'])
+    match_expr = f"MATCH({columns}) AGAINST (%s IN BOOLEAN MODE)"
+    clause, params = f" AND {match_expr}", [boolean_query]
+    if has_short_words and search_fields == 'name':
+        # Contoh "The Witcher 3": MATCH menyaring lewat index, LIKE memastikan angka/kata pendek ikut cocok
+        clause += " AND name LIKE %s"
+        params.append(f"%{term}%")
+    return clause, params, (match_expr, [boolean_query])
@@ -0,0 +1,119 @@
+# storage.py
+
+# Lapisan penyimpanan data game. app.py hanya memanggil operasi GameStore (CRUD game, bulk
+# insert/upsert upload, pagination terfilter, daftar tag, versi dataset, statistik dashboard,
+# kolom analisis, dan export), sedangkan SQL-nya berada di implementasi per backend:
+#   - 'mysql'  : mysql_store.MySQLGameStore (connection pool, agregat berjalan, FULLTEXT)
+#   - 'sqlite' : embedded_store.SQLiteGameStore (file lokal, tanpa server; modul bawaan Python)
+#   - 'duckdb' : embedded_store.DuckDBGameStore (kolumnar, cepat untuk scan analitik; opsional)
+# Backend dipilih dengan Config.STORAGE_BACKEND.
+
+from abc import ABC, abstractmethod
+
+STORAGE_BACKENDS = ('mysql', 'sqlite', 'duckdb')
+
+# Mode perhitungan total record di /api/games/data
+COUNT_MODES = ('exact', 'cached', 'approx', 'none')
+
+# Kolom yang ditampilkan di tabel/export dan kolom minimum untuk analisis & pelatihan model
+GAME_SELECT_FIELDS = "id, name, price, release_date, review_no, review_type, tags, description"
+ANALYSIS_FIELDS = "id, price, review_no, review_type, review_score, tags"
+
+
+class StorageError(Exception):
+    """Kegagalan koneksi atau query pada backend penyimpanan (pesan siap ditampilkan)."""
+
+
+class GameStore(ABC):
+    """
+    Antarmuka penyimpanan tabel games. Setiap operasi tulis menaikkan versi dataset dalam
+    transaksi yang sama dan mengembalikan delta tag (Counter {nama_tag: +/-n}) agar cache
+    tag di app.py dapat diperbarui setelah commit. Error backend dilempar sebagai StorageError.
+    Backend yang belum mengimplementasikan semua operasi abstrak gagal saat dibuat.
+    """
+
+    backend = None
+
+    @abstractmethod
+    def ping(self):
+        """True jika backend dapat dihubungi."""
+
+    @abstractmethod
+    def save_chunks(self, chunks, on_chunk_saved=None, dedup='append'):
+        """
+        Menyimpan iterable DataFrame bersih (kolom bulk_loader.GAME_COLUMNS) dalam satu
+        transaksi; dedup='upsert' menggabungkan berdasarkan kunci natural (nama + release_date).
+        Exception dari iterator/callback diteruskan setelah rollback.
+        Mengembalikan (jumlah baris upload, summary, delta tag).
+        """
+
+    @abstractmethod
+    def fetch_games(self, limit=None, offset=None, search=None, genre=None, review_type=None,
+                    after_id=None, before_id=None, count_mode='exact', search_fields='name',
+                    sort='id', fields=None, typed=False, release_year=None, min_score=None):
+        """Lihat app.fetch_all_game_data. Mengembalikan (df, total_records)."""
+
+    @abstractmethod
+    def open_export(self, search=None, genre=None, review_type=None, search_fields='name',
+                    release_year=None, min_score=None):
+        """
+        Membuka pembacaan export (urutan id DESC). Mengembalikan (kolom, iterator batch tuple,
+        fungsi close(finished)) yang dipanggil saat response selesai atau terputus.
+        """
+
+    @abstractmethod
+    def add_game(self, values):
+        """Menambah satu game (dict kolom GAME_COLUMNS). Mengembalikan (id, delta tag)."""
+
+    @abstractmethod
+    def update_game(self, game_id, values):
+        """Mengubah satu game. Mengembalikan (ditemukan, delta tag)."""
+
+    @abstractmethod
+    def delete_game(self, game_id):
+        """Menghapus satu game. Mengembalikan (ditemukan, delta tag)."""
+
+    @abstractmethod
+    def clear_games(self):
+        """Mengosongkan tabel games beserta index tag dan agregatnya."""
+
+    @abstractmethod
+    def tag_counts(self):
+        """Dict {tag: jumlah_game} untuk tag yang dipakai minimal satu game."""
+
+    @abstractmethod
+    def dataset_version(self):
+        """Dict {token, epoch, version, rows_changed, rewrite_version} (lihat dataset_version.py)."""
+
+    @abstractmethod
+    def analysis_rows(self, after_id=0):
+        """DataFrame bertipe (ANALYSIS_FIELDS) untuk game dengan id > after_id, urut id."""
+
+    @abstractmethod
+    def dashboard_stats(self):
+        """Statistik dashboard dengan struktur yang sama seperti calculate_dashboard_stats (tanpa klasifikasi)."""
+
+    def training_sample(self, budget):
+        """
+        Sampel terstratifikasi per review_type (paling banyak `budget` baris analisis) yang
+        diambil di sisi database: (df, info sampling). None jika backend tidak mendukungnya
+        atau data tidak melebihi budget; pemanggil lalu memuat analysis_rows dan men-sample
+        di memori (training_sample.sample_frame).
+        """
+        return None
+
+    def stats(self):
+        """Statistik backend untuk monitoring (pool koneksi, ukuran file, dll.), atau None."""
+        return None
+
+
+def create_store(config, count_cache=None):
+    """Membuat GameStore sesuai config['STORAGE_BACKEND'] ('mysql', 'sqlite', atau 'duckdb')."""
+    backend = config['STORAGE_BACKEND']
+    if backend == 'mysql':
+        from mysql_store import MySQLGameStore
+        return MySQLGameStore(config, count_cache=count_cache)
+    if backend in ('sqlite', 'duckdb'):
+        from embedded_store import create_embedded_store
+        return create_embedded_store(backend, config['EMBEDDED_DB_PATH'], count_cache=count_cache)
+    raise ValueError(f"STORAGE_BACKEND tidak valid: {backend}. Gunakan salah satu: {', '.join(STORAGE_BACKENDS)}.")
@@ -0,0 +1,74 @@
+# tag_cache.py
+
+import threading
+import time
+
+
+class TagCache:
+    """
+    Cache in-process untuk daftar tag unik beserta jumlah game per tag (/api/tags-for-filter).
+
+    - Cold start: dimuat dari `loader()` (tabel tags.game_count, tanpa memindai tabel games).
+    - Add/edit/delete/upload: diperbarui inkremental lewat apply_deltas().
+    - Clear database: reset().
+    - TTL membatasi umur data agar perubahan dari worker proses lain tetap terlihat.
+
+    loader() berjalan di luar lock. Setiap apply_deltas()/reset() menaikkan generasi cache;
+    hasil load yang selesai setelah generasinya berubah tidak disimpan, karena delta yang
+    masuk selama load mungkin sudah (atau belum) terlihat oleh loader.
+    """
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._counts = None
+        self._loaded_at = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "loads": 0, "delta_updates": 0, "resets": 0, "stale_loads": 0}
+
+    def _expired(self):
+        return self.ttl and self.ttl > 0 and (time.monotonic() - self._loaded_at) > self.ttl
+
+    def get_counts(self, loader):
+        """Mengembalikan salinan dict {tag: jumlah_game}; loader() dipanggil jika cache kosong/kedaluwarsa."""
+        with self._lock:
+            if self._counts is not None and not self._expired():
+                self._stats["hits"] += 1
+                return dict(self._counts)
+            generation = self._generation
+
+        counts = loader()
+        with self._lock:
+            if self._generation != generation:
+                self._stats["stale_loads"] += 1
+                return dict(counts)
+            self._counts = dict(counts)
+            self._loaded_at = time.monotonic()
+            self._stats["loads"] += 1
+            return dict(self._counts)
+
+    def apply_deltas(self, deltas):
+        """Menerapkan perubahan {tag: +/-n} setelah transaksi berhasil di-commit."""
+        with self._lock:
+            self._generation += 1
+            if self._counts is None:
+                return
+            for tag, delta in deltas.items():
+                count = self._counts.get(tag, 0) + delta
+                if count > 0:
+                    self._counts[tag] = count
+                else:
+                    self._counts.pop(tag, None)
+            self._stats["delta_updates"] += 1
+
+    def reset(self, empty=False):
+        """Mengosongkan cache. empty=True berarti dataset diketahui kosong (setelah clear)."""
+        with self._lock:
+            self._generation += 1
+            self._counts = {} if empty else None
+            self._loaded_at = time.monotonic()
+            self._stats["resets"] += 1
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, cached_tags=len(self._counts) if self._counts is not None else None)
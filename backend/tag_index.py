@@ -0,0 +1,211 @@
+# tag_index.py
+
+# Index tag ternormalisasi: tabel `tags` (kamus) dan `game_tags` (relasi game <-> tag).
+# Menggantikan pencocokan LIKE pada kolom teks games.tags untuk filter genre.
+# Kolom tags.game_count dipelihara secara inkremental sebagai daftar tag + jumlah game
+# yang siap dibaca tanpa memindai tabel games.
+# Tag dicocokkan lewat tags.name_key (nama lowercase Python, collation biner), bukan
+# tags.name: collation default utf8mb4 juga tidak membedakan aksen ("Café" = "Cafe"),
+# sehingga kunci yang dihitung di Python bisa tidak cocok dengan baris yang ditemukan MySQL.
+
+from collections import Counter
+
+# Batas panjang nama tag (sesuai VARCHAR(191) di tabel tags)
+MAX_TAG_LENGTH = 191
+
+# Jumlah pasangan (game_id, tag_id) per statement INSERT
+PAIR_BATCH_SIZE = 5000
+
+# Jumlah game per batch saat backfill index
+REBUILD_BATCH_SIZE = 10000
+
+
+def tag_key(name):
+    """Kunci pencocokan tag (tags.name_key / game_tags.tag_key di backend tertanam)."""
+    return name.lower()[:MAX_TAG_LENGTH]
+
+
+def split_tags(tags):
+    """
+    Memecah string tags ("Action, RPG, Indie") menjadi list tag unik yang sudah di-strip.
+    Urutan kemunculan dipertahankan; duplikat dibandingkan tanpa membedakan huruf besar/kecil.
+    """
+    if not isinstance(tags, str):
+        return []
+    result = []
+    seen = set()
+    for tag in tags.split(','):
+        cleaned_tag = tag.strip()[:MAX_TAG_LENGTH]
+        if cleaned_tag and tag_key(cleaned_tag) not in seen:
+            seen.add(tag_key(cleaned_tag))
+            result.append(cleaned_tag)
+    return result
+
+
+def get_or_create_tag_ids(cursor, names):
+    """
+    Mengembalikan dict {tag_key(nama): (tag_id, nama_tersimpan)}, membuat tag yang belum ada.
+    Insert dan lookup sama-sama memakai kolom name_key (collation biner), sehingga setiap
+    kunci yang diminta pasti ada di hasil.
+    """
+    names_by_key = {}
+    for name in names:
+        names_by_key.setdefault(tag_key(name), name)
+    if not names_by_key:
+        return {}
+
+    placeholders = ', '.join(['(%s, %s)'] * len(names_by_key))
+    cursor.execute(
+        f"INSERT IGNORE INTO tags (name_key, name) VALUES {placeholders}",
+        [value for item in names_by_key.items() for value in item]
+    )
+
+    placeholders = ', '.join(['%s'] * len(names_by_key))
+    cursor.execute(f"SELECT id, name_key, name FROM tags WHERE name_key IN ({placeholders})", list(names_by_key))
+    return {key: (tag_id, name) for tag_id, key, name in cursor.fetchall()}
+
+
+def _apply_count_deltas(cursor, deltas_by_id):
+    """Memperbarui tags.game_count; tag dengan delta yang sama digabung dalam satu UPDATE."""
+    ids_by_delta = {}
+    for tag_id, delta in deltas_by_id.items():
+        if delta:
+            ids_by_delta.setdefault(delta, []).append(tag_id)
+    for delta, tag_ids in ids_by_delta.items():
+        placeholders = ', '.join(['%s'] * len(tag_ids))
+        cursor.execute(
+            f"UPDATE tags SET game_count = GREATEST(CAST(game_count AS SIGNED) + %s, 0) WHERE id IN ({placeholders})",
+            [delta] + tag_ids
+        )
+
+
+def index_game_tags(cursor, rows):
+    """
+    Menambahkan pasangan game_tags untuk rows berupa iterable (game_id, tags_string)
+    dan menaikkan tags.game_count. Mengembalikan Counter {nama_tag: +jumlah_game}.
+    """
+    parsed = [(game_id, split_tags(tags)) for game_id, tags in rows]
+    tag_rows = get_or_create_tag_ids(cursor, [tag for _, tags in parsed for tag in tags])
+    pairs = [(game_id, tag_rows[tag_key(tag)][0]) for game_id, tags in parsed for tag in tags]
+
+    for start in range(0, len(pairs), PAIR_BATCH_SIZE):
+        batch = pairs[start:start + PAIR_BATCH_SIZE]
+        placeholders = ', '.join(['(%s, %s)'] * len(batch))
+        cursor.execute(
+            f"INSERT IGNORE INTO game_tags (game_id, tag_id) VALUES {placeholders}",
+            [value for pair in batch for value in pair]
+        )
+
+    deltas_by_id = Counter(tag_id for _, tag_id in pairs)
+    _apply_count_deltas(cursor, deltas_by_id)
+    return Counter(tag_rows[tag_key(tag)][1] for _, tags in parsed for tag in tags)
+
+
+def get_max_game_id(cursor):
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM games")
+    return int(cursor.fetchone()[0])
+
+
+def index_games_after(cursor, last_id):
+    """
+    Mengindeks tag semua game dengan id > last_id (baris hasil bulk insert terakhir
+    dalam transaksi yang sama). Mengembalikan (id terbesar yang sudah diindeks, Counter delta tag).
+    """
+    cursor.execute("SELECT id, tags FROM games WHERE id > %s ORDER BY id", (last_id,))
+    rows = cursor.fetchall()
+    deltas = Counter()
+    if rows:
+        deltas = index_game_tags(cursor, rows)
+        last_id = rows[-1][0]
+    return last_id, deltas
+
+
+def reindex_game(cursor, game_id, tags):
+    """Mengganti seluruh tag satu game (dipakai saat edit). Mengembalikan Counter delta tag."""
+    deltas = remove_game(cursor, game_id)
+    deltas.update(index_game_tags(cursor, [(game_id, tags)]))
+    return deltas
+
+
+def remove_game(cursor, game_id):
+    """Menghapus tag satu game dan menurunkan game_count. Mengembalikan Counter {nama_tag: -1}."""
+    cursor.execute(
+        "SELECT t.id, t.name FROM game_tags gt JOIN tags t ON t.id = gt.tag_id WHERE gt.game_id = %s",
+        (game_id,)
+    )
+    removed = cursor.fetchall()
+    cursor.execute("DELETE FROM game_tags WHERE game_id = %s", (game_id,))
+    _apply_count_deltas(cursor, {tag_id: -1 for tag_id, _ in removed})
+    return Counter({name: -1 for _, name in removed})
+
+
+def remove_games_in(cursor, id_subquery, params=()):
+    """
+    Menghapus tag sekumpulan game (`id_subquery` mengembalikan satu kolom game_id) dan
+    menurunkan game_count. Mengembalikan Counter {nama_tag: -jumlah_game}.
+    """
+    cursor.execute(
+        "SELECT t.id, t.name, COUNT(*) FROM game_tags gt JOIN tags t ON t.id = gt.tag_id "
+        f"WHERE gt.game_id IN ({id_subquery}) GROUP BY t.id, t.name",
+        params
+    )
+    removed = cursor.fetchall()
+    cursor.execute(f"DELETE FROM game_tags WHERE game_id IN ({id_subquery})", params)
+    _apply_count_deltas(cursor, {tag_id: -int(count) for tag_id, _, count in removed})
+    return Counter({name: -int(count) for _, name, count in removed})
+
+
+def index_games_in(cursor, id_subquery, params=()):
+    """Mengindeks tag sekumpulan game (lihat remove_games_in). Mengembalikan Counter delta tag."""
+    cursor.execute(f"SELECT id, tags FROM games WHERE id IN ({id_subquery}) ORDER BY id", params)
+    rows = cursor.fetchall()
+    return index_game_tags(cursor, rows) if rows else Counter()
+
+
+def fetch_tag_counts(cursor):
+    """Daftar tag yang dipakai minimal satu game beserta jumlahnya (dari tags.game_count)."""
+    cursor.execute("SELECT name, game_count FROM tags WHERE game_count > 0")
+    return {name: int(count) for name, count in cursor.fetchall()}
+
+
+def clear_tag_index(cursor):
+    cursor.execute("TRUNCATE TABLE game_tags")
+    cursor.execute("TRUNCATE TABLE tags")
+
+
+def rebuild_tag_index(cursor):
+    """Membangun ulang seluruh index dari kolom games.tags, per batch id. Mengembalikan jumlah game."""
+    clear_tag_index(cursor)
+    last_id = 0
+    indexed = 0
+    while True:
+        cursor.execute(
+            "SELECT id, tags FROM games WHERE id > %s ORDER BY id LIMIT %s",
+            (last_id, REBUILD_BATCH_SIZE)
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        index_game_tags(cursor, rows)
+        indexed += len(rows)
+        last_id = rows[-1][0]
+    return indexed
+
+
+def genre_filter_clause(genres):
+    """
+    Fragmen SQL (dan parameternya) untuk filter genre: game harus memiliki SEMUA genre.
+    Memakai PK game_tags (tag_id, game_id), bukan LIKE pada kolom teks.
+    """
+    unique_genres = list({tag_key(g) for g in genres})
+    if not unique_genres:
+        return "", []
+
+    placeholders = ', '.join(['%s'] * len(unique_genres))
+    clause = (
+        " AND id IN ("
+        "SELECT gt.game_id FROM game_tags gt JOIN tags t ON t.id = gt.tag_id"
+        f" WHERE t.name_key IN ({placeholders})"
+        " GROUP BY gt.game_id HAVING COUNT(DISTINCT gt.tag_id) = %s)"
+    )
+    return clause, unique_genres + [len(unique_genres)]
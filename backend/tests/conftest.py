@@ -0,0 +1,121 @@
+# tests/conftest.py
+
+# Test berjalan tanpa server MySQL: backend penyimpanan SQLite/DuckDB (embedded_store) di
+# folder sementara per test. Jalankan dari folder backend:
+#     python -m pytest -q tests
+# Fixture `store` juga dijalankan pada MySQL jika VERITAS_TEST_MYSQL_DB berisi nama database
+# khusus test (server dan kredensial dari Config.MYSQL_*; tabel games-nya dikosongkan), mis.
+#     VERITAS_TEST_MYSQL_DB=steam_analysis_test python -m pytest -q tests
+
+import os
+import sys
+import pandas as pd
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from config import Config
+from bulk_loader import GAME_COLUMNS
+from embedded_store import create_embedded_store
+
+MYSQL_TEST_DB = os.environ.get('VERITAS_TEST_MYSQL_DB')
+
+# Tabel games dibuat manual di deployment; kolom pendukung lain ditambahkan ensure_schema
+MYSQL_GAMES_DDL = """
+CREATE TABLE IF NOT EXISTS games (
+    id INT NOT NULL AUTO_INCREMENT,
+    name VARCHAR(255),
+    price DECIMAL(10, 2),
+    release_date DATE,
+    review_no INT,
+    review_type VARCHAR(64),
+    tags TEXT,
+    description TEXT,
+    PRIMARY KEY (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+"""
+
+STORE_BACKENDS = ['sqlite', 'duckdb', 'mysql']
+
+
+def game_row(name, price=9.99, release_date='2020-01-01', review_no=100,
+             review_type='Very Positive', tags='Action, Indie', description='Deskripsi'):
+    """Satu baris game bersih seperti keluaran parser (kolom GAME_COLUMNS)."""
+    return {
+        'name': name, 'price': price, 'release_date': release_date, 'review_no': review_no,
+        'review_type': review_type, 'tags': tags, 'description': description,
+    }
+
+
+def game_frame(rows):
+    """DataFrame upload dari list game_row()."""
+    return pd.DataFrame(rows, columns=GAME_COLUMNS)
+
+
+@pytest.fixture(scope='session')
+def mysql_store_session():
+    """MySQLGameStore pada database VERITAS_TEST_MYSQL_DB; di-skip tanpa server MySQL."""
+    if not MYSQL_TEST_DB:
+        pytest.skip("VERITAS_TEST_MYSQL_DB tidak diisi; test MySQL dilewati.")
+    if MYSQL_TEST_DB == Config.MYSQL_DB:
+        pytest.fail("VERITAS_TEST_MYSQL_DB harus berbeda dari Config.MYSQL_DB (tabel games akan dikosongkan).")
+    import mysql.connector
+    from mysql_store import MySQLGameStore
+
+    try:
+        server = mysql.connector.connect(
+            host=Config.MYSQL_HOST, user=Config.MYSQL_USER, password=Config.MYSQL_PASSWORD
+        )
+    except mysql.connector.Error as err:
+        pytest.skip(f"Server MySQL tidak tersedia: {err}")
+    cursor = server.cursor()
+    cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{MYSQL_TEST_DB}`")
+    cursor.execute(f"USE `{MYSQL_TEST_DB}`")
+    cursor.execute(MYSQL_GAMES_DDL)
+    cursor.close()
+    server.close()
+
+    config = {key: getattr(Config, key) for key in dir(Config) if key.isupper()}
+    config['MYSQL_DB'] = MYSQL_TEST_DB
+    game_store = MySQLGameStore(config)
+    yield game_store
+    if game_store._pool is not None:
+        game_store._pool.dispose()
+
+
+@pytest.fixture(params=STORE_BACKENDS)
+def store(request, tmp_path):
+    """GameStore kosong per test untuk setiap backend (SQLite, DuckDB jika terpasang, MySQL)."""
+    if request.param == 'mysql':
+        game_store = request.getfixturevalue('mysql_store_session')
+        game_store.clear_games()
+        yield game_store
+        return
+    if request.param == 'duckdb':
+        pytest.importorskip('duckdb')
+    game_store = create_embedded_store(request.param, str(tmp_path / f'games.{request.param}'))
+    yield game_store
+    game_store.close()
+
+
+@pytest.fixture(scope='session')
+def app_module(tmp_path_factory):
+    """Modul app.py yang dikonfigurasi dengan backend SQLite (diimpor sekali per sesi)."""
+    data_dir = tmp_path_factory.mktemp('app')
+    Config.STORAGE_BACKEND = 'sqlite'
+    Config.EMBEDDED_DB_PATH = str(data_dir / 'veritas.db')
+    Config.ANALYTICS_SNAPSHOT = False
+    Config.DASHBOARD_CACHE_PERSIST = False
+    Config.MODEL_DIR = str(data_dir / 'models')
+    import app
+    return app
+
+
+@pytest.fixture
+def client(app_module, store, monkeypatch):
+    """Test client Flask yang membaca dari `store` (database kosong per test)."""
+    monkeypatch.setattr(app_module, 'store', store)
+    app_module.count_cache.clear()
+    app_module.tag_cache.reset()
+    return app_module.app.test_client()
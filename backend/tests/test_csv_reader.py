@@ -0,0 +1,132 @@
+# tests/test_csv_reader.py
+
+# Pembaca CSV per blok (data_processor/csv_reader.py): blok harus selalu berakhir di batas
+# record, termasuk saat field bertanda kutip berisi newline atau "" ter-escape dan saat batas
+# blok jatuh di tengah record. Hasil per blok dibandingkan dengan satu kali pd.read_csv.
+
+import io
+import pandas as pd
+import pytest
+
+from data_processor.csv_reader import (
+    PYARROW_AVAILABLE, _record_boundary, _rechunk, iter_csv_blocks, iter_csv_frames, read_csv_block,
+)
+
+COLUMNS = ['name', 'price', 'tags', 'description']
+ENGINES = ['c', 'python'] + (['pyarrow'] if PYARROW_AVAILABLE else [])
+
+
+def sample_csv(rows=40):
+    """CSV dengan field multi-baris, koma, dan kutip ter-escape; kolom `extra` tidak dipakai."""
+    frame = pd.DataFrame({
+        'name': [f'Game "{i}"' if i % 5 == 0 else f'Game {i}' for i in range(rows)],
+        'price': [f'{i}.99' for i in range(rows)],
+        'tags': ['Action, Indie' if i % 2 else 'RPG' for i in range(rows)],
+        'description': [f'Baris satu\nbaris "dua", {i}\n\nbaris tiga' if i % 3 == 0 else 'Pendek'
+                        for i in range(rows)],
+        'extra': ['x'] * rows,
+    })
+    return frame.to_csv(index=False).encode('latin-1')
+
+
+def write_csv(tmp_path, data, name='games.csv'):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def expected_frame(data):
+    return pd.read_csv(io.BytesIO(data), encoding='latin-1', dtype=str, usecols=COLUMNS)[COLUMNS]
+
+
+def test_record_boundary_skips_quoted_newlines():
+    assert _record_boundary(b'a,b\n1,"x\ny"\n2,"z') == len(b'a,b\n1,"x\ny"\n')
+    # Newline di dalam kutip yang belum ditutup tidak boleh dipakai
+    assert _record_boundary(b'1,"x\ny') == 0
+    # "" ter-escape tidak mengubah paritas
+    assert _record_boundary(b'1,"say ""hi""\n"\n2,"a') == len(b'1,"say ""hi""\n"\n')
+    assert _record_boundary(b'tanpa newline') == 0
+
+
+@pytest.mark.parametrize('block_bytes', [1, 7, 64, 1 << 20])
+def test_blocks_end_on_record_boundaries(block_bytes):
+    data = sample_csv()
+    blocks = list(iter_csv_blocks(io.BytesIO(data), block_bytes))
+    assert b''.join(blocks) == data
+    assert all(block.count(b'"') % 2 == 0 and block.endswith(b'\n') for block in blocks)
+
+
+def test_record_longer_than_block_is_kept_whole():
+    long_field = 'x' * 500 + '\n' + 'y' * 500
+    data = pd.DataFrame({'description': [long_field, 'pendek']}).to_csv(index=False).encode()
+    header, body = data.split(b'\n', 1)
+    blocks = list(iter_csv_blocks(io.BytesIO(body), block_bytes=16))
+    assert blocks[0].decode().count('x') == 500 and blocks[0].decode().count('y') == 500
+    assert b''.join(blocks) == body
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('block_bytes', [50, 333, 1 << 20])
+def test_frames_match_single_read(tmp_path, engine, block_bytes):
+    data = sample_csv()
+    path = write_csv(tmp_path, data)
+    counter = {}
+    frames = list(iter_csv_frames(path, COLUMNS, engine=engine, counter=counter, block_bytes=block_bytes))
+
+    result = pd.concat(frames, ignore_index=True)
+    pd.testing.assert_frame_equal(result, expected_frame(data), check_dtype=False)
+    assert counter == {"bad_lines": 0, "fallback_blocks": 0}
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('block_bytes', [40, 1 << 20])
+def test_bad_lines_are_skipped_and_counted(tmp_path, engine, block_bytes):
+    # Record yang terlalu panjang di awal file/blok tidak boleh dijadikan index oleh pandas
+    bad_record = b'kolom,terlalu,banyak,untuk,header,ini,lagi\n'
+    rows = [row.encode() for row in ['Game A,1.99,RPG,ok,x\n', 'Game B,2.99,"Action, Indie",ok,x\n']]
+    header = b'name,price,tags,description,extra\n'
+    data = header + bad_record + rows[0] + bad_record + bad_record + rows[1] + bad_record
+    path = write_csv(tmp_path, data)
+
+    counter = {}
+    frames = list(iter_csv_frames(path, COLUMNS, engine=engine, counter=counter, block_bytes=block_bytes))
+    result = pd.concat(frames, ignore_index=True)
+    pd.testing.assert_frame_equal(result, expected_frame(header + rows[0] + rows[1]), check_dtype=False)
+    assert counter["bad_lines"] == 4
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_block_starting_with_long_records(engine):
+    # Record pertama yang terlalu panjang tidak boleh dijadikan index; record multi-baris ikut dibuang
+    names = ['name', 'price', 'tags', 'description', 'extra']
+    block = b'a,b,c,d,e,f,g\n"x\ny",1,2,3,4,5,6\nGame A,1.99,RPG,ok,x\n'
+    counter = {"bad_lines": 0, "fallback_blocks": 0}
+    df = read_csv_block(block, names, COLUMNS, engine, counter)
+    assert df.values.tolist() == [['Game A', '1.99', 'RPG', 'ok']]
+    assert counter["bad_lines"] == 2
+
+
+def test_unclosed_quote_falls_back_to_python_engine(tmp_path):
+    data = b'name,price,tags,description\nGame A,1.99,RPG,ok\nGame B,2.99,RPG,"tidak ditutup\n'
+    path = write_csv(tmp_path, data)
+
+    counter = {}
+    frames = list(iter_csv_frames(path, COLUMNS, engine='c', counter=counter, block_bytes=8))
+    assert counter["fallback_blocks"] == 1
+    assert pd.concat(frames)['name'].tolist()[0] == 'Game A'
+
+
+def test_rechunk_yields_exact_sizes():
+    frames = [pd.DataFrame({'a': range(start, start + size)}) for start, size in [(0, 3), (3, 7), (10, 1), (11, 6)]]
+    chunks = list(_rechunk(iter(frames), 5))
+    assert [len(chunk) for chunk in chunks] == [5, 5, 5, 2]
+    assert pd.concat(chunks)['a'].tolist() == list(range(17))
+    assert all(chunk.index.tolist() == list(range(len(chunk))) for chunk in chunks)
+
+
+def test_chunksize_spans_blocks(tmp_path):
+    data = sample_csv(23)
+    path = write_csv(tmp_path, data)
+    chunks = list(iter_csv_frames(path, COLUMNS, chunksize=10, engine='c', block_bytes=40))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 3]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected_frame(data), check_dtype=False)
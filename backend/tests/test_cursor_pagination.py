@@ -0,0 +1,76 @@
+# tests/test_cursor_pagination.py
+
+# Pagination keyset /api/games/data (pagination=cursor, after, before): halaman maju lalu
+# mundur harus mencakup setiap game tepat sekali, termasuk saat semua kolom tampilan sama
+# (urutan hanya ditentukan id) dan saat jumlah baris kelipatan per_page.
+
+from conftest import game_row, game_frame
+
+
+def seed_games(store, rows):
+    store.save_chunks([game_frame(rows)])
+    df, _ = store.fetch_games()
+    return sorted(df['id'].tolist(), reverse=True)
+
+
+def get_page(client, **params):
+    response = client.get('/api/games/data', query_string=params)
+    assert response.status_code == 200, response.get_json()
+    body = response.get_json()
+    return [game['id'] for game in body['data']], body['pagination']
+
+
+def walk_forward(client, per_page, **filters):
+    pages = []
+    ids, pagination = get_page(client, pagination='cursor', per_page=per_page, **filters)
+    pages.append((ids, pagination))
+    while pagination['next_cursor']:
+        ids, pagination = get_page(client, per_page=per_page, after=pagination['next_cursor'], **filters)
+        pages.append((ids, pagination))
+    return pages
+
+
+def test_forward_then_backward_over_ties(client, store):
+    # Nama, harga, tanggal, dan review identik: hanya id yang membedakan baris
+    all_ids = seed_games(store, [game_row('Tie Game') for _ in range(12)])
+
+    pages = walk_forward(client, per_page=5)
+    assert [ids for ids, _ in pages] == [all_ids[0:5], all_ids[5:10], all_ids[10:12]]
+    assert pages[0][1]['prev_cursor'] is None
+    assert pages[-1][1]['next_cursor'] is None
+
+    # Mundur dari halaman terakhir kembali ke halaman pertama
+    ids, pagination = pages[-1]
+    backward = []
+    while pagination['prev_cursor']:
+        ids, pagination = get_page(client, per_page=5, before=pagination['prev_cursor'])
+        backward.append(ids)
+        assert pagination['next_cursor'] is not None
+    assert backward == [all_ids[5:10], all_ids[0:5]]
+
+
+def test_exact_multiple_of_page_size_has_no_empty_page(client, store):
+    all_ids = seed_games(store, [game_row(f'Game {i}') for i in range(10)])
+
+    pages = walk_forward(client, per_page=5)
+    assert [ids for ids, _ in pages] == [all_ids[0:5], all_ids[5:10]]
+    assert pages[-1][1]['next_cursor'] is None
+
+
+def test_cursor_pages_respect_filters(client, store):
+    rows = []
+    for i in range(15):
+        tags = 'RPG, Indie' if i % 3 == 0 else 'Action'
+        rows.append(game_row('Tie Game', tags=tags))
+    seed_games(store, rows)
+    rpg_ids = sorted(store.fetch_games(genre='RPG')[0]['id'].tolist(), reverse=True)
+
+    pages = walk_forward(client, per_page=2, genre='RPG')
+    assert [game_id for ids, _ in pages for game_id in ids] == rpg_ids
+    assert all(pagination['total_records'] == 5 for _, pagination in pages)
+
+
+def test_invalid_cursor_is_rejected(client, store):
+    seed_games(store, [game_row('Game')])
+    response = client.get('/api/games/data', query_string={'after': 'bukan-cursor'})
+    assert response.status_code == 400
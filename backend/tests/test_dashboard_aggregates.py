@@ -0,0 +1,201 @@
+# tests/test_dashboard_aggregates.py
+
+# Statistik dashboard dari backend penyimpanan (store.dashboard_stats) dibandingkan dengan
+# hitung ulang penuh di pandas (calculate_dashboard_stats atas seluruh baris analisis) setelah
+# upload, add, edit, delete, dan upsert. Agregat berjalan MySQL (dashboard_stats.merge_games)
+# juga harus sama dengan rebuild_dashboard_aggregates, termasuk saat dua upload berjalan
+# bersamaan. Test MySQL di-skip tanpa server (lihat conftest).
+
+import threading
+from decimal import Decimal
+import numpy as np
+import pytest
+
+from conftest import game_row, game_frame
+from dashboard_stats import pearson_from_sums, rebuild_dashboard_aggregates
+from data_processor.analyzer import REVIEW_SCORE_MAP, calculate_dashboard_stats
+from storage import ANALYSIS_FIELDS
+from tag_index import tag_key
+
+TAGS = ['Action', 'Indie', 'RPG', 'Puzzle', 'Strategy', 'Casual']
+
+
+def random_games(count, seed=0, prefix='Game', tags=TAGS):
+    rng = np.random.default_rng(seed)
+    review_types = list(REVIEW_SCORE_MAP) + ['Mostly Positive']  # tipe terakhir tidak punya skor
+    rows = []
+    for i in range(count):
+        game_tags = rng.choice(tags, size=rng.integers(0, 4), replace=False)
+        rows.append(game_row(
+            f'{prefix} {seed}-{i}',
+            price=round(float(rng.uniform(0, 60)), 2),
+            review_no=int(rng.integers(0, 5000)),
+            review_type=review_types[rng.integers(len(review_types))],
+            tags=', '.join(game_tags),
+        ))
+    return rows
+
+
+def recompute(store):
+    """Statistik dashboard dari seluruh baris analisis (jalur DASHBOARD_AGGREGATION='pandas')."""
+    df, _ = store.fetch_games(fields=ANALYSIS_FIELDS, typed=True)
+    return calculate_dashboard_stats(df, include_classification=False)
+
+
+def by_tag_key(values):
+    """Nilai per genre dengan kunci tag_key: ejaan nama genre bisa berbeda antar jalur."""
+    return {tag_key(tag): value for tag, value in values.items()}
+
+
+def assert_stats_equal(actual, expected):
+    assert actual['descriptive_stats'] == expected['descriptive_stats']
+    assert actual['correlation_results'] == pytest.approx(expected['correlation_results'], abs=1e-4)
+    assert by_tag_key(actual['genre_data']['distribution']) == by_tag_key(expected['genre_data']['distribution'])
+    assert by_tag_key(actual['genre_data']['avg_score']) == pytest.approx(
+        by_tag_key(expected['genre_data']['avg_score']), abs=1e-4
+    )
+
+
+def game_ids(store):
+    df, _ = store.fetch_games()
+    return df.set_index('name')['id'].to_dict()
+
+
+def test_stats_match_full_recompute_after_writes(store):
+    store.save_chunks(game_frame(rows) for rows in (random_games(60, seed=1), random_games(40, seed=2)))
+    store.add_game(game_row('Game Baru', price=59.99, review_type='Overwhelmingly Positive', tags='RPG, Puzzle'))
+    assert_stats_equal(store.dashboard_stats(), recompute(store))
+
+    ids = game_ids(store)
+    scored = [row for row in random_games(60, seed=1) if row['review_type'] in REVIEW_SCORE_MAP]
+    cheapest = min(scored, key=lambda row: row['price'])
+    # Menghapus game termurah membuat rentang harga harus dihitung ulang
+    store.delete_game(ids[cheapest['name']])
+    store.update_game(ids['Game 2-0'], game_row('Game 2-0', price=0.5, review_type='Mixed', tags='Casual'))
+    store.update_game(ids['Game 2-1'], game_row('Game 2-1', review_type='Mostly Positive', tags='Action'))
+    assert_stats_equal(store.dashboard_stats(), recompute(store))
+
+
+def test_upsert_upload_matches_full_recompute(store):
+    rows = random_games(50, seed=3)
+    store.save_chunks([game_frame(rows)], dedup='upsert')
+    rows[0]['price'] = 1.23
+    rows[1]['tags'] = 'Strategy'
+    rows[2]['review_type'] = 'Negative'
+    store.save_chunks([game_frame(rows + random_games(10, seed=4))], dedup='upsert')
+    assert_stats_equal(store.dashboard_stats(), recompute(store))
+
+
+def test_mixed_case_tags_are_one_genre(store):
+    store.save_chunks([game_frame([
+        game_row('A', tags='Action, RPG'), game_row('B', tags='action'), game_row('C', tags='ACTION, rpg'),
+    ])])
+    stats = store.dashboard_stats()
+    # Nama genre memakai ejaan yang pertama kali tersimpan
+    assert stats['genre_data']['distribution'] == {'Action': 3, 'RPG': 2}
+    assert_stats_equal(stats, recompute(store))
+
+
+def test_deleting_everything_returns_to_empty(store):
+    store.save_chunks([game_frame(random_games(20, seed=5))])
+    for game_id in game_ids(store).values():
+        store.delete_game(game_id)
+    stats = store.dashboard_stats()
+    assert stats['descriptive_stats']['total_games'] == 0
+    assert stats['descriptive_stats']['review_distribution'] == {}
+    assert stats['genre_data']['distribution'] == {}
+
+
+def rebuilt_stats(store):
+    """Agregat MySQL dibangun ulang dari tabel games lalu dibaca kembali."""
+    conn = store.get_connection()
+    try:
+        cursor = conn.cursor()
+        rebuild_dashboard_aggregates(cursor)
+        conn.commit()
+        cursor.close()
+    finally:
+        conn.close()
+    return store.dashboard_stats()
+
+
+def test_running_aggregates_match_rebuild(store):
+    if store.backend != 'mysql':
+        pytest.skip("Agregat berjalan hanya ada di MySQL.")
+    store.save_chunks(game_frame(rows) for rows in (random_games(60, seed=1), random_games(40, seed=2)))
+    store.add_game(game_row('Game Baru', price=59.99, review_type='Overwhelmingly Positive', tags='RPG, Puzzle'))
+    assert_stats_equal(store.dashboard_stats(), rebuilt_stats(store))
+
+    ids = game_ids(store)
+    scored = [row for row in random_games(60, seed=1) if row['review_type'] in REVIEW_SCORE_MAP]
+    cheapest = min(scored, key=lambda row: row['price'])
+    # Menghapus game termurah membuat rentang harga harus dihitung ulang
+    store.delete_game(ids[cheapest['name']])
+    store.update_game(ids['Game 2-0'], game_row('Game 2-0', price=0.5, review_type='Mixed', tags='Casual'))
+    store.update_game(ids['Game 2-1'], game_row('Game 2-1', review_type='Mostly Positive', tags='Action'))
+    assert_stats_equal(store.dashboard_stats(), rebuilt_stats(store))
+
+
+def test_upsert_upload_matches_rebuild(store):
+    if store.backend != 'mysql':
+        pytest.skip("Agregat berjalan hanya ada di MySQL.")
+    rows = random_games(50, seed=3)
+    store.save_chunks([game_frame(rows)], dedup='upsert')
+    rows[0]['price'] = 1.23
+    rows[1]['tags'] = 'Strategy'
+    rows[2]['review_type'] = 'Negative'
+    store.save_chunks([game_frame(rows + random_games(10, seed=4))], dedup='upsert')
+    assert_stats_equal(store.dashboard_stats(), rebuilt_stats(store))
+
+
+def test_concurrent_uploads_merge_only_their_own_rows(store):
+    if store.backend != 'mysql':
+        pytest.skip("Upload embedded diserialkan; interleaving transaksi hanya terjadi di MySQL.")
+    # Tag berbeda per upload agar insert tag kedua upload tidak saling menunggu row lock
+    first = [random_games(30, seed=7, prefix='Pertama', tags=['Action', 'Indie']),
+             random_games(30, seed=8, prefix='Pertama', tags=['Action', 'Indie'])]
+    second = random_games(30, seed=9, prefix='Kedua', tags=['RPG', 'Puzzle'])
+    second_done = threading.Event()
+    errors = []
+
+    def first_chunks():
+        yield game_frame(first[0])
+        # Upload kedua meng-commit id yang lebih besar di tengah transaksi upload pertama
+        assert second_done.wait(timeout=30)
+        yield game_frame(first[1])
+
+    def run(target):
+        try:
+            target()
+        except Exception as err:  # noqa: BLE001 - diteruskan ke thread test
+            errors.append(err)
+
+    upload_first = threading.Thread(target=run, args=(lambda: store.save_chunks(first_chunks()),))
+    upload_first.start()
+    run(lambda: store.save_chunks([game_frame(second)]))
+    second_done.set()
+    upload_first.join(timeout=60)
+    assert not errors and not upload_first.is_alive()
+
+    incremental = store.dashboard_stats()
+    assert incremental['descriptive_stats']['total_games'] == sum(
+        row['review_type'] in REVIEW_SCORE_MAP for row in first[0] + first[1] + second
+    )
+    assert_stats_equal(incremental, rebuilt_stats(store))
+
+
+@pytest.mark.parametrize('offset', [0, 1e6])
+def test_pearson_from_sums_matches_numpy(offset):
+    rng = np.random.default_rng(3)
+    x = [Decimal(str(round(value, 2))) for value in rng.uniform(0, 60, 500) + offset]
+    y = [Decimal(int(value)) for value in rng.integers(1, 6, 500)]
+    result = pearson_from_sums(
+        len(x), sum(x), sum(y), sum(v * v for v in x), sum(v * v for v in y),
+        sum(a * b for a, b in zip(x, y))
+    )
+    expected = np.corrcoef(np.array(x, dtype=float) - offset, np.array(y, dtype=float))[0, 1]
+    assert result == pytest.approx(expected, abs=1e-9)
+
+
+def test_pearson_from_sums_constant_variable():
+    assert pearson_from_sums(3, 6, 9, 12, 29, 18) is None
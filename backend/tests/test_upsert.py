@@ -0,0 +1,106 @@
+# tests/test_upsert.py
+
+# Upload mode upsert (save_chunks(dedup='upsert')): jumlah inserted/updated/unchanged,
+# duplikat di dalam file, normalisasi kunci natural (nama trim + lowercase, release_date),
+# serta delta tag dan dataset_version. Pada MySQL yang diuji adalah game_upsert.merge_staging
+# (jalur produksi); SQLite/DuckDB menjalankan langkah yang sama di embedded_store.
+
+from conftest import game_row, game_frame
+
+
+def upload(store, rows):
+    _, summary, tag_deltas = store.save_chunks([game_frame(rows)], dedup='upsert')
+    return summary, tag_deltas
+
+
+def all_games(store):
+    df, _ = store.fetch_games()
+    return df.to_dict('records')
+
+
+def games_by_name(store):
+    return {row['name']: row for row in all_games(store)}
+
+
+def catalog(count):
+    return [game_row(f'Game {i}', price=float(i), tags='Action, Indie' if i % 2 else 'RPG') for i in range(count)]
+
+
+def test_first_upload_inserts_everything(store):
+    version = store.dataset_version()
+    summary, tag_deltas = upload(store, catalog(6))
+    assert summary == {"inserted": 6, "updated": 0, "unchanged": 0, "duplicates_in_file": 0}
+    assert tag_deltas == {'Action': 3, 'Indie': 3, 'RPG': 3}
+    assert store.tag_counts() == {'Action': 3, 'Indie': 3, 'RPG': 3}
+    assert store.dataset_version()['rows_changed'] == version['rows_changed'] + 6
+
+
+def test_reupload_is_unchanged_and_keeps_version(store):
+    upload(store, catalog(6))
+    version = store.dataset_version()
+
+    summary, tag_deltas = upload(store, catalog(6))
+    assert summary == {"inserted": 0, "updated": 0, "unchanged": 6, "duplicates_in_file": 0}
+    assert not +tag_deltas and not -tag_deltas
+    assert store.dataset_version() == version
+    assert store.fetch_games()[1] == 6
+
+
+def test_changed_rows_are_updated_in_place(store):
+    upload(store, catalog(6))
+    ids_before = {name: row['id'] for name, row in games_by_name(store).items()}
+    version = store.dataset_version()
+
+    rows = catalog(6)
+    rows[1]['price'] = 99.0
+    rows[2]['tags'] = 'Puzzle'
+    rows.append(game_row('Game Baru'))
+    summary, tag_deltas = upload(store, rows)
+    assert summary == {"inserted": 1, "updated": 2, "unchanged": 4, "duplicates_in_file": 0}
+
+    games = games_by_name(store)
+    assert {name: games[name]['id'] for name in ids_before} == ids_before
+    assert games['Game 1']['price'] == 99.0
+    assert games['Game Baru']['id'] > max(ids_before.values())
+    # Game 1: tag dihapus lalu ditulis ulang (net 0); Game 2: RPG -> Puzzle; Game Baru: +Action, +Indie
+    assert +tag_deltas == {'Action': 1, 'Indie': 1, 'Puzzle': 1}
+    assert -tag_deltas == {'RPG': 1}
+    assert store.tag_counts() == {'Action': 4, 'Indie': 4, 'RPG': 2, 'Puzzle': 1}
+
+    new_version = store.dataset_version()
+    assert new_version['rows_changed'] == version['rows_changed'] + 3
+    assert new_version['rewrite_version'] > version['rewrite_version']
+
+
+def test_insert_only_upload_is_append_only(store):
+    upload(store, catalog(3))
+    version = store.dataset_version()
+
+    summary, _ = upload(store, catalog(5))
+    assert summary == {"inserted": 2, "updated": 0, "unchanged": 3, "duplicates_in_file": 0}
+    assert store.dataset_version()['rewrite_version'] == version['rewrite_version']
+
+
+def test_duplicates_in_file_last_row_wins(store):
+    rows = [game_row('Game A', price=1.0), game_row('Game B'), game_row('Game A', price=3.0)]
+    summary, _ = upload(store, rows)
+    assert summary == {"inserted": 2, "updated": 0, "unchanged": 0, "duplicates_in_file": 1}
+    assert games_by_name(store)['Game A']['price'] == 3.0
+
+
+def test_natural_key_ignores_case_and_whitespace(store):
+    upload(store, [game_row('Game A'), game_row('Game B', release_date='2020-01-01')])
+
+    summary, _ = upload(store, [
+        game_row('  game a '),                              # nama sama setelah trim + lowercase
+        game_row('Game B', release_date='2021-06-01'),      # tanggal rilis beda: game lain
+    ])
+    assert summary == {"inserted": 1, "updated": 1, "unchanged": 0, "duplicates_in_file": 0}
+    assert sorted(row['name'] for row in all_games(store)) == ['  game a ', 'Game B', 'Game B']
+
+
+def test_append_mode_keeps_duplicates(store):
+    upload(store, catalog(3))
+    _, summary, _ = store.save_chunks([game_frame(catalog(3))], dedup='append')
+    assert summary["inserted"] == 3
+    assert store.fetch_games()[1] == 6
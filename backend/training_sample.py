@@ -0,0 +1,116 @@
+# training_sample.py
+
+# Sampel terstratifikasi (per review_type) untuk pelatihan model dengan batas jumlah baris.
+# Sampling dilakukan di MySQL dengan satu scan Bernoulli (RAND(seed) < p per strata), jadi
+# memori aplikasi dibatasi oleh row budget, bukan ukuran katalog.
+
+import numpy as np
+from dashboard_stats import analysis_filter
+from data_processor.analyzer import REVIEW_SCORE_MAP
+from typed_frame import fetch_typed_frame
+
+# Minimal baris per strata agar train_test_split(stratify=...) tetap bisa dipakai
+MIN_PER_STRATUM = 2
+
+# Oversampling probabilitas Bernoulli agar kuota strata hampir selalu terpenuhi;
+# kelebihannya dipangkas di aplikasi
+OVERSAMPLE_FACTOR = 1.1
+
+
+def allocate_strata(counts, budget, min_per_stratum=MIN_PER_STRATUM):
+    """
+    Alokasi proporsional kuota per strata: {review_type: kuota}, total <= budget
+    (kecuali minimal per strata membuatnya sedikit lebih besar). Sisa pembulatan dibagi
+    ke strata dengan pecahan terbesar (largest remainder).
+    """
+    total = sum(counts.values())
+    if total <= budget:
+        return dict(counts)
+
+    exact = {stratum: budget * count / total for stratum, count in counts.items()}
+    quotas = {stratum: int(value) for stratum, value in exact.items()}
+    remainder = budget - sum(quotas.values())
+    for stratum in sorted(exact, key=lambda s: exact[s] - quotas[s], reverse=True)[:remainder]:
+        quotas[stratum] += 1
+    return {
+        stratum: min(counts[stratum], max(quota, min_per_stratum))
+        for stratum, quota in quotas.items()
+    }
+
+
+def fetch_stratified_sample(cursor, fields, counts, budget, seed=42):
+    """
+    Mengambil sampel terstratifikasi dari tabel games ke DataFrame bertipe ringkas (cursor
+    tuple biasa). `counts` adalah jumlah baris analisis per review_type (tabel
+    review_type_counts). Mengembalikan (DataFrame, info sampling).
+    """
+    quotas = allocate_strata(counts, budget)
+    where, where_params = analysis_filter()
+
+    probability_cases = ' '.join(['WHEN %s THEN %s'] * len(quotas))
+    probability_params = []
+    for stratum, quota in quotas.items():
+        probability_params.extend([stratum, min(1.0, quota * OVERSAMPLE_FACTOR / counts[stratum])])
+
+    df = fetch_typed_frame(
+        cursor,
+        f"SELECT {fields} FROM games WHERE {where} "
+        f"AND RAND(%s) < (CASE review_type {probability_cases} ELSE 0 END)",
+        where_params + [seed] + probability_params
+    )
+    # Pangkas kelebihan Bernoulli ke kuota tiap strata
+    return _trim_to_quotas(df, counts, quotas, budget, seed)
+
+
+def sample_frame(df, budget, seed=42):
+    """
+    Sampel terstratifikasi dari DataFrame yang sudah dimuat (mis. snapshot kolumnar).
+    Mengembalikan (DataFrame, info sampling), atau (df, None) jika jumlah baris analisis
+    tidak melebihi budget.
+    """
+    # Kolom review_score tersimpan dipakai jika ada (snapshot lama belum memilikinya)
+    scored = (df['review_score'].notna() if 'review_score' in df.columns
+              else df['review_type'].isin(list(REVIEW_SCORE_MAP)))
+    analysis_rows = df[df['price'].notna() & df['review_no'].notna() & scored]
+    counts = {
+        stratum: int(count)
+        for stratum, count in analysis_rows['review_type'].value_counts().items() if count > 0
+    }
+    if sum(counts.values()) <= budget:
+        return df, None
+    quotas = allocate_strata(counts, budget)
+    return _trim_to_quotas(analysis_rows, counts, quotas, budget, seed)
+
+
+def _trim_to_quotas(df, counts, quotas, budget, seed):
+    """Memilih acak (deterministik dengan seed) paling banyak `quota` baris per strata."""
+    if df.empty:
+        return df, sampling_info(counts, quotas, {}, budget)
+
+    rng = np.random.default_rng(seed)
+    keep = []
+    for stratum, positions in df.groupby('review_type', observed=True).indices.items():
+        quota = quotas.get(stratum, 0)
+        keep.append(positions if len(positions) <= quota else rng.choice(positions, quota, replace=False))
+    df = df.iloc[np.sort(np.concatenate(keep))].reset_index(drop=True)
+
+    sampled = df['review_type'].value_counts().to_dict()
+    return df, sampling_info(counts, quotas, sampled, budget)
+
+
+def sampling_info(counts, quotas, sampled, budget):
+    """Ringkasan sampling untuk metadata model."""
+    return {
+        "row_budget": budget,
+        "population_rows": int(sum(counts.values())),
+        "sample_rows": int(sum(sampled.values())),
+        "strata": {
+            stratum: {
+                "population": int(counts[stratum]),
+                "quota": int(quotas.get(stratum, 0)),
+                "sampled": int(sampled.get(stratum, 0)),
+            }
+            for stratum in counts
+        },
+    }
+
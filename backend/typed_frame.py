@@ -0,0 +1,105 @@
+# typed_frame.py
+
+# Membangun DataFrame bertipe ringkas langsung dari tuple hasil cursor MySQL (tanpa dict
+# per baris): numerik float32/Int32, review_type categorical, release_date datetime, dan
+# teks sebagai dtype string. Data diambil per batch (fetchmany) dan langsung dikonversi,
+# sehingga objek Python per sel hanya hidup selama satu batch.
+
+import numpy as np
+import pandas as pd
+
+# Ukuran batch fetchmany
+FETCH_BATCH_SIZE = 50000
+
+# Tipe kolom games pada DataFrame hasil fetch_typed_frame
+COLUMN_DTYPES = {
+    'id': 'int32',
+    'name': 'string',
+    'price': 'float32',
+    'release_date': 'datetime64[s]',
+    'review_no': 'Int32',          # nullable: review_no boleh NULL
+    'review_type': 'category',
+    'tags': 'string',
+    'description': 'string',
+    # Kolom turunan (derived_columns.py)
+    'review_score': 'float32',
+    'release_year': 'Int32',
+}
+
+
+def _convert_batch(values, dtype):
+    """Konversi satu kolom batch (tuple nilai Python) ke array bertipe."""
+    if dtype == 'category':
+        return np.array(values, dtype=object)
+    if dtype == 'float32':
+        return np.fromiter(
+            (np.nan if v is None else float(v) for v in values), dtype=np.float32, count=len(values)
+        )
+    if dtype == 'int32':
+        return np.fromiter(values, dtype=np.int32, count=len(values))
+    if dtype == 'Int32':
+        mask = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+        data = np.fromiter((0 if v is None else int(v) for v in values), dtype=np.int32, count=len(values))
+        return pd.arrays.IntegerArray(data, mask)
+    if dtype.startswith('datetime64'):
+        return pd.to_datetime(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=dtype)
+    return pd.array(values, dtype=dtype)
+
+
+class TypedFrameBuilder:
+    """Mengumpulkan batch tuple menjadi kolom bertipe; kategori review_type digabung antar batch."""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.dtypes = [COLUMN_DTYPES.get(col, 'object') for col in self.columns]
+        self._parts = {col: [] for col in self.columns}
+        self._categories = {col: {} for col, dtype in zip(self.columns, self.dtypes) if dtype == 'category'}
+
+    def _category_codes(self, column, values):
+        # Kode kategori stabil lintas batch: kategori baru ditambahkan di akhir
+        categories = self._categories[column]
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        mapping = np.array([categories.setdefault(u, len(categories)) for u in uniques] + [-1], dtype=np.int32)
+        return mapping[codes]
+
+    def append(self, rows):
+        if not rows:
+            return
+        for col, dtype, values in zip(self.columns, self.dtypes, zip(*rows)):
+            if dtype == 'category':
+                self._parts[col].append(self._category_codes(col, _convert_batch(values, dtype)))
+            elif dtype == 'object':
+                self._parts[col].append(np.array(values, dtype=object))
+            else:
+                self._parts[col].append(_convert_batch(values, dtype))
+
+    def build(self):
+        data = {}
+        for col, dtype in zip(self.columns, self.dtypes):
+            parts = self._parts[col]
+            if dtype == 'category':
+                codes = np.concatenate(parts) if parts else np.array([], dtype=np.int32)
+                categories = list(self._categories[col])
+                data[col] = pd.Categorical.from_codes(codes, categories=categories)
+            elif not parts:
+                data[col] = pd.Series([], dtype=dtype)
+            elif isinstance(parts[0], np.ndarray):
+                data[col] = np.concatenate(parts)
+            else:
+                data[col] = pd.concat([pd.Series(part) for part in parts], ignore_index=True)
+        return pd.DataFrame(data, columns=self.columns)
+
+
+def fetch_typed_frame(cursor, query, params=None, batch_size=FETCH_BATCH_SIZE):
+    """
+    Menjalankan query pada cursor biasa (tuple, bukan dictionary) dan membangun DataFrame
+    bertipe ringkas sesuai COLUMN_DTYPES dari nama kolom hasil query.
+    """
+    cursor.execute(query, params or ())
+    builder = TypedFrameBuilder(desc[0] for desc in cursor.description)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        builder.append(rows)
+    return builder.build()
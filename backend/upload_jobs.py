@@ -0,0 +1,185 @@
+# upload_jobs.py
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Status job upload
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_COMPLETED = 'completed'
+STATUS_FAILED = 'failed'
+STATUS_CANCELLED = 'cancelled'
+FINAL_STATUSES = {STATUS_COMPLETED, STATUS_FAILED, STATUS_CANCELLED}
+
+
+class JobCancelled(Exception):
+    """Dilempar di dalam job saat pembatalan diminta, agar transaksi di-rollback."""
+
+
+class UploadJob:
+    """State dan progres satu upload dataset yang berjalan di background."""
+
+    def __init__(self, filename):
+        self.id = uuid.uuid4().hex
+        self.filename = filename
+        self.status = STATUS_QUEUED
+        self.message = "Menunggu giliran diproses."
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        # Diisi oleh parser (rows_read, rows_valid, rows_dropped, chunks, bad_lines, fallback_blocks)
+        self.parse_stats = {}
+        self.rows_inserted = 0
+        self.result = None
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+        self._lock = threading.Lock()
+        self._future = None
+
+    # --- Dipanggil dari thread worker ---
+
+    def mark_running(self):
+        with self._lock:
+            self.status = STATUS_RUNNING
+            self.started_at = time.time()
+            self.message = "Sedang memproses dataset."
+
+    def add_inserted(self, count):
+        """Callback progres per chunk; sekaligus titik pemeriksaan pembatalan."""
+        with self._lock:
+            self.rows_inserted += count
+        self.check_cancelled()
+
+    def check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise JobCancelled("Upload dibatalkan oleh pengguna.")
+
+    def iter_chunks(self, chunks):
+        """Meneruskan iterator chunk; pembatalan diperiksa sebelum setiap chunk di-parse."""
+        iterator = iter(chunks)
+        while True:
+            self.check_cancelled()
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                return
+            yield chunk
+
+    def finish(self, status, message, result=None):
+        with self._lock:
+            self.status = status
+            self.message = message
+            self.result = result
+            self.finished_at = time.time()
+            if status != STATUS_COMPLETED:
+                # Semua chunk berada dalam satu transaksi yang di-rollback
+                self.rows_inserted = 0
+        self._done_event.set()
+
+    # --- Dipanggil dari request HTTP ---
+
+    def cancel(self):
+        """Meminta pembatalan. Job yang masih antre langsung dibatalkan."""
+        self._cancel_event.set()
+        if self._future is not None and self._future.cancel():
+            self.finish(STATUS_CANCELLED, "Upload dibatalkan sebelum diproses.")
+        return self.status
+
+    def wait(self, timeout=None):
+        """
+        Menunggu sampai job berakhir dengan status apa pun, termasuk dibatalkan saat masih
+        antre (future.exception() akan melempar CancelledError). True jika job sudah berakhir.
+        """
+        return self._done_event.wait(timeout)
+
+    def to_dict(self):
+        with self._lock:
+            end = self.finished_at or time.time()
+            elapsed = (end - self.started_at) if self.started_at else 0.0
+            rows_parsed = self.parse_stats.get("rows_read", 0)
+            return {
+                "job_id": self.id,
+                "filename": self.filename,
+                "status": self.status,
+                "message": self.message,
+                "cancel_requested": self._cancel_event.is_set(),
+                "rows_parsed": rows_parsed,
+                "rows_inserted": self.rows_inserted,
+                "rows_dropped": self.parse_stats.get("rows_dropped", 0),
+                "chunks": self.parse_stats.get("chunks", 0),
+                "bad_lines": self.parse_stats.get("bad_lines", 0),
+                "elapsed_seconds": round(elapsed, 3),
+                "rows_per_second": round(rows_parsed / elapsed, 1) if elapsed > 0 else 0.0,
+                "created_at": self.created_at,
+                "finished_at": self.finished_at,
+                "result": self.result,
+            }
+
+
+class UploadJobManager:
+    """Menjalankan job upload di thread pool dan menyimpan riwayat job terakhir."""
+
+    def __init__(self, max_workers=2, max_history=50):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='upload-job')
+        self._jobs = OrderedDict()
+        self._max_history = max_history
+        self._lock = threading.Lock()
+
+    def submit(self, filename, target, parse_stats=None, cleanup=None):
+        """
+        Mendaftarkan job baru. `target(job)` dijalankan di background dan harus
+        mengembalikan (status, message, result). `parse_stats` adalah dict statistik
+        yang diperbarui parser selama streaming; `cleanup()` selalu dipanggil setelah
+        job berakhir (termasuk jika dibatalkan sebelum sempat berjalan).
+        """
+        job = UploadJob(filename)
+        if parse_stats is not None:
+            job.parse_stats = parse_stats
+
+        def run():
+            try:
+                if job._cancel_event.is_set():
+                    job.finish(STATUS_CANCELLED, "Upload dibatalkan sebelum diproses.")
+                    return
+                job.mark_running()
+                try:
+                    status, message, result = target(job)
+                except JobCancelled as e:
+                    status, message, result = STATUS_CANCELLED, str(e), None
+                except Exception as e:
+                    print(f"Error during upload job {job.id}: {e}")
+                    status, message, result = STATUS_FAILED, f"Upload gagal: {e}", None
+                job.finish(status, message, result)
+            finally:
+                if cleanup:
+                    cleanup()
+
+        def on_done(future):
+            # Future yang dibatalkan saat masih antre tidak pernah menjalankan run()
+            if future.cancelled() and cleanup:
+                cleanup()
+
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        job._future = self._executor.submit(run)
+        job._future.add_done_callback(on_done)
+        return job
+
+    def _prune(self):
+        """Membuang job selesai yang paling lama jika riwayat melebihi batas."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in FINAL_STATUSES]
+        while len(self._jobs) > self._max_history and finished:
+            del self._jobs[finished.pop(0)]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job.to_dict() for job in reversed(jobs)]
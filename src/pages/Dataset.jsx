@@ -1,14 +1,20 @@
 // fachrisi/veritas/Veritas-d06486815343be9adc846227d91b86cd0ab5adef/src/pages/Dataset.jsx
 
-import { useState } from 'react';
+import { useState, useRef, useEffect } from 'react';
 import './Dataset.css';
 
 const API_BASE_URL = 'http://localhost:5000'; 
+const POLL_INTERVAL_MS = 1000; // Interval polling status job upload
 
 function Dataset() {
   const [selectedFile, setSelectedFile] = useState(null);
   const [uploadStatus, setUploadStatus] = useState('');
   const [isUploading, setIsUploading] = useState(false);
+  const [uploadJobId, setUploadJobId] = useState(null);
+  const pollTimerRef = useRef(null);
+
+  // Hentikan polling saat halaman ditinggalkan
+  useEffect(() => () => clearTimeout(pollTimerRef.current), []);
 
   // Daftar format yang didukung sesuai dokumen (CSV/XLSX)
   const supportedFormats = ['text/csv', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'application/vnd.ms-excel'];
@@ -55,6 +61,13 @@ function Dataset() {
 
         const result = await response.json();
 
+        if (response.status === 202) {
+            // Upload diproses di background: polling status job sampai selesai
+            setUploadJobId(result.job_id);
+            pollUploadJob(result.job_id);
+            return;
+        }
+
         if (response.ok) {
             setUploadStatus(`🎉 Berhasil! ${result.message} Data berhasil disimpan: ${result.total_records} record.`);
             setSelectedFile(null); 
@@ -62,15 +75,67 @@ function Dataset() {
         } else {
             setUploadStatus(`❌ Gagal memproses file. Pesan Error: ${result.message || 'Terjadi kesalahan server.'}`);
         }
+        setIsUploading(false);
 
     } catch (error) {
         console.error('Upload Error:', error);
         setUploadStatus('❌ Gagal terhubung ke server atau terjadi error jaringan. Pastikan backend (Flask) berjalan di ' + API_BASE_URL);
-    } finally {
         setIsUploading(false);
     }
   };
 
+  const finishUploadJob = () => {
+    setUploadJobId(null);
+    setIsUploading(false);
+  };
+
+  const pollUploadJob = async (jobId) => {
+    try {
+        const response = await fetch(`${API_BASE_URL}/api/upload-jobs/${jobId}`);
+        const job = await response.json();
+
+        if (!response.ok) {
+            setUploadStatus(`❌ Gagal membaca status upload. Pesan Error: ${job.message || 'Terjadi kesalahan server.'}`);
+            finishUploadJob();
+            return;
+        }
+
+        if (job.status === 'completed') {
+            setUploadStatus(`🎉 Berhasil! ${job.message} Data berhasil disimpan: ${job.rows_inserted} record (${job.rows_dropped} baris tidak valid dibuang).`);
+            setSelectedFile(null);
+            document.getElementById('datasetFile').value = '';
+            finishUploadJob();
+        } else if (job.status === 'failed') {
+            setUploadStatus(`❌ Gagal memproses file. Pesan Error: ${job.message}`);
+            finishUploadJob();
+        } else if (job.status === 'cancelled') {
+            setUploadStatus(`⚠️ ${job.message}`);
+            finishUploadJob();
+        } else {
+            setUploadStatus(
+              `⏳ Memproses ${job.filename}: ${job.rows_parsed.toLocaleString()} baris dibaca, ` +
+              `${job.rows_inserted.toLocaleString()} disimpan, ${job.rows_dropped.toLocaleString()} dibuang ` +
+              `(${Math.round(job.rows_per_second).toLocaleString()} baris/detik)...`
+            );
+            pollTimerRef.current = setTimeout(() => pollUploadJob(jobId), POLL_INTERVAL_MS);
+        }
+    } catch (error) {
+        console.error('Polling Error:', error);
+        setUploadStatus('❌ Gagal terhubung ke server saat memantau progres upload. Pastikan backend berjalan.');
+        finishUploadJob();
+    }
+  };
+
+  const handleCancelUpload = async () => {
+    if (!uploadJobId) return;
+    try {
+        await fetch(`${API_BASE_URL}/api/upload-jobs/${uploadJobId}/cancel`, { method: 'POST' });
+        setUploadStatus('⏳ Membatalkan upload...');
+    } catch (error) {
+        console.error('Cancel Error:', error);
+    }
+  };
+
   // NEW FUNCTION: Handle Clear Database
   const handleClearDatabase = async () => {
     // 1. Popup Warning
@@ -148,6 +213,12 @@ function Dataset() {
           >
             {isUploading ? 'Memproses Data...' : '⬆️ Unggah dan Proses Data'}
           </button>
+
+          {uploadJobId && (
+            <button className="btn-danger" onClick={handleCancelUpload}>
+              ✖ Batalkan Upload
+            </button>
+          )}
         </div>
         
         {/* Status Upload */}